@@ -2,6 +2,7 @@ __version__ = "4.6.3"
 
 import os
 import sys
+from typing import Callable, Union
 from tkinter.constants import *
 from tkinter import StringVar, IntVar, DoubleVar, BooleanVar
 
@@ -12,6 +13,9 @@ from .theme_manager import ThemeManager
 from .scaling_tracker import ScalingTracker
 from .font_manager import FontManager
 from .draw_engine import DrawEngine
+from .drawing_method_calibrator import DrawingMethodCalibrator
+from .redraw_scheduler import RedrawScheduler
+from .bg_color_dispatcher import BgColorDispatcher
 
 AppearanceModeTracker.init_appearance_mode()
 
@@ -40,7 +44,8 @@ FontManager.load_font(os.path.join(script_directory, "assets", "fonts", "Roboto"
 FontManager.load_font(os.path.join(script_directory, "assets", "fonts", "Roboto", "Roboto-Medium.ttf"))
 
 # load font necessary for rendering the widgets (used on Windows/Linux)
-if FontManager.load_font(os.path.join(script_directory, "assets", "fonts", "CustomTkinter_shapes_font.otf")) is False:
+DrawEngine.shapes_font_available = FontManager.load_font(os.path.join(script_directory, "assets", "fonts", "CustomTkinter_shapes_font.otf"))
+if DrawEngine.shapes_font_available is False:
     # change draw method if font loading failed
     if DrawEngine.preferred_drawing_method == "font_shapes":
         sys.stderr.write("customtkinter.__init__ warning: " +
@@ -65,15 +70,23 @@ from .widgets.ctk_combobox import CTkComboBox
 from .widgets.ctk_scrollbar import CTkScrollbar
 from .widgets.ctk_textbox import CTkTextbox
 
+# import lightweight widgets
+from .widgets.ctk_lightweight_canvas import CTkLightweightCanvas
+from .widgets.ctk_lightweight_button import CTkLightweightButton
+from .widgets.ctk_lightweight_label import CTkLightweightLabel
+from .widgets.ctk_lightweight_checkbox import CTkLightweightCheckBox
+from .widgets.ctk_lightweight_progressbar import CTkLightweightProgressBar
+
 # import windows
 from .windows.ctk_tk import CTk
 from .windows.ctk_toplevel import CTkToplevel
 from .windows.ctk_input_dialog import CTkInputDialog
 
 
-def set_appearance_mode(mode_string: str):
-    """ possible values: light, dark, system """
-    AppearanceModeTracker.set_appearance_mode(mode_string)
+def set_appearance_mode(mode_string: str, incremental: bool = None, on_complete: Callable = None):
+    """ possible values: light, dark, system, with incremental=True visible widgets get updated first
+        and the rest in time slices, on_complete gets called when all widgets are updated """
+    AppearanceModeTracker.set_appearance_mode(mode_string, incremental=incremental, on_complete=on_complete)
 
 
 def get_appearance_mode() -> str:
@@ -104,6 +117,31 @@ def set_window_scaling(scaling_value: float):
     ScalingTracker.set_window_scaling(scaling_value)
 
 
+def set_window_dpi_scaling(window, dpi_scaling: float):
+    """ set the DPI scaling factor of a window, to feed in DPI changes on platforms without automatic detection """
+    ScalingTracker.set_window_dpi_scaling(window, dpi_scaling)
+
+
+def batch():
+    """ context manager, with customtkinter.batch(): all redraws caused by configure() calls
+        inside the with block get merged into one draw per widget at the end of the block """
+    return RedrawScheduler.batch()
+
+
+def set_max_redraw_rate(frames_per_second: Union[int, float, None]):
+    """ limit how often the scheduled widget redraws (after resizing and configure calls) get executed per second,
+        None executes them at every idle """
+    if frames_per_second is not None and frames_per_second <= 0:
+        raise ValueError(f"frames_per_second must be greater than 0 or None, got {frames_per_second}")
+    RedrawScheduler.max_frame_rate = frames_per_second
+
+
+def activate_drawing_method_calibration():
+    """ use the fastest drawing method ('font_shapes' or 'polygon_shapes') on this setup, it gets timed once after
+        the first frame and cached in ~/.customtkinter/drawing_method_cache.json, and is used from the next start on """
+    DrawingMethodCalibrator.enabled = True
+
+
 def deactivate_automatic_dpi_awareness():
     """ deactivate DPI awareness of current process (windll.shcore.SetProcessDpiAwareness(0)) """
     ScalingTracker.deactivate_automatic_dpi_awareness = False
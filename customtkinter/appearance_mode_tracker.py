@@ -1,7 +1,15 @@
+import os
 import sys
+import time
+import atexit
+import signal
 import tkinter
+import threading
+import subprocess
+import weakref
 from distutils.version import StrictVersion as Version
-from typing import Callable
+from collections import deque
+from typing import Callable, Union
 
 try:
     import darkdetect
@@ -18,10 +26,32 @@ except Exception:
 
 class AppearanceModeTracker:
 
-    callback_list = []
+    # bound methods are stored as weakref.WeakMethod, so widgets that are never destroyed don't get kept alive,
+    # keys and values are the same, the dict gives O(1) removal and keeps the order of registration
+    callback_dict = {}
     app_list = []
     update_loop_running = False
-    update_loop_interval = 500  # milliseconds
+    update_loop_app = None  # app with the pending .after() call of the update loop
+    update_loop_after_id = None
+    update_loop_interval = 500  # milliseconds, polling interval after a change
+    max_update_loop_interval = 8000  # milliseconds, polling interval backs off up to this while nothing changes
+    current_update_loop_interval = 500
+
+    # system appearance detection: "auto" (listener process if available, polling otherwise), "polling" or "none"
+    detection_method = "auto"
+    listener_command: tuple = None  # command of a process which prints "Dark" or "Light" on every change, None for darkdetect.listener()
+    listener_process: subprocess.Popen = None
+    listener_thread: threading.Thread = None  # reads the output of the listener process
+    listener_queue = deque()  # modes read by the listener thread, applied in the tkinter thread
+    listener_event = "<<AppearanceModeChanged>>"  # generated by the listener thread, tkinter passes it to the tcl thread
+    listener_check_interval = 30000  # milliseconds, fallback check of the queue and the listener while it runs
+
+    # incremental appearance mode changes: callbacks of visible widgets first, the rest in time slices
+    incremental_update = False  # default for changes detected from the system and set_appearance_mode()
+    incremental_update_frame_budget = 12  # milliseconds per time slice
+    update_queue = deque()  # callback keys which still need to be called with the current mode
+    update_slice_scheduled = False
+    update_complete_callbacks = []
 
     appearance_mode_set_by = "system"
     appearance_mode = 0  # Light (standard)
@@ -35,25 +65,51 @@ class AppearanceModeTracker:
                 cls.appearance_mode = new_appearance_mode
                 cls.update_callbacks()
 
+    @classmethod
+    def make_callback_key(cls, callback: Callable, on_dead_callback: Callable = None):
+        if hasattr(callback, "__self__") and hasattr(callback, "__func__"):
+            return weakref.WeakMethod(callback, on_dead_callback)
+        else:
+            return callback  # functions and other callables are stored directly
+
+    @classmethod
+    def remove_dead_callback(cls, callback_key: weakref.WeakMethod):
+        cls.callback_dict.pop(callback_key, None)
+
+    @classmethod
+    def get_callback_count(cls) -> int:
+        """ number of registered callbacks, for monitoring """
+        return len(cls.callback_dict)
+
     @classmethod
     def add(cls, callback: Callable, widget=None):
-        cls.callback_list.append(callback)
+        callback_key = cls.make_callback_key(callback, cls.remove_dead_callback)
+        cls.callback_dict[callback_key] = callback_key
 
         if widget is not None:
             app = cls.get_tk_root_of_widget(widget)
             if app not in cls.app_list:
                 cls.app_list.append(app)
+                app.bind("<Destroy>", lambda event: cls.remove_app(app) if event.widget is app else None, add="+")
+                app.bind(cls.listener_event, lambda event: cls.apply_listener_changes(), add="+")
+                cls.start_detection()
 
-                if not cls.update_loop_running:
-                    app.after(cls.update_loop_interval, cls.update)
-                    cls.update_loop_running = True
+    @classmethod
+    def remove_app(cls, app):
+        """ called when app gets destroyed, the detection stops with the last app """
+
+        if app in cls.app_list:
+            cls.app_list.remove(app)
+
+        if len(cls.app_list) == 0:
+            cls.stop_detection()
+        elif app is cls.update_loop_app:
+            cls.update_loop_running = False  # the pending .after() call got deleted with the app
+            cls.start_update_loop()
 
     @classmethod
     def remove(cls, callback: Callable):
-        try:
-            cls.callback_list.remove(callback)
-        except ValueError:
-            return
+        cls.callback_dict.pop(cls.make_callback_key(callback), None)
 
     @staticmethod
     def detect_appearance_mode() -> int:
@@ -65,71 +121,351 @@ class AppearanceModeTracker:
         except NameError:
             return 0  # Light
 
+    @classmethod
+    def get_listener_command(cls) -> Union[tuple, None]:
+        if cls.listener_command is not None:
+            return cls.listener_command
+
+        if getattr(sys, "frozen", False):
+            return None  # sys.executable is the frozen application and no python interpreter
+
+        try:
+            if getattr(darkdetect, "listener", None) is None:  # darkdetect >= 0.6.0
+                return None
+        except NameError:
+            return None
+
+        # darkdetect.listener() blocks and can't be stopped from another thread, so it runs in its own python process,
+        # which gets terminated when the detection stops. There is only one per application process (not per window),
+        # and it sleeps in the system notification API, while polling wakes up the tkinter loop every 0.5 to 8 seconds
+        # and spawns a gsettings process on every check on Linux. Set detection_method to "polling" to avoid it.
+        return (sys.executable, "-c", "import darkdetect; darkdetect.listener(lambda theme: print(theme, flush=True))")
+
+    @classmethod
+    def start_detection(cls):
+        """ starts the listener process or the polling, if the appearance mode follows the system """
+
+        if cls.appearance_mode_set_by != "system" or cls.detection_method == "none" or len(cls.app_list) == 0:
+            return
+
+        if cls.detection_method == "auto" and cls.listener_thread is None:
+            listener_command = cls.get_listener_command()
+
+            if listener_command is not None:
+                try:
+                    if sys.platform.startswith("win"):
+                        cls.listener_process = subprocess.Popen(listener_command, stdout=subprocess.PIPE, stdin=subprocess.DEVNULL,
+                                                                stderr=subprocess.DEVNULL, universal_newlines=True,
+                                                                creationflags=subprocess.CREATE_NO_WINDOW)
+                    else:
+                        # own process group, so that child processes of the listener (gsettings) get terminated too
+                        cls.listener_process = subprocess.Popen(listener_command, stdout=subprocess.PIPE, stdin=subprocess.DEVNULL,
+                                                                stderr=subprocess.DEVNULL, universal_newlines=True, start_new_session=True)
+                except OSError:
+                    cls.listener_process = None
+
+                if cls.listener_process is not None:
+                    cls.listener_thread = threading.Thread(target=cls.run_listener, args=(cls.listener_process,),
+                                                           name="ctk_appearance_mode_listener", daemon=True)
+                    cls.listener_thread.start()
+
+        cls.start_update_loop()
+
+    @classmethod
+    def stop_detection(cls):
+        """ terminates the listener process, the update loop stops itself with its next call """
+
+        listener_process, cls.listener_process, cls.listener_thread = cls.listener_process, None, None
+        cls.listener_queue.clear()
+
+        if listener_process is not None and listener_process.poll() is None:
+            try:
+                if sys.platform.startswith("win"):
+                    listener_process.terminate()
+                else:
+                    os.killpg(listener_process.pid, signal.SIGTERM)
+            except OSError:
+                pass  # process already ended
+
+    @classmethod
+    def run_listener(cls, listener_process: subprocess.Popen):
+        """ runs in the listener thread until the process ends, the modes get queued and the
+            tkinter thread gets notified with a virtual event """
+
+        try:
+            for line in listener_process.stdout:
+                cls.listener_queue.append(1 if line.strip().lower() == "dark" else 0)
+                cls.notify_tk_loop()
+        except (OSError, ValueError):
+            pass  # stdout closed
+        finally:
+            listener_process.stdout.close()
+            listener_process.wait()
+
+        cls.notify_tk_loop()  # listener ended -> fall back to polling
+
+    @classmethod
+    def notify_tk_loop(cls):
+        """ called from the listener thread, event_generate() is passed to the tcl thread by tkinter,
+            destroyed apps raise a TclError, and if it fails for all apps the fallback check applies the queue """
+
+        for app in list(cls.app_list):
+            try:
+                app.event_generate(cls.listener_event, when="tail")
+                return
+            except (tkinter.TclError, RuntimeError):  # RuntimeError: tcl thread not in mainloop
+                continue
+
+    @classmethod
+    def apply_listener_changes(cls):
+        """ called in the tkinter thread, applies the changes found by the listener """
+
+        while len(cls.listener_queue) > 0:
+            cls.set_system_appearance_mode(cls.listener_queue.popleft())
+
+        if cls.listener_thread is not None and not cls.listener_thread.is_alive():
+            cls.stop_detection()  # listener not supported on this system -> fall back to polling
+            cls.cancel_update_loop()
+            cls.start_update_loop()
+
+    @classmethod
+    def set_system_appearance_mode(cls, new_appearance_mode: int):
+        if cls.appearance_mode_set_by == "system" and new_appearance_mode != cls.appearance_mode:
+            cls.appearance_mode = new_appearance_mode
+            cls.update_callbacks()
+
+    @classmethod
+    def start_update_loop(cls):
+        if cls.update_loop_running:
+            return
+
+        cls.current_update_loop_interval = cls.update_loop_interval
+        cls.schedule_update()
+
+    @classmethod
+    def schedule_update(cls):
+        # while the listener runs, the changes are applied by apply_listener_changes() and this is only a fallback check
+        interval = cls.listener_check_interval if cls.listener_thread is not None else cls.current_update_loop_interval
+
+        # find an existing tkinter.Tk object for the call of .after()
+        for app in cls.app_list:
+            try:
+                cls.update_loop_after_id = app.after(interval, cls.update)
+                cls.update_loop_running = True
+                cls.update_loop_app = app
+                return
+            except tkinter.TclError:
+                continue
+
+        cls.update_loop_running = False
+        cls.update_loop_app = None
+
+    @classmethod
+    def cancel_update_loop(cls):
+        if cls.update_loop_running:
+            try:
+                cls.update_loop_app.after_cancel(cls.update_loop_after_id)
+            except tkinter.TclError:
+                pass  # app already destroyed
+            cls.update_loop_running = False
+            cls.update_loop_app = None
+
     @classmethod
     def get_tk_root_of_widget(cls, widget):
+        """ the tk root gets cached on the widget and its masters, so children inherit it from their master in O(1),
+            the cache never gets stale, because the master of a tkinter widget can't be changed """
+
         current_widget = widget
+        walked_widgets = []
 
         while isinstance(current_widget, tkinter.Tk) is False:
+            tk_root = current_widget.__dict__.get("_ctk_tk_root")
+            if tk_root is not None:
+                break
+            walked_widgets.append(current_widget)
             current_widget = current_widget.master
+        else:
+            tk_root = current_widget
 
-        return current_widget
+        for walked_widget in walked_widgets:
+            walked_widget._ctk_tk_root = tk_root
+        return tk_root
 
     @classmethod
-    def update_callbacks(cls):
-        if cls.appearance_mode == 0:
-            for callback in cls.callback_list:
-                try:
-                    callback("Light")
-                except Exception:
-                    continue
+    def resolve_callback_key(cls, callback_key) -> Callable:
+        return callback_key() if isinstance(callback_key, weakref.WeakMethod) else callback_key
 
-        elif cls.appearance_mode == 1:
-            for callback in cls.callback_list:
-                try:
-                    callback("Dark")
-                except Exception:
-                    continue
+    @classmethod
+    def call_callback(cls, callback_key):
+        callback = cls.resolve_callback_key(callback_key)
+        if callback is None:
+            return  # widget is garbage collected, entry gets removed by the weakref callback
+
+        try:
+            callback("Dark" if cls.appearance_mode == 1 else "Light")
+        except Exception:
+            pass
+
+    @classmethod
+    def update_callbacks(cls, incremental: bool = None):
+        if incremental is None:
+            incremental = cls.incremental_update
+
+        if incremental and len(cls.app_list) > 0:
+            cls.start_incremental_update()
+            return
+
+        cls.update_queue.clear()  # a running incremental update is replaced
+
+        # copy, because callbacks can get removed while iterating (widgets destroyed by callbacks)
+        for callback_key in list(cls.callback_dict):
+            cls.call_callback(callback_key)
+
+        cls.call_update_complete_callbacks()
+
+    @staticmethod
+    def is_mapped(widget) -> bool:
+        """ True if the widget and all its masters are mapped, from the _mapped flags which CTk widgets and windows
+            keep up to date with <Map> and <Unmap> events, masters without the flag (tkinter widgets) count as mapped """
+
+        while widget is not None:
+            if not widget.__dict__.get("_mapped", True):
+                return False  # hidden tab, withdrawn window or scrolled away canvas window
+            widget = getattr(widget, "master", None)
+        return True
+
+    @classmethod
+    def start_incremental_update(cls):
+        """ orders the callbacks, mapped widgets first, and processes the first time slice immediately,
+            the order only uses python-side state, so there are no tk calls per widget before the first slice """
+
+        mapped_callback_keys, other_callback_keys = [], []
+
+        for callback_key in cls.callback_dict:
+            widget = getattr(cls.resolve_callback_key(callback_key), "__self__", None)
+
+            if widget is None or cls.is_mapped(widget):
+                mapped_callback_keys.append(callback_key)
+            else:
+                other_callback_keys.append(callback_key)
+
+        cls.update_queue = deque(mapped_callback_keys + other_callback_keys)  # a running incremental update is replaced
+        cls.run_update_slice()
+
+    @classmethod
+    def run_scheduled_update_slice(cls):
+        cls.update_slice_scheduled = False
+        cls.run_update_slice()
+
+    @classmethod
+    def run_update_slice(cls):
+        slice_end_time = time.perf_counter() + cls.incremental_update_frame_budget / 1000
+
+        while len(cls.update_queue) > 0:
+            callback_key = cls.update_queue.popleft()
+            if callback_key in cls.callback_dict:  # skip callbacks removed in the meantime
+                cls.call_callback(callback_key)
+
+            if time.perf_counter() >= slice_end_time:
+                break
+
+        if len(cls.update_queue) > 0:
+            if not cls.update_slice_scheduled:
+                # next slice after the pending idle tasks (redraw of the already updated widgets) are done
+                for app in cls.app_list:
+                    try:
+                        app.after_idle(app.after, 0, cls.run_scheduled_update_slice)
+                        cls.update_slice_scheduled = True
+                        return
+                    except tkinter.TclError:
+                        continue
+
+                # no existing tkinter.Tk object -> process all remaining callbacks now
+                while len(cls.update_queue) > 0:
+                    callback_key = cls.update_queue.popleft()
+                    if callback_key in cls.callback_dict:
+                        cls.call_callback(callback_key)
+            else:
+                return
+
+        cls.call_update_complete_callbacks()
+
+    @classmethod
+    def add_update_complete_callback(cls, callback: Callable):
+        """ callback gets called when all widgets have the current appearance mode,
+            immediately if no incremental update is running """
+
+        if len(cls.update_queue) > 0:
+            cls.update_complete_callbacks.append(callback)
+        else:
+            callback()
+
+    @classmethod
+    def call_update_complete_callbacks(cls):
+        update_complete_callbacks, cls.update_complete_callbacks = cls.update_complete_callbacks, []
+        for callback in update_complete_callbacks:
+            try:
+                callback()
+            except Exception:
+                continue
 
     @classmethod
     def update(cls):
-        if cls.appearance_mode_set_by == "system":
+        cls.update_loop_running = False  # the scheduled call is running now
+        cls.update_loop_app = None
+
+        # stop if the mode was set by the user or all apps got destroyed
+        if cls.appearance_mode_set_by != "system" or cls.detection_method == "none" or len(cls.app_list) == 0:
+            return
+
+        if cls.listener_thread is not None:
+            cls.apply_listener_changes()  # fallback, if the virtual event of the listener thread got lost
+            if cls.update_loop_running:
+                return  # listener ended and the polling loop got started
+        else:
             new_appearance_mode = cls.detect_appearance_mode()
 
             if new_appearance_mode != cls.appearance_mode:
                 cls.appearance_mode = new_appearance_mode
                 cls.update_callbacks()
+                cls.current_update_loop_interval = cls.update_loop_interval
+            else:
+                # back off while nothing changes, every detection can spawn a subprocess (gsettings on Linux)
+                cls.current_update_loop_interval = min(cls.current_update_loop_interval * 2, cls.max_update_loop_interval)
 
-        # find an existing tkinter.Tk object for the next call of .after()
-        for app in cls.app_list:
-            try:
-                app.after(cls.update_loop_interval, cls.update)
-                return
-            except Exception:
-                continue
-
-        cls.update_loop_running = False
+        cls.schedule_update()
 
     @classmethod
     def get_mode(cls) -> int:
         return cls.appearance_mode
 
     @classmethod
-    def set_appearance_mode(cls, mode_string: str):
+    def set_appearance_mode(cls, mode_string: str, incremental: bool = None, on_complete: Callable = None):
         if mode_string.lower() == "dark":
             cls.appearance_mode_set_by = "user"
+            cls.stop_detection()
             new_appearance_mode = 1
 
             if new_appearance_mode != cls.appearance_mode:
                 cls.appearance_mode = new_appearance_mode
-                cls.update_callbacks()
+                cls.update_callbacks(incremental)
 
         elif mode_string.lower() == "light":
             cls.appearance_mode_set_by = "user"
+            cls.stop_detection()
             new_appearance_mode = 0
 
             if new_appearance_mode != cls.appearance_mode:
                 cls.appearance_mode = new_appearance_mode
-                cls.update_callbacks()
+                cls.update_callbacks(incremental)
 
         elif mode_string.lower() == "system":
             cls.appearance_mode_set_by = "system"
+            cls.init_appearance_mode()
+            cls.start_detection()
+
+        if on_complete is not None:
+            cls.add_update_complete_callback(on_complete)
+
+
+atexit.register(AppearanceModeTracker.stop_detection)  # the listener process would outlive the application otherwise
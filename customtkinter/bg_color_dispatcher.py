@@ -0,0 +1,63 @@
+import weakref
+
+
+class BgColorDispatcher:
+    """ propagates bg color changes of a master to its CTk children, every master has one weak set of children,
+        so a bg change gets applied once per child and the registry doesn't keep the children alive """
+
+    master_children_dict = weakref.WeakKeyDictionary()  # contains master widgets as keys and weak sets of CTk children
+
+    @classmethod
+    def add_child(cls, master, child):
+        if master not in cls.master_children_dict:
+            cls.master_children_dict[master] = weakref.WeakSet()
+        cls.master_children_dict[master].add(child)
+
+    @classmethod
+    def remove_child(cls, master, child):
+        if master in cls.master_children_dict:
+            cls.master_children_dict[master].discard(child)
+
+    @classmethod
+    def get_children(cls, master) -> list:
+        return list(cls.master_children_dict.get(master, ()))
+
+    @classmethod
+    def dispatch_bg_color(cls, master, bg_color):
+        """ sets bg_color on all registered CTk children of the master """
+
+        for child in cls.get_children(master):
+            child.configure(bg_color=bg_color)
+
+    @classmethod
+    def hook_master_configure(cls, master):
+        """ overwrites the configure methods of a tkinter master (not a CTk widget) once,
+            so that bg changes of the master get dispatched to its CTk children """
+
+        if master.__dict__.get("_ctk_configure_hooked", False):
+            return
+
+        master_old_configure = master.configure
+
+        def new_configure(*args, **kwargs):
+            bg_color = None
+            if "bg" in kwargs:
+                bg_color = kwargs["bg"]
+            elif "background" in kwargs:
+                bg_color = kwargs["background"]
+
+            # args[0] is dict when attribute gets changed by widget[<attribute>] syntax
+            elif len(args) > 0 and type(args[0]) == dict:
+                if "bg" in args[0]:
+                    bg_color = args[0]["bg"]
+                elif "background" in args[0]:
+                    bg_color = args[0]["background"]
+
+            result = master_old_configure(*args, **kwargs)
+            if bg_color is not None:
+                cls.dispatch_bg_color(master, bg_color)
+            return result
+
+        master.config = new_configure
+        master.configure = new_configure
+        master._ctk_configure_hooked = True
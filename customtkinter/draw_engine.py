@@ -2,11 +2,16 @@ from __future__ import annotations
 import sys
 import math
 import tkinter
-from typing import Union, TYPE_CHECKING
+from typing import Union, Sequence, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .widgets.ctk_canvas import CTkCanvas
 
+try:
+    import numpy  # optional, only used by DrawEngine.compute_layouts() to compute many layouts in one vectorized pass
+except ImportError:
+    numpy = None
+
 
 class DrawEngine:
     """
@@ -16,7 +21,9 @@ class DrawEngine:
     limited capabilities the tkinter.Canvas offers.
 
     Functions:
+     - compute_layouts()
      - draw_rounded_rect_with_border()
+     - draw_rounded_rect_with_border_from_layout()
      - draw_rounded_rect_with_border_vertical_split()
      - draw_rounded_progress_bar_with_border()
      - draw_rounded_slider_with_border_and_button()
@@ -26,25 +33,53 @@ class DrawEngine:
 
     """
 
-    preferred_drawing_method: str = None  # 'polygon_shapes', 'font_shapes', 'circle_shapes'
+    preferred_drawing_method: str = None  # 'polygon_shapes', 'font_shapes', 'circle_shapes', 'image_shapes'
+    shapes_font_available: bool = False  # set on import, True if CustomTkinter_shapes_font could be loaded
+    use_tcl_batching: bool = False  # collect all canvas commands of one draw into one tcl script (see CTkCanvas.tcl_batch())
+    numpy_min_batch_size: int = 16  # compute_layouts() uses numpy (if installed) from this number of specs on, below it's slower than pure python
 
     def __init__(self, canvas: CTkCanvas):
         self._canvas = canvas
+        self._last_draw_signatures: dict = {}  # shape function name -> signature of its last draw on self._canvas
+
+    def reset_draw_signatures(self):
+        """ forget the signatures of all previous draws, so that the next draw call of every
+            shape function is executed completely (needed if parts on the canvas got deleted externally) """
+
+        self._last_draw_signatures.clear()
+
+    def __draw_signature_unchanged(self, shape_name: str, signature: tuple) -> bool:
+        """ returns True if the last draw of shape_name had the same signature, in which case all parts
+            are already at the correct position, otherwise the new signature gets stored """
+
+        if self._last_draw_signatures.get(shape_name) == signature:
+            return True
+        else:
+            self._last_draw_signatures[shape_name] = signature
+            return False
 
     def __calc_optimal_corner_radius(self, user_corner_radius: Union[float, int]) -> Union[float, int]:
+        return self.__optimal_corner_radius_for_method(user_corner_radius, self.preferred_drawing_method)
+
+    @staticmethod
+    def __optimal_corner_radius_for_method(user_corner_radius: Union[float, int], drawing_method: str) -> Union[float, int]:
         # optimize for drawing with polygon shapes
-        if self.preferred_drawing_method == "polygon_shapes":
+        if drawing_method == "polygon_shapes":
             if sys.platform == "darwin":
                 return user_corner_radius
             else:
                 return round(user_corner_radius)
 
         # optimize for drawing with antialiased font shapes
-        elif self.preferred_drawing_method == "font_shapes":
+        elif drawing_method == "font_shapes":
+            return round(user_corner_radius)
+
+        # pre-rendered images, rounded values give more cache hits
+        elif drawing_method == "image_shapes":
             return round(user_corner_radius)
 
         # optimize for drawing with circles and rects
-        elif self.preferred_drawing_method == "circle_shapes":
+        elif drawing_method == "circle_shapes":
             user_corner_radius = 0.5 * round(user_corner_radius / 0.5)  # round to 0.5 steps
 
             # make sure the value is always with .5 at the end for smoother corners
@@ -55,13 +90,81 @@ class DrawEngine:
             else:
                 return user_corner_radius
 
-    def draw_rounded_rect_with_border(self, width: Union[float, int], height: Union[float, int], corner_radius: Union[float, int],
-                                      border_width: Union[float, int], overwrite_preferred_drawing_method: str = None) -> bool:
-        """ Draws a rounded rectangle with a corner_radius and border_width on the canvas. The border elements have a 'border_parts' tag,
-            the main foreground elements have an 'inner_parts' tag to color the elements accordingly.
+    @staticmethod
+    def __optimal_corner_radius_for_method_numpy(user_corner_radius: numpy.ndarray, drawing_method: str) -> numpy.ndarray:
+        """ same as __optimal_corner_radius_for_method() for an array of corner radii """
+
+        if drawing_method == "polygon_shapes" and sys.platform == "darwin":
+            return user_corner_radius
+        elif drawing_method in ("polygon_shapes", "font_shapes", "image_shapes"):
+            return numpy.round(user_corner_radius)  # round half to even like python round()
+        elif drawing_method == "circle_shapes":
+            user_corner_radius = 0.5 * numpy.round(user_corner_radius / 0.5)
+            return numpy.where(user_corner_radius == 0, 0, numpy.where(user_corner_radius % 1 == 0, user_corner_radius + 0.5, user_corner_radius))
+        else:
+            return user_corner_radius
+
+    @staticmethod
+    def __rounded_rect_part_coords(drawing_method: str, width, height, corner_radius, border_width, inner_corner_radius, bottom_right_shift) -> dict:
+        """ returns dict of part tag -> coords for draw_rounded_rect_with_border(), only uses arithmetic operators,
+            so the arguments can be numbers or numpy arrays (then every coordinate is an array) """
+
+        if drawing_method == "polygon_shapes":
+            return {"border_line_1": (corner_radius, corner_radius,
+                                      width - corner_radius, corner_radius,
+                                      width - corner_radius, height - corner_radius,
+                                      corner_radius, height - corner_radius),
+                    "inner_line_1": (border_width + inner_corner_radius, border_width + inner_corner_radius,
+                                     width - (border_width + inner_corner_radius) + bottom_right_shift, border_width + inner_corner_radius,
+                                     width - (border_width + inner_corner_radius) + bottom_right_shift, height - (border_width + inner_corner_radius) + bottom_right_shift,
+                                     border_width + inner_corner_radius, height - (border_width + inner_corner_radius) + bottom_right_shift)}
+
+        elif drawing_method == "font_shapes":
+            return {"border_oval_1_a": (corner_radius, corner_radius, corner_radius),
+                    "border_oval_1_b": (corner_radius, corner_radius, corner_radius),
+                    "border_oval_2_a": (width - corner_radius, corner_radius, corner_radius),
+                    "border_oval_2_b": (width - corner_radius, corner_radius, corner_radius),
+                    "border_oval_3_a": (width - corner_radius, height - corner_radius, corner_radius),
+                    "border_oval_3_b": (width - corner_radius, height - corner_radius, corner_radius),
+                    "border_oval_4_a": (corner_radius, height - corner_radius, corner_radius),
+                    "border_oval_4_b": (corner_radius, height - corner_radius, corner_radius),
+                    "border_rectangle_1": (0, corner_radius, width, height - corner_radius),
+                    "border_rectangle_2": (corner_radius, 0, width - corner_radius, height),
+                    "inner_oval_1_a": (border_width + inner_corner_radius, border_width + inner_corner_radius, inner_corner_radius),
+                    "inner_oval_1_b": (border_width + inner_corner_radius, border_width + inner_corner_radius, inner_corner_radius),
+                    "inner_oval_2_a": (width - border_width - inner_corner_radius, border_width + inner_corner_radius, inner_corner_radius),
+                    "inner_oval_2_b": (width - border_width - inner_corner_radius, border_width + inner_corner_radius, inner_corner_radius),
+                    "inner_oval_3_a": (width - border_width - inner_corner_radius, height - border_width - inner_corner_radius, inner_corner_radius),
+                    "inner_oval_3_b": (width - border_width - inner_corner_radius, height - border_width - inner_corner_radius, inner_corner_radius),
+                    "inner_oval_4_a": (border_width + inner_corner_radius, height - border_width - inner_corner_radius, inner_corner_radius),
+                    "inner_oval_4_b": (border_width + inner_corner_radius, height - border_width - inner_corner_radius, inner_corner_radius),
+                    "inner_rectangle_1": (border_width + inner_corner_radius, border_width, width - border_width - inner_corner_radius, height - border_width),
+                    "inner_rectangle_2": (border_width, border_width + inner_corner_radius, width - border_width, height - inner_corner_radius - border_width)}
+
+        elif drawing_method == "circle_shapes":
+            return {"border_oval_1": (0, 0, corner_radius * 2 - 1, corner_radius * 2 - 1),
+                    "border_oval_2": (width - corner_radius * 2, 0, width - 1, corner_radius * 2 - 1),
+                    "border_oval_3": (0, height - corner_radius * 2, corner_radius * 2 - 1, height - 1),
+                    "border_oval_4": (width - corner_radius * 2, height - corner_radius * 2, width - 1, height - 1),
+                    "border_rectangle_1": (0, corner_radius, width, height - corner_radius),
+                    "border_rectangle_2": (corner_radius, 0, width - corner_radius, height),
+                    "inner_oval_1": (border_width, border_width,
+                                     border_width + inner_corner_radius * 2 - 1, border_width + inner_corner_radius * 2 - 1),
+                    "inner_oval_2": (width - border_width - inner_corner_radius * 2, border_width,
+                                     width - border_width - 1, border_width + inner_corner_radius * 2 - 1),
+                    "inner_oval_3": (border_width, height - border_width - inner_corner_radius * 2,
+                                     border_width + inner_corner_radius * 2 - 1, height - border_width - 1),
+                    "inner_oval_4": (width - border_width - inner_corner_radius * 2, height - border_width - inner_corner_radius * 2,
+                                     width - border_width - 1, height - border_width - 1),
+                    "inner_rectangle_1": (border_width + inner_corner_radius, border_width, width - border_width - inner_corner_radius, height - border_width),
+                    "inner_rectangle_2": (border_width, border_width + inner_corner_radius, width - border_width, height - inner_corner_radius - border_width)}
 
-            returns bool if recoloring is necessary """
+        else:
+            return {}  # 'image_shapes' has no parts with coordinates
 
+    @classmethod
+    def __compute_layout(cls, width: Union[float, int], height: Union[float, int], corner_radius: Union[float, int],
+                         border_width: Union[float, int], drawing_method: str, include_part_coords: bool = True) -> dict:
         width = math.floor(width / 2) * 2  # round (floor) _current_width and _current_height and restrict them to even values only
         height = math.floor(height / 2) * 2
         corner_radius = round(corner_radius)
@@ -70,43 +173,137 @@ class DrawEngine:
             corner_radius = min(width / 2, height / 2)
 
         border_width = round(border_width)
-        corner_radius = self.__calc_optimal_corner_radius(corner_radius)  # optimize corner_radius for different drawing methods (different rounding)
+        corner_radius = cls.__optimal_corner_radius_for_method(corner_radius, drawing_method)  # optimize corner_radius for different drawing methods (different rounding)
 
         if corner_radius >= border_width:
             inner_corner_radius = corner_radius - border_width
         else:
             inner_corner_radius = 0
 
+        if corner_radius <= border_width:
+            bottom_right_shift = -1  # weird canvas rendering inaccuracy that has to be corrected in some cases (polygon_shapes)
+        else:
+            bottom_right_shift = 0
+
+        return {"drawing_method": drawing_method, "width": width, "height": height, "corner_radius": corner_radius, "border_width": border_width,
+                "inner_corner_radius": inner_corner_radius,
+                "part_coords": cls.__rounded_rect_part_coords(drawing_method, width, height, corner_radius, border_width, inner_corner_radius,
+                                                              bottom_right_shift) if include_part_coords else None}
+
+    @classmethod
+    def __compute_layouts_numpy(cls, specs: list, drawing_method: str) -> list:
+        """ same as __compute_layout() for many specs with the same drawing method, in one vectorized pass """
+
+        width, height, corner_radius, border_width = numpy.asarray([spec[:4] for spec in specs], dtype=float).T
+
+        width = numpy.floor(width / 2) * 2
+        height = numpy.floor(height / 2) * 2
+        corner_radius = numpy.minimum(numpy.round(corner_radius), numpy.minimum(width / 2, height / 2))
+        border_width = numpy.round(border_width)
+        corner_radius = cls.__optimal_corner_radius_for_method_numpy(corner_radius, drawing_method)
+        inner_corner_radius = numpy.where(corner_radius >= border_width, corner_radius - border_width, 0)
+        bottom_right_shift = numpy.where(corner_radius <= border_width, -1, 0)
+
+        # one matrix with a row of all part coords per spec, then split into the parts with slices
+        part_coords = cls.__rounded_rect_part_coords(drawing_method, width, height, corner_radius, border_width, inner_corner_radius, bottom_right_shift)
+        part_slices, column_count = [], 0
+        for tag, coords in part_coords.items():
+            part_slices.append((tag, column_count, column_count + len(coords)))
+            column_count += len(coords)
+        coords_rows = numpy.column_stack(numpy.broadcast_arrays(*[coord for coords in part_coords.values() for coord in coords])).tolist() \
+            if column_count > 0 else [[]] * len(specs)
+
+        layouts = []
+        for values, coords_row in zip(numpy.column_stack((width, height, corner_radius, border_width, inner_corner_radius)).tolist(), coords_rows):
+            layouts.append({"drawing_method": drawing_method, "width": values[0], "height": values[1], "corner_radius": values[2],
+                            "border_width": values[3], "inner_corner_radius": values[4],
+                            "part_coords": {tag: tuple(coords_row[start:end]) for tag, start, end in part_slices}})
+        return layouts
+
+    @classmethod
+    def compute_layouts(cls, specs: Sequence[tuple]) -> list:
+        """ Computes the geometry of many rounded rects with border at once, for example for grid views with hundreds of equally shaped cells.
+            specs is a sequence of (width, height, corner_radius, border_width, drawing_method) tuples, drawing_method can be None for
+            DrawEngine.preferred_drawing_method. Values are expected to be already scaled.
+
+            returns a list of layout dicts in the order of specs, which can be drawn with draw_rounded_rect_with_border_from_layout(),
+            equal specs get the same (not to be modified) layout dict """
+
+        # equal specs (like the cells of a grid) share one layout, so every distinct spec is only computed once
+        unique_specs = {}  # (width, height, corner_radius, border_width, drawing_method) -> layout
+        for spec in specs:
+            drawing_method = spec[4] if len(spec) > 4 and spec[4] is not None else cls.preferred_drawing_method
+            unique_specs.setdefault((*spec[:4], drawing_method), None)
+
+        # group the specs by drawing method, because rounding and part coordinates differ between the methods
+        specs_by_method = {}
+        for unique_spec in unique_specs:
+            specs_by_method.setdefault(unique_spec[4], []).append(unique_spec)
+
+        for drawing_method, method_specs in specs_by_method.items():
+            if numpy is not None and len(method_specs) >= cls.numpy_min_batch_size:
+                unique_specs.update(zip(method_specs, cls.__compute_layouts_numpy(method_specs, drawing_method)))
+            else:
+                for unique_spec in method_specs:
+                    unique_specs[unique_spec] = cls.__compute_layout(*unique_spec)
+
+        return [unique_specs[(*spec[:4], spec[4] if len(spec) > 4 and spec[4] is not None else cls.preferred_drawing_method)] for spec in specs]
+
+    def draw_rounded_rect_with_border(self, width: Union[float, int], height: Union[float, int], corner_radius: Union[float, int],
+                                      border_width: Union[float, int], overwrite_preferred_drawing_method: str = None) -> bool:
+        """ Draws a rounded rectangle with a corner_radius and border_width on the canvas. The border elements have a 'border_parts' tag,
+            the main foreground elements have an 'inner_parts' tag to color the elements accordingly.
+
+            returns bool if recoloring is necessary """
+
         if overwrite_preferred_drawing_method is not None:
             preferred_drawing_method = overwrite_preferred_drawing_method
         else:
             preferred_drawing_method = self.preferred_drawing_method
 
-        if preferred_drawing_method == "polygon_shapes":
-            return self.__draw_rounded_rect_with_border_polygon_shapes(width, height, corner_radius, border_width, inner_corner_radius)
-        elif preferred_drawing_method == "font_shapes":
-            return self.__draw_rounded_rect_with_border_font_shapes(width, height, corner_radius, border_width, inner_corner_radius, ())
-        elif preferred_drawing_method == "circle_shapes":
-            return self.__draw_rounded_rect_with_border_circle_shapes(width, height, corner_radius, border_width, inner_corner_radius)
+        # the part coords are only computed if the draw is not skipped
+        layout = self.__compute_layout(width, height, corner_radius, border_width, preferred_drawing_method, include_part_coords=False)
+        return self.draw_rounded_rect_with_border_from_layout(layout)
+
+    def draw_rounded_rect_with_border_from_layout(self, layout: dict) -> bool:
+        """ Draws a rounded rectangle with border from a layout computed by compute_layouts(), same as draw_rounded_rect_with_border().
 
-    def __draw_rounded_rect_with_border_polygon_shapes(self, width: int, height: int, corner_radius: int, border_width: int, inner_corner_radius: int) -> bool:
+            returns bool if recoloring is necessary """
+
+        preferred_drawing_method = layout["drawing_method"]
+        width, height, corner_radius = layout["width"], layout["height"], layout["corner_radius"]
+        border_width, inner_corner_radius, part_coords = layout["border_width"], layout["inner_corner_radius"], layout["part_coords"]
+
+        # skip drawing if nothing changed since the last draw, because all parts are already in place
+        if self.__draw_signature_unchanged("rounded_rect_with_border", (width, height, corner_radius, border_width, preferred_drawing_method)):
+            return False
+
+        with self._canvas.tcl_batch(self.use_tcl_batching):  # optionally execute all canvas commands with a single tk.eval()
+            if preferred_drawing_method == "polygon_shapes":
+                return self.__draw_rounded_rect_with_border_polygon_shapes(width, height, corner_radius, border_width, inner_corner_radius, part_coords)
+            elif preferred_drawing_method == "font_shapes":
+                return self.__draw_rounded_rect_with_border_font_shapes(width, height, corner_radius, border_width, inner_corner_radius, (), part_coords)
+            elif preferred_drawing_method == "circle_shapes":
+                return self.__draw_rounded_rect_with_border_circle_shapes(width, height, corner_radius, border_width, inner_corner_radius, part_coords)
+            elif preferred_drawing_method == "image_shapes":
+                return self._canvas.set_image_shape(("rounded_rect", width, height, corner_radius, border_width, inner_corner_radius),
+                                                    ("border_parts", "inner_parts"))
+
+    def __draw_rounded_rect_with_border_polygon_shapes(self, width: int, height: int, corner_radius: int, border_width: int, inner_corner_radius: int,
+                                                       part_coords: dict = None) -> bool:
         requires_recoloring = False
 
+        if part_coords is None:
+            bottom_right_shift = -1 if corner_radius <= border_width else 0  # weird canvas rendering inaccuracy that has to be corrected in some cases
+            part_coords = self.__rounded_rect_part_coords("polygon_shapes", width, height, corner_radius, border_width, inner_corner_radius, bottom_right_shift)
+
         # create border button parts (only if border exists)
         if border_width > 0:
             if not self._canvas.find_withtag("border_parts"):
                 self._canvas.create_polygon((0, 0, 0, 0), tags=("border_line_1", "border_parts"))
                 requires_recoloring = True
 
-            self._canvas.coords("border_line_1",
-                                (corner_radius,
-                                 corner_radius,
-                                 width - corner_radius,
-                                 corner_radius,
-                                 width - corner_radius,
-                                 height - corner_radius,
-                                 corner_radius,
-                                 height - corner_radius))
+            self._canvas.coords("border_line_1", part_coords["border_line_1"])
             self._canvas.itemconfig("border_line_1",
                                     joinstyle=tkinter.ROUND,
                                     width=corner_radius * 2)
@@ -119,20 +316,7 @@ class DrawEngine:
             self._canvas.create_polygon((0, 0, 0, 0), tags=("inner_line_1", "inner_parts"), joinstyle=tkinter.ROUND)
             requires_recoloring = True
 
-        if corner_radius <= border_width:
-            bottom_right_shift = -1  # weird canvas rendering inaccuracy that has to be corrected in some cases
-        else:
-            bottom_right_shift = 0
-
-        self._canvas.coords("inner_line_1",
-                            border_width + inner_corner_radius,
-                            border_width + inner_corner_radius,
-                            width - (border_width + inner_corner_radius) + bottom_right_shift,
-                            border_width + inner_corner_radius,
-                            width - (border_width + inner_corner_radius) + bottom_right_shift,
-                            height - (border_width + inner_corner_radius) + bottom_right_shift,
-                            border_width + inner_corner_radius,
-                            height - (border_width + inner_corner_radius) + bottom_right_shift)
+        self._canvas.coords("inner_line_1", part_coords["inner_line_1"])
         self._canvas.itemconfig("inner_line_1",
                                 width=inner_corner_radius * 2)
 
@@ -143,52 +327,55 @@ class DrawEngine:
         return requires_recoloring
 
     def __draw_rounded_rect_with_border_font_shapes(self, width: int, height: int, corner_radius: int, border_width: int, inner_corner_radius: int,
-                                                    exclude_parts: tuple) -> bool:
+                                                    exclude_parts: tuple, part_coords: dict = None) -> bool:
         requires_recoloring = False
 
+        if part_coords is None:
+            part_coords = self.__rounded_rect_part_coords("font_shapes", width, height, corner_radius, border_width, inner_corner_radius, 0)
+
         # create border button parts
         if border_width > 0:
             if corner_radius > 0:
-                # create canvas border corner parts if not already created, but only if needed, and delete if not needed
+                # create canvas border corner parts if not already created, but only if needed, and hide if not needed
                 if not self._canvas.find_withtag("border_oval_1_a") and "border_oval_1" not in exclude_parts:
                     self._canvas.create_aa_circle(0, 0, 0, tags=("border_oval_1_a", "border_corner_part", "border_parts"), anchor=tkinter.CENTER)
                     self._canvas.create_aa_circle(0, 0, 0, tags=("border_oval_1_b", "border_corner_part", "border_parts"), anchor=tkinter.CENTER, angle=180)
                     requires_recoloring = True
-                elif self._canvas.find_withtag("border_oval_1_a") and "border_oval_1" in exclude_parts:
-                    self._canvas.delete("border_oval_1_a", "border_oval_1_b")
+                elif self._canvas.find_withtag("border_oval_1_a"):
+                    self._canvas.set_items_hidden("border_oval_1" in exclude_parts, "border_oval_1_a", "border_oval_1_b")
 
                 if not self._canvas.find_withtag("border_oval_2_a") and width > 2 * corner_radius and "border_oval_2" not in exclude_parts:
                     self._canvas.create_aa_circle(0, 0, 0, tags=("border_oval_2_a", "border_corner_part", "border_parts"), anchor=tkinter.CENTER)
                     self._canvas.create_aa_circle(0, 0, 0, tags=("border_oval_2_b", "border_corner_part", "border_parts"), anchor=tkinter.CENTER, angle=180)
                     requires_recoloring = True
-                elif self._canvas.find_withtag("border_oval_2_a") and (not width > 2 * corner_radius or "border_oval_2" in exclude_parts):
-                    self._canvas.delete("border_oval_2_a", "border_oval_2_b")
+                elif self._canvas.find_withtag("border_oval_2_a"):
+                    self._canvas.set_items_hidden((not width > 2 * corner_radius or "border_oval_2" in exclude_parts), "border_oval_2_a", "border_oval_2_b")
 
                 if not self._canvas.find_withtag("border_oval_3_a") and height > 2 * corner_radius \
                     and width > 2 * corner_radius and "border_oval_3" not in exclude_parts:
                     self._canvas.create_aa_circle(0, 0, 0, tags=("border_oval_3_a", "border_corner_part", "border_parts"), anchor=tkinter.CENTER)
                     self._canvas.create_aa_circle(0, 0, 0, tags=("border_oval_3_b", "border_corner_part", "border_parts"), anchor=tkinter.CENTER, angle=180)
                     requires_recoloring = True
-                elif self._canvas.find_withtag("border_oval_3_a") and (not (height > 2 * corner_radius
-                                                                            and width > 2 * corner_radius) or "border_oval_3" in exclude_parts):
-                    self._canvas.delete("border_oval_3_a", "border_oval_3_b")
+                elif self._canvas.find_withtag("border_oval_3_a"):
+                    self._canvas.set_items_hidden((not (height > 2 * corner_radius and width > 2 * corner_radius) or "border_oval_3" in exclude_parts),
+                                                  "border_oval_3_a", "border_oval_3_b")
 
                 if not self._canvas.find_withtag("border_oval_4_a") and height > 2 * corner_radius and "border_oval_4" not in exclude_parts:
                     self._canvas.create_aa_circle(0, 0, 0, tags=("border_oval_4_a", "border_corner_part", "border_parts"), anchor=tkinter.CENTER)
                     self._canvas.create_aa_circle(0, 0, 0, tags=("border_oval_4_b", "border_corner_part", "border_parts"), anchor=tkinter.CENTER, angle=180)
                     requires_recoloring = True
-                elif self._canvas.find_withtag("border_oval_4_a") and (not height > 2 * corner_radius or "border_oval_4" in exclude_parts):
-                    self._canvas.delete("border_oval_4_a", "border_oval_4_b")
+                elif self._canvas.find_withtag("border_oval_4_a"):
+                    self._canvas.set_items_hidden((not height > 2 * corner_radius or "border_oval_4" in exclude_parts), "border_oval_4_a", "border_oval_4_b")
 
                 # change position of border corner parts
-                self._canvas.coords("border_oval_1_a", corner_radius, corner_radius, corner_radius)
-                self._canvas.coords("border_oval_1_b", corner_radius, corner_radius, corner_radius)
-                self._canvas.coords("border_oval_2_a", width - corner_radius, corner_radius, corner_radius)
-                self._canvas.coords("border_oval_2_b", width - corner_radius, corner_radius, corner_radius)
-                self._canvas.coords("border_oval_3_a", width - corner_radius, height - corner_radius, corner_radius)
-                self._canvas.coords("border_oval_3_b", width - corner_radius, height - corner_radius, corner_radius)
-                self._canvas.coords("border_oval_4_a", corner_radius, height - corner_radius, corner_radius)
-                self._canvas.coords("border_oval_4_b", corner_radius, height - corner_radius, corner_radius)
+                self._canvas.coords("border_oval_1_a", *part_coords["border_oval_1_a"])
+                self._canvas.coords("border_oval_1_b", *part_coords["border_oval_1_b"])
+                self._canvas.coords("border_oval_2_a", *part_coords["border_oval_2_a"])
+                self._canvas.coords("border_oval_2_b", *part_coords["border_oval_2_b"])
+                self._canvas.coords("border_oval_3_a", *part_coords["border_oval_3_a"])
+                self._canvas.coords("border_oval_3_b", *part_coords["border_oval_3_b"])
+                self._canvas.coords("border_oval_4_a", *part_coords["border_oval_4_a"])
+                self._canvas.coords("border_oval_4_b", *part_coords["border_oval_4_b"])
 
             else:
                 self._canvas.delete("border_corner_part")  # delete border corner parts if not needed
@@ -200,8 +387,8 @@ class DrawEngine:
                 requires_recoloring = True
 
             # change position of border rectangle parts
-            self._canvas.coords("border_rectangle_1", (0, corner_radius, width, height - corner_radius))
-            self._canvas.coords("border_rectangle_2", (corner_radius, 0, width - corner_radius, height))
+            self._canvas.coords("border_rectangle_1", part_coords["border_rectangle_1"])
+            self._canvas.coords("border_rectangle_2", part_coords["border_rectangle_2"])
 
         else:
             self._canvas.delete("border_parts")
@@ -209,46 +396,47 @@ class DrawEngine:
         # create inner button parts
         if inner_corner_radius > 0:
 
-            # create canvas border corner parts if not already created, but only if they're needed and delete if not needed
+            # create canvas border corner parts if not already created, but only if they're needed and hide if not needed
             if not self._canvas.find_withtag("inner_oval_1_a") and "inner_oval_1" not in exclude_parts:
                 self._canvas.create_aa_circle(0, 0, 0, tags=("inner_oval_1_a", "inner_corner_part", "inner_parts"), anchor=tkinter.CENTER)
                 self._canvas.create_aa_circle(0, 0, 0, tags=("inner_oval_1_b", "inner_corner_part", "inner_parts"), anchor=tkinter.CENTER, angle=180)
                 requires_recoloring = True
-            elif self._canvas.find_withtag("inner_oval_1_a") and "inner_oval_1" in exclude_parts:
-                self._canvas.delete("inner_oval_1_a", "inner_oval_1_b")
+            elif self._canvas.find_withtag("inner_oval_1_a"):
+                self._canvas.set_items_hidden("inner_oval_1" in exclude_parts, "inner_oval_1_a", "inner_oval_1_b")
 
             if not self._canvas.find_withtag("inner_oval_2_a") and width - (2 * border_width) > 2 * inner_corner_radius and "inner_oval_2" not in exclude_parts:
                 self._canvas.create_aa_circle(0, 0, 0, tags=("inner_oval_2_a", "inner_corner_part", "inner_parts"), anchor=tkinter.CENTER)
                 self._canvas.create_aa_circle(0, 0, 0, tags=("inner_oval_2_b", "inner_corner_part", "inner_parts"), anchor=tkinter.CENTER, angle=180)
                 requires_recoloring = True
-            elif self._canvas.find_withtag("inner_oval_2_a") and (not width - (2 * border_width) > 2 * inner_corner_radius or "inner_oval_2" in exclude_parts):
-                self._canvas.delete("inner_oval_2_a", "inner_oval_2_b")
+            elif self._canvas.find_withtag("inner_oval_2_a"):
+                self._canvas.set_items_hidden((not width - (2 * border_width) > 2 * inner_corner_radius or "inner_oval_2" in exclude_parts), "inner_oval_2_a", "inner_oval_2_b")
 
             if not self._canvas.find_withtag("inner_oval_3_a") and height - (2 * border_width) > 2 * inner_corner_radius \
                 and width - (2 * border_width) > 2 * inner_corner_radius and "inner_oval_3" not in exclude_parts:
                 self._canvas.create_aa_circle(0, 0, 0, tags=("inner_oval_3_a", "inner_corner_part", "inner_parts"), anchor=tkinter.CENTER)
                 self._canvas.create_aa_circle(0, 0, 0, tags=("inner_oval_3_b", "inner_corner_part", "inner_parts"), anchor=tkinter.CENTER, angle=180)
                 requires_recoloring = True
-            elif self._canvas.find_withtag("inner_oval_3_a") and (not (height - (2 * border_width) > 2 * inner_corner_radius
-                                                                       and width - (2 * border_width) > 2 * inner_corner_radius) or "inner_oval_3" in exclude_parts):
-                self._canvas.delete("inner_oval_3_a", "inner_oval_3_b")
+            elif self._canvas.find_withtag("inner_oval_3_a"):
+                self._canvas.set_items_hidden((not (height - (2 * border_width) > 2 * inner_corner_radius
+                                                    and width - (2 * border_width) > 2 * inner_corner_radius) or "inner_oval_3" in exclude_parts),
+                                              "inner_oval_3_a", "inner_oval_3_b")
 
             if not self._canvas.find_withtag("inner_oval_4_a") and height - (2 * border_width) > 2 * inner_corner_radius and "inner_oval_4" not in exclude_parts:
                 self._canvas.create_aa_circle(0, 0, 0, tags=("inner_oval_4_a", "inner_corner_part", "inner_parts"), anchor=tkinter.CENTER)
                 self._canvas.create_aa_circle(0, 0, 0, tags=("inner_oval_4_b", "inner_corner_part", "inner_parts"), anchor=tkinter.CENTER, angle=180)
                 requires_recoloring = True
-            elif self._canvas.find_withtag("inner_oval_4_a") and (not height - (2 * border_width) > 2 * inner_corner_radius or "inner_oval_4" in exclude_parts):
-                self._canvas.delete("inner_oval_4_a", "inner_oval_4_b")
+            elif self._canvas.find_withtag("inner_oval_4_a"):
+                self._canvas.set_items_hidden((not height - (2 * border_width) > 2 * inner_corner_radius or "inner_oval_4" in exclude_parts), "inner_oval_4_a", "inner_oval_4_b")
 
             # change position of border corner parts
-            self._canvas.coords("inner_oval_1_a", border_width + inner_corner_radius, border_width + inner_corner_radius, inner_corner_radius)
-            self._canvas.coords("inner_oval_1_b", border_width + inner_corner_radius, border_width + inner_corner_radius, inner_corner_radius)
-            self._canvas.coords("inner_oval_2_a", width - border_width - inner_corner_radius, border_width + inner_corner_radius, inner_corner_radius)
-            self._canvas.coords("inner_oval_2_b", width - border_width - inner_corner_radius, border_width + inner_corner_radius, inner_corner_radius)
-            self._canvas.coords("inner_oval_3_a", width - border_width - inner_corner_radius, height - border_width - inner_corner_radius, inner_corner_radius)
-            self._canvas.coords("inner_oval_3_b", width - border_width - inner_corner_radius, height - border_width - inner_corner_radius, inner_corner_radius)
-            self._canvas.coords("inner_oval_4_a", border_width + inner_corner_radius, height - border_width - inner_corner_radius, inner_corner_radius)
-            self._canvas.coords("inner_oval_4_b", border_width + inner_corner_radius, height - border_width - inner_corner_radius, inner_corner_radius)
+            self._canvas.coords("inner_oval_1_a", *part_coords["inner_oval_1_a"])
+            self._canvas.coords("inner_oval_1_b", *part_coords["inner_oval_1_b"])
+            self._canvas.coords("inner_oval_2_a", *part_coords["inner_oval_2_a"])
+            self._canvas.coords("inner_oval_2_b", *part_coords["inner_oval_2_b"])
+            self._canvas.coords("inner_oval_3_a", *part_coords["inner_oval_3_a"])
+            self._canvas.coords("inner_oval_3_b", *part_coords["inner_oval_3_b"])
+            self._canvas.coords("inner_oval_4_a", *part_coords["inner_oval_4_a"])
+            self._canvas.coords("inner_oval_4_b", *part_coords["inner_oval_4_b"])
         else:
             self._canvas.delete("inner_corner_part")  # delete inner corner parts if not needed
 
@@ -261,18 +449,12 @@ class DrawEngine:
             self._canvas.create_rectangle(0, 0, 0, 0, tags=("inner_rectangle_2", "inner_rectangle_part", "inner_parts"), width=0)
             requires_recoloring = True
 
-        elif self._canvas.find_withtag("inner_rectangle_2") and not inner_corner_radius * 2 < height - (border_width * 2):
-            self._canvas.delete("inner_rectangle_2")
+        elif self._canvas.find_withtag("inner_rectangle_2"):
+            self._canvas.set_items_hidden(not inner_corner_radius * 2 < height - (border_width * 2), "inner_rectangle_2")
 
         # change position of inner rectangle parts
-        self._canvas.coords("inner_rectangle_1", (border_width + inner_corner_radius,
-                                                  border_width,
-                                                  width - border_width - inner_corner_radius,
-                                                  height - border_width))
-        self._canvas.coords("inner_rectangle_2", (border_width,
-                                                  border_width + inner_corner_radius,
-                                                  width - border_width,
-                                                  height - inner_corner_radius - border_width))
+        self._canvas.coords("inner_rectangle_1", part_coords["inner_rectangle_1"])
+        self._canvas.coords("inner_rectangle_2", part_coords["inner_rectangle_2"])
 
         if requires_recoloring:  # new parts were added -> manage z-order
             self._canvas.tag_lower("inner_parts")
@@ -280,9 +462,13 @@ class DrawEngine:
 
         return requires_recoloring
 
-    def __draw_rounded_rect_with_border_circle_shapes(self, width: int, height: int, corner_radius: int, border_width: int, inner_corner_radius: int) -> bool:
+    def __draw_rounded_rect_with_border_circle_shapes(self, width: int, height: int, corner_radius: int, border_width: int, inner_corner_radius: int,
+                                                      part_coords: dict = None) -> bool:
         requires_recoloring = False
 
+        if part_coords is None:
+            part_coords = self.__rounded_rect_part_coords("circle_shapes", width, height, corner_radius, border_width, inner_corner_radius, 0)
+
         # border button parts
         if border_width > 0:
             if corner_radius > 0:
@@ -295,10 +481,10 @@ class DrawEngine:
                     self._canvas.tag_lower("border_parts")
                     requires_recoloring = True
 
-                self._canvas.coords("border_oval_1", 0, 0, corner_radius * 2 - 1, corner_radius * 2 - 1)
-                self._canvas.coords("border_oval_2", width - corner_radius * 2, 0, width - 1, corner_radius * 2 - 1)
-                self._canvas.coords("border_oval_3", 0, height - corner_radius * 2, corner_radius * 2 - 1, height - 1)
-                self._canvas.coords("border_oval_4", width - corner_radius * 2, height - corner_radius * 2, width - 1, height - 1)
+                self._canvas.coords("border_oval_1", part_coords["border_oval_1"])
+                self._canvas.coords("border_oval_2", part_coords["border_oval_2"])
+                self._canvas.coords("border_oval_3", part_coords["border_oval_3"])
+                self._canvas.coords("border_oval_4", part_coords["border_oval_4"])
 
             else:
                 self._canvas.delete("border_corner_part")
@@ -309,8 +495,8 @@ class DrawEngine:
                 self._canvas.tag_lower("border_parts")
                 requires_recoloring = True
 
-            self._canvas.coords("border_rectangle_1", (0, corner_radius, width, height - corner_radius))
-            self._canvas.coords("border_rectangle_2", (corner_radius, 0, width - corner_radius, height))
+            self._canvas.coords("border_rectangle_1", part_coords["border_rectangle_1"])
+            self._canvas.coords("border_rectangle_2", part_coords["border_rectangle_2"])
 
         else:
             self._canvas.delete("border_parts")
@@ -326,14 +512,10 @@ class DrawEngine:
                 self._canvas.tag_raise("inner_parts")
                 requires_recoloring = True
 
-            self._canvas.coords("inner_oval_1", (border_width, border_width,
-                                                 border_width + inner_corner_radius * 2 - 1, border_width + inner_corner_radius * 2 - 1))
-            self._canvas.coords("inner_oval_2", (width - border_width - inner_corner_radius * 2, border_width,
-                                                 width - border_width - 1, border_width + inner_corner_radius * 2 - 1))
-            self._canvas.coords("inner_oval_3", (border_width, height - border_width - inner_corner_radius * 2,
-                                                 border_width + inner_corner_radius * 2 - 1, height - border_width - 1))
-            self._canvas.coords("inner_oval_4", (width - border_width - inner_corner_radius * 2, height - border_width - inner_corner_radius * 2,
-                                                 width - border_width - 1, height - border_width - 1))
+            self._canvas.coords("inner_oval_1", part_coords["inner_oval_1"])
+            self._canvas.coords("inner_oval_2", part_coords["inner_oval_2"])
+            self._canvas.coords("inner_oval_3", part_coords["inner_oval_3"])
+            self._canvas.coords("inner_oval_4", part_coords["inner_oval_4"])
         else:
             self._canvas.delete("inner_corner_part")  # delete inner corner parts if not needed
 
@@ -343,14 +525,8 @@ class DrawEngine:
             self._canvas.tag_raise("inner_parts")
             requires_recoloring = True
 
-        self._canvas.coords("inner_rectangle_1", (border_width + inner_corner_radius,
-                                                  border_width,
-                                                  width - border_width - inner_corner_radius,
-                                                  height - border_width))
-        self._canvas.coords("inner_rectangle_2", (border_width,
-                                                  border_width + inner_corner_radius,
-                                                  width - border_width,
-                                                  height - inner_corner_radius - border_width))
+        self._canvas.coords("inner_rectangle_1", part_coords["inner_rectangle_1"])
+        self._canvas.coords("inner_rectangle_2", part_coords["inner_rectangle_2"])
 
         return requires_recoloring
 
@@ -384,10 +560,16 @@ class DrawEngine:
         elif left_section_width < corner_radius * 2:
             left_section_width = corner_radius * 2
 
-        if self.preferred_drawing_method == "polygon_shapes" or self.preferred_drawing_method == "circle_shapes":
-            return self.__draw_rounded_rect_with_border_vertical_split_polygon_shapes(width, height, corner_radius, border_width, inner_corner_radius, left_section_width)
-        elif self.preferred_drawing_method == "font_shapes":
-            return self.__draw_rounded_rect_with_border_vertical_split_font_shapes(width, height, corner_radius, border_width, inner_corner_radius, left_section_width, ())
+        # skip drawing if nothing changed since the last draw, because all parts are already in place
+        if self.__draw_signature_unchanged("rounded_rect_with_border_vertical_split", (width, height, corner_radius, border_width, left_section_width,
+                                                                                         self.preferred_drawing_method)):
+            return False
+
+        with self._canvas.tcl_batch(self.use_tcl_batching):  # optionally execute all canvas commands with a single tk.eval()
+            if self.preferred_drawing_method in ("polygon_shapes", "circle_shapes", "image_shapes"):  # no image support for split shapes
+                return self.__draw_rounded_rect_with_border_vertical_split_polygon_shapes(width, height, corner_radius, border_width, inner_corner_radius, left_section_width)
+            elif self.preferred_drawing_method == "font_shapes":
+                return self.__draw_rounded_rect_with_border_vertical_split_font_shapes(width, height, corner_radius, border_width, inner_corner_radius, left_section_width, ())
 
     def __draw_rounded_rect_with_border_vertical_split_polygon_shapes(self, width: int, height: int, corner_radius: int, border_width: int, inner_corner_radius: int,
                                                                       left_section_width: int) -> bool:
@@ -488,14 +670,14 @@ class DrawEngine:
         # create border button parts
         if border_width > 0:
             if corner_radius > 0:
-                # create canvas border corner parts if not already created, but only if needed, and delete if not needed
+                # create canvas border corner parts if not already created, but only if needed, and hide if not needed
                 if not self._canvas.find_withtag("border_oval_1_a") and "border_oval_1" not in exclude_parts:
                     self._canvas.create_aa_circle(0, 0, 0, tags=("border_oval_1_a", "border_corner_part", "border_parts_left", "border_parts", "left_parts"), anchor=tkinter.CENTER)
                     self._canvas.create_aa_circle(0, 0, 0, tags=("border_oval_1_b", "border_corner_part", "border_parts_left", "border_parts", "left_parts"), anchor=tkinter.CENTER,
                                                   angle=180)
                     requires_recoloring = True
-                elif self._canvas.find_withtag("border_oval_1_a") and "border_oval_1" in exclude_parts:
-                    self._canvas.delete("border_oval_1_a", "border_oval_1_b")
+                elif self._canvas.find_withtag("border_oval_1_a"):
+                    self._canvas.set_items_hidden("border_oval_1" in exclude_parts, "border_oval_1_a", "border_oval_1_b")
 
                 if not self._canvas.find_withtag("border_oval_2_a") and width > 2 * corner_radius and "border_oval_2" not in exclude_parts:
                     self._canvas.create_aa_circle(0, 0, 0, tags=("border_oval_2_a", "border_corner_part", "border_parts_right", "border_parts", "right_parts"),
@@ -503,8 +685,8 @@ class DrawEngine:
                     self._canvas.create_aa_circle(0, 0, 0, tags=("border_oval_2_b", "border_corner_part", "border_parts_right", "border_parts", "right_parts"),
                                                   anchor=tkinter.CENTER, angle=180)
                     requires_recoloring = True
-                elif self._canvas.find_withtag("border_oval_2_a") and (not width > 2 * corner_radius or "border_oval_2" in exclude_parts):
-                    self._canvas.delete("border_oval_2_a", "border_oval_2_b")
+                elif self._canvas.find_withtag("border_oval_2_a"):
+                    self._canvas.set_items_hidden((not width > 2 * corner_radius or "border_oval_2" in exclude_parts), "border_oval_2_a", "border_oval_2_b")
 
                 if not self._canvas.find_withtag("border_oval_3_a") and height > 2 * corner_radius \
                     and width > 2 * corner_radius and "border_oval_3" not in exclude_parts:
@@ -513,17 +695,17 @@ class DrawEngine:
                     self._canvas.create_aa_circle(0, 0, 0, tags=("border_oval_3_b", "border_corner_part", "border_parts_right", "border_parts", "right_parts"),
                                                   anchor=tkinter.CENTER, angle=180)
                     requires_recoloring = True
-                elif self._canvas.find_withtag("border_oval_3_a") and (not (height > 2 * corner_radius
-                                                                            and width > 2 * corner_radius) or "border_oval_3" in exclude_parts):
-                    self._canvas.delete("border_oval_3_a", "border_oval_3_b")
+                elif self._canvas.find_withtag("border_oval_3_a"):
+                    self._canvas.set_items_hidden((not (height > 2 * corner_radius and width > 2 * corner_radius) or "border_oval_3" in exclude_parts),
+                                                  "border_oval_3_a", "border_oval_3_b")
 
                 if not self._canvas.find_withtag("border_oval_4_a") and height > 2 * corner_radius and "border_oval_4" not in exclude_parts:
                     self._canvas.create_aa_circle(0, 0, 0, tags=("border_oval_4_a", "border_corner_part", "border_parts_left", "border_parts", "left_parts"), anchor=tkinter.CENTER)
                     self._canvas.create_aa_circle(0, 0, 0, tags=("border_oval_4_b", "border_corner_part", "border_parts_left", "border_parts", "left_parts"), anchor=tkinter.CENTER,
                                                   angle=180)
                     requires_recoloring = True
-                elif self._canvas.find_withtag("border_oval_4_a") and (not height > 2 * corner_radius or "border_oval_4" in exclude_parts):
-                    self._canvas.delete("border_oval_4_a", "border_oval_4_b")
+                elif self._canvas.find_withtag("border_oval_4_a"):
+                    self._canvas.set_items_hidden((not height > 2 * corner_radius or "border_oval_4" in exclude_parts), "border_oval_4_a", "border_oval_4_b")
 
                 # change position of border corner parts
                 self._canvas.coords("border_oval_1_a", corner_radius, corner_radius, corner_radius)
@@ -558,22 +740,22 @@ class DrawEngine:
         # create inner button parts
         if inner_corner_radius > 0:
 
-            # create canvas border corner parts if not already created, but only if they're needed and delete if not needed
+            # create canvas border corner parts if not already created, but only if they're needed and hide if not needed
             if not self._canvas.find_withtag("inner_oval_1_a") and "inner_oval_1" not in exclude_parts:
                 self._canvas.create_aa_circle(0, 0, 0, tags=("inner_oval_1_a", "inner_corner_part", "inner_parts_left", "inner_parts", "left_parts"), anchor=tkinter.CENTER)
                 self._canvas.create_aa_circle(0, 0, 0, tags=("inner_oval_1_b", "inner_corner_part", "inner_parts_left", "inner_parts", "left_parts"), anchor=tkinter.CENTER,
                                               angle=180)
                 requires_recoloring = True
-            elif self._canvas.find_withtag("inner_oval_1_a") and "inner_oval_1" in exclude_parts:
-                self._canvas.delete("inner_oval_1_a", "inner_oval_1_b")
+            elif self._canvas.find_withtag("inner_oval_1_a"):
+                self._canvas.set_items_hidden("inner_oval_1" in exclude_parts, "inner_oval_1_a", "inner_oval_1_b")
 
             if not self._canvas.find_withtag("inner_oval_2_a") and width - (2 * border_width) > 2 * inner_corner_radius and "inner_oval_2" not in exclude_parts:
                 self._canvas.create_aa_circle(0, 0, 0, tags=("inner_oval_2_a", "inner_corner_part", "inner_parts_right", "inner_parts", "right_parts"), anchor=tkinter.CENTER)
                 self._canvas.create_aa_circle(0, 0, 0, tags=("inner_oval_2_b", "inner_corner_part", "inner_parts_right", "inner_parts", "right_parts"), anchor=tkinter.CENTER,
                                               angle=180)
                 requires_recoloring = True
-            elif self._canvas.find_withtag("inner_oval_2_a") and (not width - (2 * border_width) > 2 * inner_corner_radius or "inner_oval_2" in exclude_parts):
-                self._canvas.delete("inner_oval_2_a", "inner_oval_2_b")
+            elif self._canvas.find_withtag("inner_oval_2_a"):
+                self._canvas.set_items_hidden((not width - (2 * border_width) > 2 * inner_corner_radius or "inner_oval_2" in exclude_parts), "inner_oval_2_a", "inner_oval_2_b")
 
             if not self._canvas.find_withtag("inner_oval_3_a") and height - (2 * border_width) > 2 * inner_corner_radius \
                 and width - (2 * border_width) > 2 * inner_corner_radius and "inner_oval_3" not in exclude_parts:
@@ -581,17 +763,18 @@ class DrawEngine:
                 self._canvas.create_aa_circle(0, 0, 0, tags=("inner_oval_3_b", "inner_corner_part", "inner_parts_right", "inner_parts", "right_parts"), anchor=tkinter.CENTER,
                                               angle=180)
                 requires_recoloring = True
-            elif self._canvas.find_withtag("inner_oval_3_a") and (not (height - (2 * border_width) > 2 * inner_corner_radius
-                                                                       and width - (2 * border_width) > 2 * inner_corner_radius) or "inner_oval_3" in exclude_parts):
-                self._canvas.delete("inner_oval_3_a", "inner_oval_3_b")
+            elif self._canvas.find_withtag("inner_oval_3_a"):
+                self._canvas.set_items_hidden((not (height - (2 * border_width) > 2 * inner_corner_radius
+                                                    and width - (2 * border_width) > 2 * inner_corner_radius) or "inner_oval_3" in exclude_parts),
+                                              "inner_oval_3_a", "inner_oval_3_b")
 
             if not self._canvas.find_withtag("inner_oval_4_a") and height - (2 * border_width) > 2 * inner_corner_radius and "inner_oval_4" not in exclude_parts:
                 self._canvas.create_aa_circle(0, 0, 0, tags=("inner_oval_4_a", "inner_corner_part", "inner_parts_left", "inner_parts", "left_parts"), anchor=tkinter.CENTER)
                 self._canvas.create_aa_circle(0, 0, 0, tags=("inner_oval_4_b", "inner_corner_part", "inner_parts_left", "inner_parts", "left_parts"), anchor=tkinter.CENTER,
                                               angle=180)
                 requires_recoloring = True
-            elif self._canvas.find_withtag("inner_oval_4_a") and (not height - (2 * border_width) > 2 * inner_corner_radius or "inner_oval_4" in exclude_parts):
-                self._canvas.delete("inner_oval_4_a", "inner_oval_4_b")
+            elif self._canvas.find_withtag("inner_oval_4_a"):
+                self._canvas.set_items_hidden((not height - (2 * border_width) > 2 * inner_corner_radius or "inner_oval_4" in exclude_parts), "inner_oval_4_a", "inner_oval_4_b")
 
             # change position of border corner parts
             self._canvas.coords("inner_oval_1_a", border_width + inner_corner_radius, border_width + inner_corner_radius, inner_corner_radius)
@@ -611,14 +794,13 @@ class DrawEngine:
             self._canvas.create_rectangle(0, 0, 0, 0, tags=("inner_rectangle_right_1", "inner_rectangle_part", "inner_parts_right", "inner_parts", "right_parts"), width=0)
             requires_recoloring = True
 
-        if not self._canvas.find_withtag("inner_rectangle_2") and inner_corner_radius * 2 < height - (border_width * 2):
+        if not self._canvas.find_withtag("inner_rectangle_left_2") and inner_corner_radius * 2 < height - (border_width * 2):
             self._canvas.create_rectangle(0, 0, 0, 0, tags=("inner_rectangle_left_2", "inner_rectangle_part", "inner_parts_left", "inner_parts", "left_parts"), width=0)
             self._canvas.create_rectangle(0, 0, 0, 0, tags=("inner_rectangle_right_2", "inner_rectangle_part", "inner_parts_right", "inner_parts", "right_parts"), width=0)
             requires_recoloring = True
 
-        elif self._canvas.find_withtag("inner_rectangle_2") and not inner_corner_radius * 2 < height - (border_width * 2):
-            self._canvas.delete("inner_rectangle_left_2")
-            self._canvas.delete("inner_rectangle_right_2")
+        elif self._canvas.find_withtag("inner_rectangle_left_2"):
+            self._canvas.set_items_hidden(not inner_corner_radius * 2 < height - (border_width * 2), "inner_rectangle_left_2", "inner_rectangle_right_2")
 
         # change position of inner rectangle parts
         self._canvas.coords("inner_rectangle_left_1", (border_width + inner_corner_radius,
@@ -666,12 +848,22 @@ class DrawEngine:
         else:
             inner_corner_radius = 0
 
-        if self.preferred_drawing_method == "polygon_shapes" or self.preferred_drawing_method == "circle_shapes":
-            return self.__draw_rounded_progress_bar_with_border_polygon_shapes(width, height, corner_radius, border_width, inner_corner_radius,
-                                                                               progress_value_1, progress_value_2, orientation)
-        elif self.preferred_drawing_method == "font_shapes":
-            return self.__draw_rounded_progress_bar_with_border_font_shapes(width, height, corner_radius, border_width, inner_corner_radius,
-                                                                            progress_value_1, progress_value_2, orientation)
+        # skip drawing if nothing changed since the last draw, because all parts are already in place
+        if self.__draw_signature_unchanged("rounded_progress_bar_with_border", (width, height, corner_radius, border_width, progress_value_1,
+                                                                                  progress_value_2, orientation, self.preferred_drawing_method)):
+            return False
+
+        with self._canvas.tcl_batch(self.use_tcl_batching):  # optionally execute all canvas commands with a single tk.eval()
+            if self.preferred_drawing_method == "polygon_shapes" or self.preferred_drawing_method == "circle_shapes":
+                return self.__draw_rounded_progress_bar_with_border_polygon_shapes(width, height, corner_radius, border_width, inner_corner_radius,
+                                                                                   progress_value_1, progress_value_2, orientation)
+            elif self.preferred_drawing_method == "font_shapes":
+                return self.__draw_rounded_progress_bar_with_border_font_shapes(width, height, corner_radius, border_width, inner_corner_radius,
+                                                                                progress_value_1, progress_value_2, orientation)
+            elif self.preferred_drawing_method == "image_shapes":
+                return self._canvas.set_image_shape(("progress_bar", width, height, corner_radius, border_width, inner_corner_radius,
+                                                     progress_value_1, progress_value_2, orientation),
+                                                    ("border_parts", "inner_parts", "progress_parts"))
 
     def __draw_rounded_progress_bar_with_border_polygon_shapes(self, width: int, height: int, corner_radius: int, border_width: int, inner_corner_radius: int,
                                                                progress_value_1: float, progress_value_2: float, orientation: str) -> bool:
@@ -735,8 +927,9 @@ class DrawEngine:
                 self._canvas.create_aa_circle(0, 0, 0, tags=("progress_oval_4_a", "progress_corner_part", "progress_parts"), anchor=tkinter.CENTER)
                 self._canvas.create_aa_circle(0, 0, 0, tags=("progress_oval_4_b", "progress_corner_part", "progress_parts"), anchor=tkinter.CENTER, angle=180)
                 requires_recoloring = True
-            elif self._canvas.find_withtag("progress_oval_3_a") and not round(inner_corner_radius) * 2 < height - 2 * border_width:
-                self._canvas.delete("progress_oval_3_a", "progress_oval_3_b", "progress_oval_4_a", "progress_oval_4_b")
+            elif self._canvas.find_withtag("progress_oval_3_a"):
+                self._canvas.set_items_hidden(not round(inner_corner_radius) * 2 < height - 2 * border_width,
+                                              "progress_oval_3_a", "progress_oval_3_b", "progress_oval_4_a", "progress_oval_4_b")
 
         if not self._canvas.find_withtag("progress_rectangle_1"):
             self._canvas.create_rectangle(0, 0, 0, 0, tags=("progress_rectangle_1", "progress_rectangle_part", "progress_parts"), width=0)
@@ -745,8 +938,8 @@ class DrawEngine:
         if not self._canvas.find_withtag("progress_rectangle_2") and inner_corner_radius * 2 < height - (border_width * 2):
             self._canvas.create_rectangle(0, 0, 0, 0, tags=("progress_rectangle_2", "progress_rectangle_part", "progress_parts"), width=0)
             requires_recoloring = True
-        elif self._canvas.find_withtag("progress_rectangle_2") and not inner_corner_radius * 2 < height - (border_width * 2):
-            self._canvas.delete("progress_rectangle_2")
+        elif self._canvas.find_withtag("progress_rectangle_2"):
+            self._canvas.set_items_hidden(not inner_corner_radius * 2 < height - (border_width * 2), "progress_rectangle_2")
 
         # horizontal orientation from the bottom
         if orientation == "w":
@@ -843,12 +1036,23 @@ class DrawEngine:
         else:
             inner_corner_radius = 0
 
-        if self.preferred_drawing_method == "polygon_shapes" or self.preferred_drawing_method == "circle_shapes":
-            return self.__draw_rounded_slider_with_border_and_button_polygon_shapes(width, height, corner_radius, border_width, inner_corner_radius,
-                                                                                    button_length, button_corner_radius, slider_value, orientation)
-        elif self.preferred_drawing_method == "font_shapes":
-            return self.__draw_rounded_slider_with_border_and_button_font_shapes(width, height, corner_radius, border_width, inner_corner_radius,
-                                                                                 button_length, button_corner_radius, slider_value, orientation)
+        # skip drawing if nothing changed since the last draw, because all parts are already in place
+        if self.__draw_signature_unchanged("rounded_slider_with_border_and_button", (width, height, corner_radius, border_width, button_length,
+                                                                                       button_corner_radius, slider_value, orientation,
+                                                                                       self.preferred_drawing_method)):
+            return False
+
+        with self._canvas.tcl_batch(self.use_tcl_batching):  # optionally execute all canvas commands with a single tk.eval()
+            if self.preferred_drawing_method == "polygon_shapes" or self.preferred_drawing_method == "circle_shapes":
+                return self.__draw_rounded_slider_with_border_and_button_polygon_shapes(width, height, corner_radius, border_width, inner_corner_radius,
+                                                                                        button_length, button_corner_radius, slider_value, orientation)
+            elif self.preferred_drawing_method == "font_shapes":
+                return self.__draw_rounded_slider_with_border_and_button_font_shapes(width, height, corner_radius, border_width, inner_corner_radius,
+                                                                                     button_length, button_corner_radius, slider_value, orientation)
+            elif self.preferred_drawing_method == "image_shapes":
+                return self._canvas.set_image_shape(("slider", width, height, corner_radius, border_width, inner_corner_radius,
+                                                     button_length, button_corner_radius, slider_value, orientation),
+                                                    ("border_parts", "inner_parts", "progress_parts", "slider_parts"))
 
     def __draw_rounded_slider_with_border_and_button_polygon_shapes(self, width: int, height: int, corner_radius: int, border_width: int, inner_corner_radius: int,
                                                                     button_length: int, button_corner_radius: int, slider_value: float, orientation: str) -> bool:
@@ -906,35 +1110,35 @@ class DrawEngine:
             self._canvas.create_aa_circle(0, 0, 0, tags=("slider_oval_2_a", "slider_corner_part", "slider_parts"), anchor=tkinter.CENTER)
             self._canvas.create_aa_circle(0, 0, 0, tags=("slider_oval_2_b", "slider_corner_part", "slider_parts"), anchor=tkinter.CENTER, angle=180)
             requires_recoloring = True
-        elif self._canvas.find_withtag("slider_oval_2_a") and not button_length > 0:
-            self._canvas.delete("slider_oval_2_a", "slider_oval_2_b")
+        elif self._canvas.find_withtag("slider_oval_2_a"):
+            self._canvas.set_items_hidden(not button_length > 0, "slider_oval_2_a", "slider_oval_2_b")
 
         if not self._canvas.find_withtag("slider_oval_4_a") and height > 2 * button_corner_radius:
             self._canvas.create_aa_circle(0, 0, 0, tags=("slider_oval_4_a", "slider_corner_part", "slider_parts"), anchor=tkinter.CENTER)
             self._canvas.create_aa_circle(0, 0, 0, tags=("slider_oval_4_b", "slider_corner_part", "slider_parts"), anchor=tkinter.CENTER, angle=180)
             requires_recoloring = True
-        elif self._canvas.find_withtag("slider_oval_4_a") and not height > 2 * button_corner_radius:
-            self._canvas.delete("slider_oval_4_a", "slider_oval_4_b")
+        elif self._canvas.find_withtag("slider_oval_4_a"):
+            self._canvas.set_items_hidden(not height > 2 * button_corner_radius, "slider_oval_4_a", "slider_oval_4_b")
 
         if not self._canvas.find_withtag("slider_oval_3_a") and button_length > 0 and height > 2 * button_corner_radius:
             self._canvas.create_aa_circle(0, 0, 0, tags=("slider_oval_3_a", "slider_corner_part", "slider_parts"), anchor=tkinter.CENTER)
             self._canvas.create_aa_circle(0, 0, 0, tags=("slider_oval_3_b", "slider_corner_part", "slider_parts"), anchor=tkinter.CENTER, angle=180)
             requires_recoloring = True
-        elif self._canvas.find_withtag("border_oval_3_a") and not (button_length > 0 and height > 2 * button_corner_radius):
-            self._canvas.delete("slider_oval_3_a", "slider_oval_3_b")
+        elif self._canvas.find_withtag("slider_oval_3_a"):
+            self._canvas.set_items_hidden(not (button_length > 0 and height > 2 * button_corner_radius), "slider_oval_3_a", "slider_oval_3_b")
 
         # create the 2 rectangles (if needed)
         if not self._canvas.find_withtag("slider_rectangle_1") and button_length > 0:
             self._canvas.create_rectangle(0, 0, 0, 0, tags=("slider_rectangle_1", "slider_rectangle_part", "slider_parts"), width=0)
             requires_recoloring = True
-        elif self._canvas.find_withtag("slider_rectangle_1") and not button_length > 0:
-            self._canvas.delete("slider_rectangle_1")
+        elif self._canvas.find_withtag("slider_rectangle_1"):
+            self._canvas.set_items_hidden(not button_length > 0, "slider_rectangle_1")
 
         if not self._canvas.find_withtag("slider_rectangle_2") and height > 2 * button_corner_radius:
             self._canvas.create_rectangle(0, 0, 0, 0, tags=("slider_rectangle_2", "slider_rectangle_part", "slider_parts"), width=0)
             requires_recoloring = True
-        elif self._canvas.find_withtag("slider_rectangle_2") and not height > 2 * button_corner_radius:
-            self._canvas.delete("slider_rectangle_2")
+        elif self._canvas.find_withtag("slider_rectangle_2"):
+            self._canvas.set_items_hidden(not height > 2 * button_corner_radius, "slider_rectangle_2")
 
         # set positions of circles and rectangles
         if orientation == "w":
@@ -994,12 +1198,21 @@ class DrawEngine:
         else:
             inner_corner_radius = 0
 
-        if self.preferred_drawing_method == "polygon_shapes" or self.preferred_drawing_method == "circle_shapes":
-            return self.__draw_rounded_scrollbar_polygon_shapes(width, height, corner_radius, inner_corner_radius,
-                                                                start_value, end_value, orientation)
-        elif self.preferred_drawing_method == "font_shapes":
-            return self.__draw_rounded_scrollbar_font_shapes(width, height, corner_radius, inner_corner_radius,
-                                                             start_value, end_value, orientation)
+        # skip drawing if nothing changed since the last draw, because all parts are already in place
+        if self.__draw_signature_unchanged("rounded_scrollbar", (width, height, corner_radius, border_spacing, start_value, end_value, orientation,
+                                                                   self.preferred_drawing_method)):
+            return False
+
+        with self._canvas.tcl_batch(self.use_tcl_batching):  # optionally execute all canvas commands with a single tk.eval()
+            if self.preferred_drawing_method == "polygon_shapes" or self.preferred_drawing_method == "circle_shapes":
+                return self.__draw_rounded_scrollbar_polygon_shapes(width, height, corner_radius, inner_corner_radius,
+                                                                    start_value, end_value, orientation)
+            elif self.preferred_drawing_method == "font_shapes":
+                return self.__draw_rounded_scrollbar_font_shapes(width, height, corner_radius, inner_corner_radius,
+                                                                 start_value, end_value, orientation)
+            elif self.preferred_drawing_method == "image_shapes":
+                return self._canvas.set_image_shape(("scrollbar", width, height, corner_radius, inner_corner_radius, start_value, end_value, orientation),
+                                                    ("border_parts", "scrollbar_parts"))
 
     def __draw_rounded_scrollbar_polygon_shapes(self, width: int, height: int, corner_radius: int, inner_corner_radius: int,
                                                 start_value: float, end_value: float, orientation: str) -> bool:
@@ -1051,36 +1264,36 @@ class DrawEngine:
                 self._canvas.create_aa_circle(0, 0, 0, tags=("scrollbar_oval_2_a", "scrollbar_corner_part", "scrollbar_parts"), anchor=tkinter.CENTER)
                 self._canvas.create_aa_circle(0, 0, 0, tags=("scrollbar_oval_2_b", "scrollbar_corner_part", "scrollbar_parts"), anchor=tkinter.CENTER, angle=180)
                 requires_recoloring = True
-            elif self._canvas.find_withtag("scrollbar_oval_2_a") and not width > 2 * corner_radius:
-                self._canvas.delete("scrollbar_oval_2_a", "scrollbar_oval_2_b")
+            elif self._canvas.find_withtag("scrollbar_oval_2_a"):
+                self._canvas.set_items_hidden(not width > 2 * corner_radius, "scrollbar_oval_2_a", "scrollbar_oval_2_b")
 
             if not self._canvas.find_withtag("scrollbar_oval_3_a") and height > 2 * corner_radius and width > 2 * corner_radius:
                 self._canvas.create_aa_circle(0, 0, 0, tags=("scrollbar_oval_3_a", "scrollbar_corner_part", "scrollbar_parts"), anchor=tkinter.CENTER)
                 self._canvas.create_aa_circle(0, 0, 0, tags=("scrollbar_oval_3_b", "scrollbar_corner_part", "scrollbar_parts"), anchor=tkinter.CENTER, angle=180)
                 requires_recoloring = True
-            elif self._canvas.find_withtag("scrollbar_oval_3_a") and not (height > 2 * corner_radius and width > 2 * corner_radius):
-                self._canvas.delete("scrollbar_oval_3_a", "scrollbar_oval_3_b")
+            elif self._canvas.find_withtag("scrollbar_oval_3_a"):
+                self._canvas.set_items_hidden(not (height > 2 * corner_radius and width > 2 * corner_radius), "scrollbar_oval_3_a", "scrollbar_oval_3_b")
 
             if not self._canvas.find_withtag("scrollbar_oval_4_a") and height > 2 * corner_radius:
                 self._canvas.create_aa_circle(0, 0, 0, tags=("scrollbar_oval_4_a", "scrollbar_corner_part", "scrollbar_parts"), anchor=tkinter.CENTER)
                 self._canvas.create_aa_circle(0, 0, 0, tags=("scrollbar_oval_4_b", "scrollbar_corner_part", "scrollbar_parts"), anchor=tkinter.CENTER, angle=180)
                 requires_recoloring = True
-            elif self._canvas.find_withtag("scrollbar_oval_4_a") and not height > 2 * corner_radius:
-                self._canvas.delete("scrollbar_oval_4_a", "scrollbar_oval_4_b")
+            elif self._canvas.find_withtag("scrollbar_oval_4_a"):
+                self._canvas.set_items_hidden(not height > 2 * corner_radius, "scrollbar_oval_4_a", "scrollbar_oval_4_b")
         else:
             self._canvas.delete("scrollbar_corner_part")
 
         if not self._canvas.find_withtag("scrollbar_rectangle_1") and height > 2 * corner_radius:
             self._canvas.create_rectangle(0, 0, 0, 0, tags=("scrollbar_rectangle_1", "scrollbar_rectangle_part", "scrollbar_parts"), width=0)
             requires_recoloring = True
-        elif self._canvas.find_withtag("scrollbar_rectangle_1") and not height > 2 * corner_radius:
-            self._canvas.delete("scrollbar_rectangle_1")
+        elif self._canvas.find_withtag("scrollbar_rectangle_1"):
+            self._canvas.set_items_hidden(not height > 2 * corner_radius, "scrollbar_rectangle_1")
 
         if not self._canvas.find_withtag("scrollbar_rectangle_2") and width > 2 * corner_radius:
             self._canvas.create_rectangle(0, 0, 0, 0, tags=("scrollbar_rectangle_2", "scrollbar_rectangle_part", "scrollbar_parts"), width=0)
             requires_recoloring = True
-        elif self._canvas.find_withtag("scrollbar_rectangle_2") and not width > 2 * corner_radius:
-            self._canvas.delete("scrollbar_rectangle_2")
+        elif self._canvas.find_withtag("scrollbar_rectangle_2"):
+            self._canvas.set_items_hidden(not width > 2 * corner_radius, "scrollbar_rectangle_2")
 
         if orientation == "vertical":
             self._canvas.coords("scrollbar_rectangle_1",
@@ -1127,7 +1340,7 @@ class DrawEngine:
         size = round(size)
         requires_recoloring = False
 
-        if self.preferred_drawing_method == "polygon_shapes" or self.preferred_drawing_method == "circle_shapes":
+        if self.preferred_drawing_method in ("polygon_shapes", "circle_shapes", "image_shapes"):
             x, y, radius = width / 2, height / 2, size / 2.8
             if not self._canvas.find_withtag("checkmark"):
                 self._canvas.create_line(0, 0, 0, 0, tags=("checkmark", "create_line"), width=round(height / 8), joinstyle=tkinter.MITER, capstyle=tkinter.ROUND)
@@ -1156,7 +1369,7 @@ class DrawEngine:
         x_position, y_position, size = round(x_position), round(y_position), round(size)
         requires_recoloring = False
 
-        if self.preferred_drawing_method == "polygon_shapes" or self.preferred_drawing_method == "circle_shapes":
+        if self.preferred_drawing_method in ("polygon_shapes", "circle_shapes", "image_shapes"):
             if not self._canvas.find_withtag("dropdown_arrow"):
                 self._canvas.create_line(0, 0, 0, 0, tags="dropdown_arrow", width=round(size / 3), joinstyle=tkinter.ROUND, capstyle=tkinter.ROUND)
                 self._canvas.tag_raise("dropdown_arrow")
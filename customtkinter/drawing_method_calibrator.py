@@ -0,0 +1,137 @@
+import sys
+import os
+import json
+import time
+import tkinter
+from typing import Union
+
+from .draw_engine import DrawEngine
+
+
+class DrawingMethodCalibrator:
+    """
+    Optional calibration, which times the drawing methods that can be chosen ('font_shapes' and 'polygon_shapes')
+    on the real Tk instance, including the rendering on a mapped canvas, and stores the fastest one in a small json
+    cache file, with the platform, the Tk patchlevel and the window server as key. A cached result is applied when the first CTk window is created.
+    Without a cached result the timing runs after the first frame of the window, so it never blocks CTk.__init__,
+    and the measured method is used from the next start on, because the widgets of the running application
+    are already drawn with the current method.
+    """
+
+    enabled = False  # opt-in, activate with customtkinter.activate_drawing_method_calibration()
+    calibrated = False
+    calibration_scheduled = False
+    cache_file_path = os.path.join(os.path.expanduser("~"), ".customtkinter", "drawing_method_cache.json")
+
+    # 'circle_shapes' is only a fallback without the shapes font and 'image_shapes' is opt-in, so they are never timed
+    candidate_methods = ("font_shapes", "polygon_shapes")
+    calibration_rounds = 5
+    calibration_shapes = ((140, 28, 6, 0), (140, 28, 6, 2), (200, 200, 10, 2), (300, 36, 18, 2))  # (width, height, corner_radius, border_width)
+
+    last_timings: dict = {}  # method -> seconds, of the last calibration
+
+    @classmethod
+    def get_cache_key(cls, root: tkinter.Tk) -> str:
+        try:
+            window_server = root.winfo_server()
+        except tkinter.TclError:
+            window_server = "unknown"
+        return f"{sys.platform}|tk{root.tk.call('info', 'patchlevel')}|{window_server}"
+
+    @classmethod
+    def load_cache(cls) -> dict:
+        try:
+            with open(cls.cache_file_path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @classmethod
+    def save_cache(cls, cache: dict):
+        try:
+            os.makedirs(os.path.dirname(cls.cache_file_path), exist_ok=True)
+            with open(cls.cache_file_path, "w") as f:
+                json.dump(cache, f, indent=2)
+        except OSError as err:
+            sys.stderr.write("DrawingMethodCalibrator warning: could not write cache file: " + str(err) + "\n")
+
+    @classmethod
+    def get_available_methods(cls) -> list:
+        available_methods = []
+        for method in cls.candidate_methods:
+            if method == "font_shapes" and not DrawEngine.shapes_font_available:
+                continue
+            available_methods.append(method)
+        return available_methods
+
+    @classmethod
+    def time_drawing_method(cls, root: tkinter.Tk, method: str) -> float:
+        """ returns seconds needed to draw, recolor and display the calibration shapes with the given method,
+            the canvas is mapped in an undecorated toplevel outside of the screen, so the rendering is measured
+            without anything showing up over the widgets of the window """
+
+        from .widgets.ctk_canvas import CTkCanvas
+
+        toplevel = tkinter.Toplevel(root)
+        try:
+            toplevel.overrideredirect(True)
+            toplevel.geometry(f"300x200+{-toplevel.winfo_screenwidth()}+{-toplevel.winfo_screenheight()}")
+            canvas = CTkCanvas(master=toplevel, highlightthickness=0, width=300, height=200)
+            canvas.pack()
+            toplevel.update()  # map the toplevel before the timing starts
+
+            draw_engine = DrawEngine(canvas)
+            draw_engine.preferred_drawing_method = method  # instance attribute, doesn't change the global setting
+
+            start_time = time.perf_counter()
+            for calibration_round in range(cls.calibration_rounds):
+                for width, height, corner_radius, border_width in cls.calibration_shapes:
+                    # change the width every round, so that the draw signature differs and everything gets drawn
+                    draw_engine.draw_rounded_rect_with_border(width + calibration_round * 2, height, corner_radius, border_width)
+                    canvas.itemconfig("border_parts", fill="#1F6AA5", outline="#1F6AA5")
+                    canvas.itemconfig("inner_parts", fill="#144870" if calibration_round % 2 else "#2FA572",
+                                      outline="#144870" if calibration_round % 2 else "#2FA572")
+                    toplevel.update()  # redisplay of the canvas, waits until the window server has rendered it
+            return time.perf_counter() - start_time
+        finally:
+            toplevel.destroy()
+
+    @classmethod
+    def get_cached_method(cls, root: tkinter.Tk) -> Union[str, None]:
+        method = cls.load_cache().get(cls.get_cache_key(root), {}).get("method")
+        return method if method in cls.get_available_methods() else None
+
+    @classmethod
+    def apply_cached_method(cls, root: tkinter.Tk):
+        """ called by CTk.__init__, applies the cached method or schedules the calibration after the first frame """
+
+        cls.calibrated = True
+        cached_method = cls.get_cached_method(root)
+
+        if cached_method is not None:
+            DrawEngine.preferred_drawing_method = cached_method
+        elif len(cls.get_available_methods()) > 1 and not cls.calibration_scheduled:
+            cls.calibration_scheduled = True
+            root.after_idle(root.after, 0, cls.calibrate, root)  # after the first draws and the first frame got displayed
+
+    @classmethod
+    def calibrate(cls, root: tkinter.Tk) -> Union[str, None]:
+        """ times the available methods and stores the fastest in the cache file, returns it,
+            or None if the window was destroyed in the meantime """
+
+        cls.calibration_scheduled = False
+        available_methods = cls.get_available_methods()
+
+        try:
+            cls.last_timings = {method: cls.time_drawing_method(root, method) for method in available_methods}
+            cache_key = cls.get_cache_key(root)
+        except tkinter.TclError:
+            return None  # window was destroyed
+
+        fastest_method = min(available_methods, key=lambda method: cls.last_timings[method])
+
+        cache = cls.load_cache()
+        cache[cache_key] = {"method": fastest_method, "timings": cls.last_timings}
+        cls.save_cache(cache)
+
+        return fastest_method
@@ -1,6 +1,7 @@
 import sys
 import os
 import shutil
+import tkinter.font
 from typing import Union
 
 
@@ -8,6 +9,13 @@ class FontManager:
 
     linux_font_path = "~/.fonts/"
 
+    # font tuples with negative (pixel) size get mapped to a tkinter named font per window, which is shared by all
+    # widgets of the window, so a scaling change configures every font only once and Tk updates all widgets using it
+    named_fonts = {}  # contains window objects as keys and dicts of {font tuple: [named font, size, scaling] or None}
+    font_style_options = {"normal": ("weight", "normal"), "bold": ("weight", "bold"),
+                          "roman": ("slant", "roman"), "italic": ("slant", "italic"),
+                          "underline": ("underline", True), "overstrike": ("overstrike", True)}
+
     @classmethod
     def init_font_manager(cls):
         # Linux
@@ -64,3 +72,62 @@ class FontManager:
         # macOS and others
         else:
             return False
+
+    @classmethod
+    def font_tuple_to_options(cls, font: tuple) -> Union[dict, None]:
+        """ converts a (family, size, *styles) font tuple to tkinter.font.Font options,
+            returns None if the tuple can't be represented by a named font """
+
+        if len(font) < 2 or not isinstance(font[0], str) or type(font[1]) not in (int, float):
+            return None
+
+        options = {"family": font[0], "size": font[1]}
+        for style_string in font[2:]:
+            if not isinstance(style_string, str):
+                return None
+            for style in style_string.split():
+                if style not in cls.font_style_options:
+                    return None
+                option, value = cls.font_style_options[style]
+                options[option] = value
+        return options
+
+    @classmethod
+    def get_named_font(cls, window, font: Union[tuple, list], widget_scaling: float) -> Union[tkinter.font.Font, None]:
+        """ returns the shared named font of the window for a font tuple with negative (pixel) size, scaled
+            with widget_scaling, returns None if the font can't be shared and has to be scaled by the widget """
+
+        font = tuple(font)
+        window_fonts = cls.named_fonts.setdefault(window, {})
+
+        if font not in window_fonts:
+            options = cls.font_tuple_to_options(font)
+            if options is None or options["size"] >= 0:
+                window_fonts[font] = None
+            else:
+                size = options.pop("size")
+                named_font = tkinter.font.Font(root=window, size=int(size * widget_scaling), **options)
+                window_fonts[font] = [named_font, size, widget_scaling]
+
+        entry = window_fonts[font]
+        if entry is None:
+            return None
+
+        named_font, size, scaling = entry
+        if scaling != widget_scaling:
+            named_font.configure(size=int(size * widget_scaling))  # gets propagated by Tk to all widgets using it
+            entry[2] = widget_scaling
+        return named_font
+
+    @classmethod
+    def update_named_fonts(cls, window, widget_scaling: float):
+        """ rescales all named fonts of the window, one configure call per font """
+
+        for entry in cls.named_fonts.get(window, {}).values():
+            if entry is not None and entry[2] != widget_scaling:
+                entry[0].configure(size=int(entry[1] * widget_scaling))
+                entry[2] = widget_scaling
+
+    @classmethod
+    def remove_named_fonts(cls, window):
+        cls.named_fonts.pop(window, None)
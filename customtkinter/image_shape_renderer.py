@@ -0,0 +1,333 @@
+import tkinter
+import math
+from collections import OrderedDict
+from typing import Union, Tuple
+
+
+class ImageShapeRenderer:
+    """
+    Rasterizes the DrawEngine shapes (rounded rect, progress bar, slider, scrollbar) into a tkinter.PhotoImage
+    with supersampled antialiasing. Used by the 'image_shapes' drawing method, where every canvas shows a
+    single image item instead of many text, polygon and rectangle items.
+
+    The images are stored in a LRU cache with the shape geometry and the colors as key, so all widgets
+    with the same size, shape and colors share one image. Rendering fills the completely covered areas with
+    single PhotoImage.put() calls and composites only the edge pixels, the corner coverage is cached as tiles.
+    """
+
+    cache_size = 512  # maximum number of cached images
+    supersampling = 4  # subsamples per axis for antialiasing of the edge pixels
+
+    _image_cache: OrderedDict = OrderedDict()  # (tk interpreter, shape_spec, colors) -> tkinter.PhotoImage
+    _rgb_cache: dict = {}  # color string -> (r, g, b) with 8 bit per channel
+    corner_tile_cache_size = 1024
+    _corner_tile_cache: dict = {}  # (corner, radius, edge offsets, size) -> rows of pixel coverage
+
+    @classmethod
+    def get_image(cls, canvas: tkinter.Canvas, shape_spec: tuple, colors: dict) -> tkinter.PhotoImage:
+        """ returns the cached image for shape_spec and colors or renders a new one """
+
+        shape_spec = cls.quantize_shape_spec(shape_spec)
+        cache_key = (canvas.tk, shape_spec, tuple(sorted(colors.items())))
+
+        image = cls._image_cache.get(cache_key)
+        if image is not None:
+            cls._image_cache.move_to_end(cache_key)
+            return image
+
+        image = cls.render(canvas, shape_spec, colors)
+        cls._image_cache[cache_key] = image
+
+        while len(cls._image_cache) > cls.cache_size:
+            cls._image_cache.popitem(last=False)  # canvases still showing an evicted image keep their own reference
+
+        return image
+
+    @staticmethod
+    def quantize_value(value: float, pixel_range: float) -> float:
+        if pixel_range <= 0:
+            return 0
+        return round(value * pixel_range) / pixel_range
+
+    @classmethod
+    def quantize_shape_spec(cls, shape_spec: tuple) -> tuple:
+        """ rounds the progress, slider and scrollbar values to whole pixel steps of their range, so all values
+            which would be rendered at the same pixel position share one cache entry instead of one image per value """
+
+        shape_type = shape_spec[0]
+
+        if shape_type == "progress_bar":
+            _, width, height, corner_radius, border_width, inner_corner_radius, progress_value_1, progress_value_2, orientation = shape_spec
+            length = width if orientation == "w" else height
+            pixel_range = length - 2 * border_width - 2 * inner_corner_radius
+            return shape_spec[:6] + (cls.quantize_value(progress_value_1, pixel_range), cls.quantize_value(progress_value_2, pixel_range), orientation)
+
+        elif shape_type == "slider":
+            _, width, height, corner_radius, border_width, inner_corner_radius, button_length, button_corner_radius, slider_value, orientation = shape_spec
+            length = width if orientation == "w" else height
+            # the value moves the progress part and the button, the finer of both steps is used
+            pixel_range = max(length - 2 * border_width - 2 * inner_corner_radius, length - 2 * corner_radius - button_length)
+            return shape_spec[:8] + (cls.quantize_value(slider_value, pixel_range), orientation)
+
+        elif shape_type == "scrollbar":
+            _, width, height, corner_radius, inner_corner_radius, start_value, end_value, orientation = shape_spec
+            pixel_range = (height if orientation == "vertical" else width) - 2 * corner_radius
+            return shape_spec[:5] + (cls.quantize_value(start_value, pixel_range), cls.quantize_value(end_value, pixel_range), orientation)
+
+        return shape_spec
+
+    @classmethod
+    def clear_cache(cls):
+        cls._image_cache.clear()
+        cls._corner_tile_cache.clear()
+
+    @classmethod
+    def color_to_rgb(cls, canvas: tkinter.Canvas, color: str) -> Tuple[int, int, int]:
+        rgb = cls._rgb_cache.get(color)
+        if rgb is None:
+            r, g, b = canvas.winfo_rgb(color)  # 16 bit per channel
+            rgb = (r >> 8, g >> 8, b >> 8)
+            cls._rgb_cache[color] = rgb
+        return rgb
+
+    @staticmethod
+    def get_shape_layers(shape_spec: tuple) -> list:
+        """ returns list of (color_tag, (x0, y0, x1, y1, radius)) from bottom to top for a shape_spec """
+
+        shape_type = shape_spec[0]
+
+        if shape_type == "rounded_rect":
+            _, width, height, corner_radius, border_width, inner_corner_radius = shape_spec
+            layers = []
+            if border_width > 0:
+                layers.append(("border_parts", (0, 0, width, height, corner_radius)))
+            layers.append(("inner_parts", (border_width, border_width, width - border_width, height - border_width, inner_corner_radius)))
+            return layers
+
+        elif shape_type == "progress_bar":
+            _, width, height, corner_radius, border_width, inner_corner_radius, progress_value_1, progress_value_2, orientation = shape_spec
+            layers = ImageShapeRenderer.get_shape_layers(("rounded_rect", width, height, corner_radius, border_width, inner_corner_radius))
+
+            if orientation == "w":
+                progress_range = width - 2 * border_width - 2 * inner_corner_radius
+                layers.append(("progress_parts", (border_width + progress_range * progress_value_1, border_width,
+                                                  border_width + 2 * inner_corner_radius + progress_range * progress_value_2, height - border_width,
+                                                  inner_corner_radius)))
+            elif orientation == "s":
+                progress_range = height - 2 * border_width - 2 * inner_corner_radius
+                layers.append(("progress_parts", (border_width, border_width + progress_range * (1 - progress_value_2),
+                                                  width - border_width, border_width + 2 * inner_corner_radius + progress_range * (1 - progress_value_1),
+                                                  inner_corner_radius)))
+            return layers
+
+        elif shape_type == "slider":
+            _, width, height, corner_radius, border_width, inner_corner_radius, button_length, button_corner_radius, slider_value, orientation = shape_spec
+            layers = ImageShapeRenderer.get_shape_layers(("progress_bar", width, height, corner_radius, border_width, inner_corner_radius,
+                                                          0, slider_value, orientation))
+
+            if orientation == "w":
+                slider_x_position = corner_radius + (button_length / 2) + (width - 2 * corner_radius - button_length) * slider_value
+                layers.append(("slider_parts", (slider_x_position - (button_length / 2) - button_corner_radius, 0,
+                                                slider_x_position + (button_length / 2) + button_corner_radius, height,
+                                                button_corner_radius)))
+            elif orientation == "s":
+                slider_y_position = corner_radius + (button_length / 2) + (height - 2 * corner_radius - button_length) * (1 - slider_value)
+                layers.append(("slider_parts", (0, slider_y_position - (button_length / 2) - button_corner_radius,
+                                                width, slider_y_position + (button_length / 2) + button_corner_radius,
+                                                button_corner_radius)))
+            return layers
+
+        elif shape_type == "scrollbar":
+            _, width, height, corner_radius, inner_corner_radius, start_value, end_value, orientation = shape_spec
+            layers = [("border_parts", (0, 0, width, height, 0))]
+            border_spacing = corner_radius - inner_corner_radius
+
+            if orientation == "vertical":
+                layers.append(("scrollbar_parts", (border_spacing, border_spacing + (height - 2 * corner_radius) * start_value,
+                                                   width - border_spacing, 2 * corner_radius - border_spacing + (height - 2 * corner_radius) * end_value,
+                                                   inner_corner_radius)))
+            elif orientation == "horizontal":
+                layers.append(("scrollbar_parts", (border_spacing + (width - 2 * corner_radius) * start_value, border_spacing,
+                                                   2 * corner_radius - border_spacing + (width - 2 * corner_radius) * end_value, height - border_spacing,
+                                                   inner_corner_radius)))
+            return layers
+
+        else:
+            raise ValueError(f"{shape_type} is not a valid shape type for ImageShapeRenderer")
+
+    @staticmethod
+    def rounded_rect_distance(x: float, y: float, rect: tuple) -> float:
+        """ signed distance from point (x, y) to the rounded rectangle edge (negative inside) """
+
+        x0, y0, x1, y1, radius = rect
+        half_width, half_height = (x1 - x0) / 2, (y1 - y0) / 2
+        radius = max(0, min(radius, half_width, half_height))
+
+        qx = abs(x - (x0 + half_width)) - (half_width - radius)
+        qy = abs(y - (y0 + half_height)) - (half_height - radius)
+        return math.hypot(max(qx, 0), max(qy, 0)) + min(max(qx, qy), 0) - radius
+
+    @classmethod
+    def pixel_coverage(cls, pixel_x: int, pixel_y: int, rect: tuple) -> float:
+        """ fraction of the pixel covered by the rounded rect, only edge pixels get supersampled """
+
+        distance = cls.rounded_rect_distance(pixel_x + 0.5, pixel_y + 0.5, rect)
+        if distance <= -0.75:
+            return 1.0
+        elif distance >= 0.75:
+            return 0.0
+
+        samples = cls.supersampling
+        inside_count = 0
+        for sub_y in range(samples):
+            for sub_x in range(samples):
+                if cls.rounded_rect_distance(pixel_x + (sub_x + 0.5) / samples, pixel_y + (sub_y + 0.5) / samples, rect) <= 0:
+                    inside_count += 1
+        return inside_count / (samples * samples)
+
+    @classmethod
+    def get_corner_tile(cls, corner: str, radius: float, edge_offset_x: float, edge_offset_y: float, tile_width: int, tile_height: int) -> tuple:
+        """ returns rows of coverage values for the pixel square around one corner of a rounded rect, the edge offsets are the
+            positions of the corner edges relative to the square, so all corners with the same radius and offsets share a tile """
+
+        cache_key = (corner, radius, edge_offset_x, edge_offset_y, tile_width, tile_height)
+        tile = cls._corner_tile_cache.get(cache_key)
+        if tile is None:
+            # rounded rect around the corner, large enough that the other corners don't reach into the square
+            extent = 2 * radius + 4
+            x0 = edge_offset_x if corner in ("nw", "sw") else edge_offset_x - extent
+            y0 = edge_offset_y if corner in ("nw", "ne") else edge_offset_y - extent
+            rect = (x0, y0, x0 + extent, y0 + extent, radius)
+
+            tile = tuple(tuple(cls.pixel_coverage(pixel_x, pixel_y, rect) for pixel_x in range(tile_width)) for pixel_y in range(tile_height))
+
+            if len(cls._corner_tile_cache) >= cls.corner_tile_cache_size:
+                cls._corner_tile_cache.clear()  # continuous values like progress positions would let it grow without limit
+            cls._corner_tile_cache[cache_key] = tile
+        return tile
+
+    @classmethod
+    def get_layer_regions(cls, rect: tuple) -> Union[dict, None]:
+        """ splits the pixels of a rounded rect layer into solid rectangles, which are completely covered, and edge blocks
+            with partial coverage (corners and fractional edges), returns None if the layer covers no pixel """
+
+        x0, y0, x1, y1, radius = rect
+        if x1 <= x0 or y1 <= y0:
+            return None
+        radius = max(0, min(radius, (x1 - x0) / 2, (y1 - y0) / 2))
+
+        # pixel columns and rows between the corners
+        corner_x0, corner_x1 = math.ceil(x0 + radius), math.floor(x1 - radius)
+        corner_y0, corner_y1 = math.ceil(y0 + radius), math.floor(y1 - radius)
+        bbox = (math.floor(x0), math.floor(y0), math.ceil(x1), math.ceil(y1))
+
+        if corner_x0 > corner_x1 or corner_y0 > corner_y1:
+            # small shape where the corner squares overlap, all pixels get computed directly
+            return {"rect": rect, "solid_rects": [], "edge_blocks": [(bbox[0], bbox[1], bbox[2] - bbox[0], bbox[3] - bbox[1])], "corners": None}
+
+        inner_x0, inner_y0, inner_x1, inner_y1 = math.ceil(x0), math.ceil(y0), math.floor(x1), math.floor(y1)
+        solid_rects = [(inner_x0, corner_y0, inner_x1, corner_y1),
+                       (corner_x0, inner_y0, corner_x1, corner_y0),
+                       (corner_x0, corner_y1, corner_x1, inner_y1)]
+
+        corners = []  # (x, y, tile) with the top left pixel of the corner square
+        for corner, square_x, square_y, square_x1, square_y1, edge_x, edge_y in (
+                ("nw", bbox[0], bbox[1], corner_x0, corner_y0, x0, y0),
+                ("ne", corner_x1, bbox[1], bbox[2], corner_y0, x1, y0),
+                ("sw", bbox[0], corner_y1, corner_x0, bbox[3], x0, y1),
+                ("se", corner_x1, corner_y1, bbox[2], bbox[3], x1, y1)):
+            tile = cls.get_corner_tile(corner, radius, edge_x - square_x, edge_y - square_y, square_x1 - square_x, square_y1 - square_y)
+            corners.append((square_x, square_y, tile))
+        edge_blocks = [(square_x, square_y, len(tile[0]) if tile else 0, len(tile)) for square_x, square_y, tile in corners]
+
+        # straight edges at fractional positions have one row or column of partially covered pixels
+        if inner_x0 > x0:
+            edge_blocks.append((bbox[0], corner_y0, 1, corner_y1 - corner_y0))
+        if x1 > inner_x1:
+            edge_blocks.append((inner_x1, corner_y0, 1, corner_y1 - corner_y0))
+        if inner_y0 > y0:
+            edge_blocks.append((corner_x0, bbox[1], corner_x1 - corner_x0, 1))
+        if y1 > inner_y1:
+            edge_blocks.append((corner_x0, inner_y1, corner_x1 - corner_x0, 1))
+
+        return {"rect": rect, "solid_rects": solid_rects, "edge_blocks": edge_blocks, "corners": corners}
+
+    @classmethod
+    def layer_coverage(cls, pixel_x: int, pixel_y: int, regions: dict) -> float:
+        """ fraction of the pixel covered by the layer, from the corner tiles or the overlap with the straight edges """
+
+        if regions["corners"] is None:
+            return cls.pixel_coverage(pixel_x, pixel_y, regions["rect"])
+
+        for square_x, square_y, tile in regions["corners"]:
+            if square_x <= pixel_x < square_x + (len(tile[0]) if tile else 0) and square_y <= pixel_y < square_y + len(tile):
+                return tile[pixel_y - square_y][pixel_x - square_x]
+
+        x0, y0, x1, y1, _ = regions["rect"]
+        coverage_x = min(pixel_x + 1, x1) - max(pixel_x, x0)
+        coverage_y = min(pixel_y + 1, y1) - max(pixel_y, y0)
+        return coverage_x * coverage_y if coverage_x > 0 and coverage_y > 0 else 0.0
+
+    @staticmethod
+    def rgb_to_hex(rgb: tuple) -> str:
+        return "#{:02x}{:02x}{:02x}".format(round(rgb[0]), round(rgb[1]), round(rgb[2]))
+
+    @classmethod
+    def get_put_commands(cls, width: int, height: int, background_rgb: tuple, layers: list) -> list:
+        """ returns the list of (data, to) arguments for PhotoImage.put() which render the layers, a list of (rect, rgb)
+            from bottom to top, on the background. Completely covered areas are filled with a single put() call,
+            only the edge pixels get composited one by one. """
+
+        commands = [(cls.rgb_to_hex(background_rgb), (0, 0, width, height))]
+        layer_regions = []
+
+        for rect, rgb in layers:
+            regions = cls.get_layer_regions(rect)
+            if regions is None:
+                continue
+            layer_regions.append((regions, rgb))
+
+            color = cls.rgb_to_hex(rgb)
+            for solid_x0, solid_y0, solid_x1, solid_y1 in regions["solid_rects"]:
+                solid_x0, solid_y0, solid_x1, solid_y1 = max(solid_x0, 0), max(solid_y0, 0), min(solid_x1, width), min(solid_y1, height)
+                if solid_x1 > solid_x0 and solid_y1 > solid_y0:
+                    commands.append((color, (solid_x0, solid_y0, solid_x1, solid_y1)))
+
+        # edge pixels after all solid fills, every edge pixel gets the composition of all layers
+        for regions, _ in layer_regions:
+            for block_x, block_y, block_width, block_height in regions["edge_blocks"]:
+                block_x0, block_y0 = max(block_x, 0), max(block_y, 0)
+                block_x1, block_y1 = min(block_x + block_width, width), min(block_y + block_height, height)
+                if block_x1 <= block_x0 or block_y1 <= block_y0:
+                    continue
+
+                rows = []
+                for pixel_y in range(block_y0, block_y1):
+                    row = []
+                    for pixel_x in range(block_x0, block_x1):
+                        r, g, b = background_rgb
+                        for layer, (layer_r, layer_g, layer_b) in layer_regions:
+                            coverage = cls.layer_coverage(pixel_x, pixel_y, layer)
+                            if coverage > 0:
+                                r += (layer_r - r) * coverage
+                                g += (layer_g - g) * coverage
+                                b += (layer_b - b) * coverage
+                        row.append(cls.rgb_to_hex((r, g, b)))
+                    rows.append("{" + " ".join(row) + "}")
+                commands.append((" ".join(rows), (block_x0, block_y0)))
+
+        return commands
+
+    @classmethod
+    def render(cls, canvas: tkinter.Canvas, shape_spec: tuple, colors: dict) -> tkinter.PhotoImage:
+        width, height = max(1, math.ceil(shape_spec[1])), max(1, math.ceil(shape_spec[2]))
+        background_rgb = cls.color_to_rgb(canvas, colors.get("bg") or canvas.cget("bg"))
+
+        # layers without a known color are not drawn, like canvas items without fill color
+        layers = [(rect, cls.color_to_rgb(canvas, colors[color_tag])) for color_tag, rect in cls.get_shape_layers(shape_spec)
+                  if colors.get(color_tag)]
+
+        image = tkinter.PhotoImage(master=canvas, width=width, height=height)
+        for data, to in cls.get_put_commands(width, height, background_rgb, layers):
+            image.put(data, to=to)
+        return image
@@ -0,0 +1,114 @@
+import time
+import tkinter
+from contextlib import contextmanager
+from typing import Union
+
+from .appearance_mode_tracker import AppearanceModeTracker
+
+
+class RedrawScheduler:
+    """ collects the widgets which need a redraw (after <Configure> events, configure() calls and scaling changes)
+        and draws every widget only once per flush, which runs at idle, optional limited to max_frame_rate """
+
+    enabled = True  # if False, widgets draw immediately on <Configure> events and configure() calls
+    max_frame_rate: Union[int, float, None] = None  # maximum flushes per second, None means flush at every idle
+
+    dirty_widgets = {}  # contains widgets as keys and the no_color_updates flag as values (ordered set)
+    flush_root = None  # tk root on which the flush is scheduled
+    flush_after_id = None
+    last_flush_time = 0
+
+    # inside of batch() blocks and widget.batch_update() blocks the draws get collected and executed at the end
+    batch_depth = 0
+    batch_widgets = {}  # contains widgets as keys and the no_color_updates flag as values (ordered set)
+
+    @classmethod
+    def mark_dirty(cls, widget, no_color_updates: bool = False):
+        """ schedules a draw of the widget, multiple requests until the next flush get merged into one draw,
+            a full draw request wins over a request without color updates """
+
+        cls.dirty_widgets[widget] = cls.dirty_widgets.get(widget, True) and no_color_updates
+
+        # reschedule if the flush is scheduled on another (maybe already destroyed) tk root
+        tk_root = AppearanceModeTracker.get_tk_root_of_widget(widget)
+        if cls.flush_after_id is None or tk_root is not cls.flush_root:
+            cls.cancel_flush()
+            cls.schedule_flush(tk_root)
+
+    @classmethod
+    def cancel_flush(cls):
+        if cls.flush_after_id is not None:
+            try:
+                cls.flush_root.after_cancel(cls.flush_after_id)
+            except Exception:
+                pass
+            cls.flush_after_id = None
+
+    @classmethod
+    def remove(cls, widget):
+        cls.dirty_widgets.pop(widget, None)
+
+    @classmethod
+    def schedule_flush(cls, tk_root):
+        cls.flush_root = tk_root
+
+        if cls.max_frame_rate is not None:
+            delay = cls.last_flush_time + 1 / cls.max_frame_rate - time.perf_counter()
+            if delay > 0:
+                cls.flush_after_id = tk_root.after(round(delay * 1000), cls.schedule_idle_flush)
+                return
+
+        cls.flush_after_id = tk_root.after_idle(cls.flush)
+
+    @classmethod
+    def schedule_idle_flush(cls):
+        cls.flush_after_id = cls.flush_root.after_idle(cls.flush)
+
+    @classmethod
+    def flush(cls):
+        """ draws all dirty widgets, can also be called directly to draw them immediately """
+
+        cls.cancel_flush()
+        cls.last_flush_time = time.perf_counter()
+
+        # swap before drawing, so that widgets marked dirty while drawing get drawn in the next flush
+        dirty_widgets, cls.dirty_widgets = cls.dirty_widgets, {}
+        for widget, no_color_updates in dirty_widgets.items():
+            cls.draw_widget(widget, no_color_updates)
+
+        if cls.dirty_widgets and cls.flush_after_id is None:
+            cls.schedule_flush(cls.flush_root)
+
+    @staticmethod
+    def draw_widget(widget, no_color_updates: bool):
+        try:
+            if widget.winfo_exists():
+                widget.draw(no_color_updates=no_color_updates)
+        except tkinter.TclError:
+            pass  # application got destroyed
+
+    @classmethod
+    def add_to_batch(cls, widget, no_color_updates: bool = False):
+        """ defers the draw of the widget until the end of the batch, a pending idle draw gets merged into it """
+
+        cls.batch_widgets[widget] = cls.dirty_widgets.pop(widget, True) and cls.batch_widgets.get(widget, True) and no_color_updates
+
+    @classmethod
+    def draw_batched_widget(cls, widget):
+        if widget in cls.batch_widgets:
+            cls.draw_widget(widget, cls.batch_widgets.pop(widget))
+
+    @classmethod
+    @contextmanager
+    def batch(cls):
+        """ all draws requested by configure() calls inside of the with block are executed once per widget at the end """
+
+        cls.batch_depth += 1
+        try:
+            yield
+        finally:
+            cls.batch_depth -= 1
+            if cls.batch_depth == 0:
+                for widget in list(cls.batch_widgets):
+                    if getattr(widget, "_batch_update_depth", 0) == 0:  # not inside an open widget.batch_update()
+                        cls.draw_batched_widget(widget)
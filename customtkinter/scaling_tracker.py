@@ -1,20 +1,31 @@
 import tkinter
 import sys
+import weakref
 from typing import Callable
 
+from .font_manager import FontManager
+
 
 class ScalingTracker:
     deactivate_automatic_dpi_awareness = False
 
-    window_widgets_dict = {}  # contains window objects as keys with list of widget callbacks as elements
+    window_widgets_dict = {}  # contains window objects as keys with dict of widget callbacks as elements (see make_callback_key)
     window_dpi_scaling_dict = {}  # contains window objects as keys and corresponding scaling factors
 
     widget_scaling = 1  # user values which multiply to detected window scaling factor
     window_scaling = 1
     spacing_scaling = 1
 
-    update_loop_running = False
-    update_loop_interval = 150  # milliseconds
+    # DPI changes get detected after <Configure> and <Map> events of the windows (moved to other monitor),
+    # the check runs dpi_check_delay milliseconds after the last event (debounced)
+    dpi_check_delay = 150  # milliseconds
+    dpi_check_bind_tag = "ctk_dpi_check"
+    dpi_check_after_ids = {}  # contains window objects as keys and the after() id of the scheduled check
+
+    # scaling changes get applied in phases: the set_scaling callbacks of a window update sizes and fonts,
+    # then the geometry manager calls get re-applied in one pass and every widget gets redrawn once at idle
+    scaling_update_running = False
+    pending_geometry_calls = []  # widgets which re-apply their last geometry manager call after the callbacks
 
     @classmethod
     def get_widget_scaling(cls, widget) -> float:
@@ -48,18 +59,64 @@ class ScalingTracker:
 
     @classmethod
     def get_window_root_of_widget(cls, widget):
+        """ the window root gets cached on the widget and its masters, so children of a widget with known
+            window root inherit it from their master in O(1) instead of walking the whole chain,
+            the cache never gets stale, because the master of a tkinter widget can't be changed """
+
         current_widget = widget
+        walked_widgets = []
 
         while isinstance(current_widget, tkinter.Tk) is False and\
                 isinstance(current_widget, tkinter.Toplevel) is False:
+            window_root = current_widget.__dict__.get("_ctk_window_root")
+            if window_root is not None:
+                break
+            walked_widgets.append(current_widget)
             current_widget = current_widget.master
+        else:
+            window_root = current_widget
 
-        return current_widget
+        for walked_widget in walked_widgets:
+            walked_widget._ctk_window_root = window_root
+        return window_root
+
+    @classmethod
+    def make_callback_key(cls, callback: Callable, on_dead_callback: Callable = None):
+        """ bound methods are stored as weakref.WeakMethod, so the registry doesn't keep widgets alive,
+            the callback dicts have the same keys and values, which gives O(1) removal """
+
+        if hasattr(callback, "__self__") and hasattr(callback, "__func__"):
+            return weakref.WeakMethod(callback, on_dead_callback)
+        else:
+            return callback
+
+    @classmethod
+    def get_widget_counts(cls) -> dict:
+        """ number of registered callbacks per window, for monitoring """
+        return {window: len(callback_dict) for window, callback_dict in cls.window_widgets_dict.items()}
 
     @classmethod
     def update_scaling_callbacks_all(cls):
-        for window, callback_list in cls.window_widgets_dict.items():
-            for set_scaling_callback in callback_list:
+        for window in list(cls.window_widgets_dict):
+            cls.update_scaling_callbacks_for_window(window)
+
+    @classmethod
+    def update_scaling_callbacks_for_window(cls, window):
+        # rescale the shared named fonts of the window, Tk propagates the new size to all widgets using them
+        if not cls.deactivate_automatic_dpi_awareness:
+            FontManager.update_named_fonts(window, cls.window_dpi_scaling_dict[window] * cls.widget_scaling)
+        else:
+            FontManager.update_named_fonts(window, cls.widget_scaling)
+
+        # phase 1: every widget updates its scaling values, sizes and fonts
+        cls.scaling_update_running = True
+        try:
+            # copy, because callbacks can get removed while iterating (widgets destroyed by callbacks)
+            for callback_key in list(cls.window_widgets_dict.get(window, ())):
+                set_scaling_callback = callback_key() if isinstance(callback_key, weakref.WeakMethod) else callback_key
+                if set_scaling_callback is None:
+                    continue  # widget is garbage collected, entry gets removed by the weakref callback
+
                 if not cls.deactivate_automatic_dpi_awareness:
                     set_scaling_callback(cls.window_dpi_scaling_dict[window] * cls.widget_scaling,
                                          cls.window_dpi_scaling_dict[window] * cls.spacing_scaling,
@@ -68,42 +125,47 @@ class ScalingTracker:
                     set_scaling_callback(cls.widget_scaling,
                                          cls.spacing_scaling,
                                          cls.window_scaling)
+        finally:
+            cls.scaling_update_running = False
+
+        # phase 2: re-apply the geometry manager calls with the new spacing scaling in one pass
+        pending_geometry_calls, cls.pending_geometry_calls = cls.pending_geometry_calls, []
+        for widget in pending_geometry_calls:
+            if widget.winfo_exists():
+                widget.apply_last_geometry_manager_call()
+
+        # phase 3: the widgets got marked dirty in the RedrawScheduler and get redrawn once at idle
 
     @classmethod
-    def update_scaling_callbacks_for_window(cls, window):
-        for set_scaling_callback in cls.window_widgets_dict[window]:
-            if not cls.deactivate_automatic_dpi_awareness:
-                set_scaling_callback(cls.window_dpi_scaling_dict[window] * cls.widget_scaling,
-                                     cls.window_dpi_scaling_dict[window] * cls.spacing_scaling,
-                                     cls.window_dpi_scaling_dict[window] * cls.window_scaling)
-            else:
-                set_scaling_callback(cls.widget_scaling,
-                                     cls.spacing_scaling,
-                                     cls.window_scaling)
+    def add_pending_geometry_call(cls, widget):
+        cls.pending_geometry_calls.append(widget)
 
     @classmethod
     def add_widget(cls, widget_callback: Callable, widget):
         window_root = cls.get_window_root_of_widget(widget)
-
-        if window_root not in cls.window_widgets_dict:
-            cls.window_widgets_dict[window_root] = [widget_callback]
-        else:
-            cls.window_widgets_dict[window_root].append(widget_callback)
+        cls.add_callback_to_window(widget_callback, window_root)
 
         if window_root not in cls.window_dpi_scaling_dict:
             cls.window_dpi_scaling_dict[window_root] = cls.get_window_dpi_scaling(window_root)
 
-        if not cls.update_loop_running:
-            window_root.after(100, cls.check_dpi_scaling)
-            cls.update_loop_running = True
+    @classmethod
+    def add_callback_to_window(cls, callback: Callable, window):
+        if window not in cls.window_widgets_dict:
+            cls.window_widgets_dict[window] = {}
+            cls.init_dpi_detection(window)
+        callback_dict = cls.window_widgets_dict[window]
+
+        def remove_dead_callback(callback_key):
+            callback_dict.pop(callback_key, None)
+
+        callback_key = cls.make_callback_key(callback, remove_dead_callback)
+        callback_dict[callback_key] = callback_key
 
     @classmethod
     def remove_widget(cls, widget_callback, widget):
         window_root = cls.get_window_root_of_widget(widget)
-        try:
-            cls.window_widgets_dict[window_root].remove(widget_callback)
-        except:
-            pass
+        if window_root in cls.window_widgets_dict:
+            cls.window_widgets_dict[window_root].pop(cls.make_callback_key(widget_callback), None)
 
     @classmethod
     def remove_window(cls, window_callback, window):
@@ -112,12 +174,18 @@ class ScalingTracker:
         except:
             pass
 
+        FontManager.remove_named_fonts(window)
+
+        after_id = cls.dpi_check_after_ids.pop(window, None)
+        if after_id is not None:
+            try:
+                window.after_cancel(after_id)
+            except Exception:
+                pass
+
     @classmethod
     def add_window(cls, window_callback, window):
-        if window not in cls.window_widgets_dict:
-            cls.window_widgets_dict[window] = [window_callback]
-        else:
-            cls.window_widgets_dict[window].append(window_callback)
+        cls.add_callback_to_window(window_callback, window)
 
         if window not in cls.window_dpi_scaling_dict:
             cls.window_dpi_scaling_dict[window] = cls.get_window_dpi_scaling(window)
@@ -160,22 +228,72 @@ class ScalingTracker:
         else:
             return 1
 
+    @classmethod
+    def has_dpi_source(cls) -> bool:
+        """ True if the DPI scaling of windows can be detected on this platform,
+            otherwise get_window_dpi_scaling() always returns 1 and no detection is needed """
+
+        return not cls.deactivate_automatic_dpi_awareness and sys.platform.startswith("win")
+
+    @classmethod
+    def init_dpi_detection(cls, window):
+        """ adds a bind tag to the window, so that <Configure> and <Map> events of the window itself
+            trigger a DPI check, without interfering with the bindings of the window """
+
+        if not cls.has_dpi_source():
+            return
+
+        try:
+            window.bind_class(cls.dpi_check_bind_tag, "<Configure>", cls.on_window_event)
+            window.bind_class(cls.dpi_check_bind_tag, "<Map>", cls.on_window_event)
+
+            if cls.dpi_check_bind_tag not in window.bindtags():
+                window.bindtags(window.bindtags() + (cls.dpi_check_bind_tag,))
+        except Exception:
+            pass
+
+    @classmethod
+    def on_window_event(cls, event):
+        cls.schedule_dpi_check(event.widget)
+
+    @classmethod
+    def schedule_dpi_check(cls, window):
+        """ (re)schedules the DPI check of the window, so that it runs only once after a series of events """
+
+        if window not in cls.window_widgets_dict:
+            return
+
+        after_id = cls.dpi_check_after_ids.get(window)
+        if after_id is not None:
+            window.after_cancel(after_id)
+
+        cls.dpi_check_after_ids[window] = window.after(cls.dpi_check_delay, cls.check_dpi_scaling_for_window, window)
+
+    @classmethod
+    def check_dpi_scaling_for_window(cls, window):
+        cls.dpi_check_after_ids.pop(window, None)
+
+        if window in cls.window_widgets_dict and window.winfo_exists():
+            cls.set_window_dpi_scaling(window, cls.get_window_dpi_scaling(window))
+
     @classmethod
     def check_dpi_scaling(cls):
-        # check for every window if scaling value changed
-        for window in cls.window_widgets_dict:
-            if window.winfo_exists():
-                current_dpi_scaling_value = cls.get_window_dpi_scaling(window)
-                if current_dpi_scaling_value != cls.window_dpi_scaling_dict[window]:
-                    cls.window_dpi_scaling_dict[window] = current_dpi_scaling_value
-                    cls.update_scaling_callbacks_for_window(window)
-
-        # find an existing tkinter object for the next call of .after()
-        for app in cls.window_widgets_dict.keys():
-            try:
-                app.after(cls.update_loop_interval, cls.check_dpi_scaling)
-                return
-            except Exception:
-                continue
+        """ checks for every window if the scaling value changed """
+
+        if not cls.has_dpi_source():
+            return
+
+        for window in list(cls.window_widgets_dict):
+            cls.check_dpi_scaling_for_window(window)
+
+    @classmethod
+    def set_window_dpi_scaling(cls, window, dpi_scaling: float):
+        """ sets the DPI scaling factor of a window, can be used to feed in DPI changes
+            on platforms without automatic detection """
+
+        window_root = cls.get_window_root_of_widget(window)
 
-        cls.update_loop_running = False
+        if dpi_scaling != cls.window_dpi_scaling_dict.get(window_root):
+            cls.window_dpi_scaling_dict[window_root] = dpi_scaling
+            if window_root in cls.window_widgets_dict:
+                cls.update_scaling_callbacks_for_window(window_root)
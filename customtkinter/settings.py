@@ -4,3 +4,4 @@ class Settings:
     deactivate_macos_window_header_manipulation = False
     deactivate_windows_window_header_manipulation = False
     use_dropdown_fallback = True
+    canvas_text_rendering = False  # default for CTkButton and CTkLabel: draw text and image as canvas items instead of tkinter.Label children
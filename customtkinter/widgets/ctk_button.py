@@ -1,5 +1,6 @@
 import tkinter
 import sys
+import math
 from typing import Union, Tuple, Callable
 
 from .ctk_canvas import CTkCanvas
@@ -32,6 +33,7 @@ class CTkButton(CTkBaseClass):
                  state: str = "normal",
                  command: Callable = None,
                  align_content="",
+                 canvas_text_rendering: bool = None,
                  **kwargs):
 
         # transfer basic functionality (bg_color, size, _appearance_mode, scaling) to CTkBaseClass
@@ -55,9 +57,16 @@ class CTkButton(CTkBaseClass):
         self.text_label = None
         self.text_font = (ThemeManager.theme["text"]["font"], ThemeManager.theme["text"]["size"]) if text_font == "default_theme" else text_font
 
+        # draw text and image as items on the canvas instead of labels in a content frame (no extra tkinter widgets)
+        self.canvas_text_rendering = Settings.canvas_text_rendering if canvas_text_rendering is None else canvas_text_rendering
+        self._measured_text = None  # (text, text_font, scaling) of the last text size measurement
+        self._text_size = (0, 0)  # scaled size of the text item
+        self._content_size = (0, 0)  # scaled size the canvas content needs, the canvas requests at least this size
+
         # callback and hover functionality
         self.command = command
         self.textvariable = textvariable
+        self.textvariable_callback_name = None
         self.state = state
         self.hover = hover
         self.compound = compound
@@ -81,7 +90,6 @@ class CTkButton(CTkBaseClass):
         self.canvas.bind("<Enter>", self.on_enter)
         self.canvas.bind("<Leave>", self.on_leave)
         self.canvas.bind("<Button-1>", self.clicked)
-        self.canvas.bind("<Button-1>", self.clicked)
         self.bind('<Configure>', self.update_dimensions_event)
 
         # configure cursor and initial draw
@@ -90,15 +98,30 @@ class CTkButton(CTkBaseClass):
         # set content alignment
         self.align_content = align_content
 
-        # create content frame (houses image and text)
-        self.content_frame = tkinter.Frame(master=self, height=0, width=0)
-        self.content_frame.bind("<Enter>", self.on_enter)
-        self.content_frame.bind("<Leave>", self.on_leave)
-        self.content_frame.bind("<Button-1>", self.clicked)
-        self.content_frame.bind("<Button-1>", self.clicked)
-        self.content_frame.configure(bg=ThemeManager.single_color(self.fg_color, self._appearance_mode))
+        if self.canvas_text_rendering:
+            self.content_frame = None
+
+            # canvas text items have no textvariable option, so the text gets updated by a trace callback
+            if self.textvariable is not None:
+                self.textvariable_callback_name = self.textvariable.trace_add("write", self.textvariable_callback)
+        else:
+            # create content frame (houses image and text)
+            self.content_frame = tkinter.Frame(master=self, height=0, width=0, bg=self.resolve_color("fg_color"))
+            self.content_frame.bind("<Enter>", self.on_enter)
+            self.content_frame.bind("<Leave>", self.on_leave)
+            self.content_frame.bind("<Button-1>", self.clicked)
+
+            # the labels are created right away, so text_label and image_label are available after __init__,
+            # only the drawing on the canvas and the colors are deferred until the widget gets mapped
+            self.draw_content_labels()
+
+        self.schedule_initial_draw()  # initial draw when mapped
+
+    def destroy(self):
+        if self.textvariable_callback_name is not None:
+            self.textvariable.trace_remove("write", self.textvariable_callback_name)
 
-        self.draw()  # initial draw
+        super().destroy()
 
     def configure_basic_grid(self):
         # Configuration of a grid system (2x2) in which all parts of CTkButton are centered
@@ -110,23 +133,31 @@ class CTkButton(CTkBaseClass):
     def set_scaling(self, *args, **kwargs):
         super().set_scaling(*args, **kwargs)
 
+        # rescale font in place, the label grid gets updated with the new padding on the next draw
         if self.text_label is not None:
-            self.text_label.destroy()
-            self.text_label = None
-        if self.image_label is not None:
-            self.image_label.destroy()
-            self.image_label = None
+            self.text_label.configure(font=self.apply_font_scaling(self.text_font))
 
-        self.canvas.configure(width=self.apply_widget_scaling(self._desired_width),
-                              height=self.apply_widget_scaling(self._desired_height))
-        self.draw()
+        self.update_canvas_size()
+        self.draw_after_scaling()
 
     def set_dimensions(self, width: int = None, height: int = None):
         super().set_dimensions(width, height)
 
-        self.canvas.configure(width=self.apply_widget_scaling(self._desired_width),
-                              height=self.apply_widget_scaling(self._desired_height))
-        self.draw()
+        self.update_canvas_size()
+        self.schedule_draw()
+
+    def update_canvas_size(self):
+        """ the canvas requests the desired size, or more if the canvas content needs more space,
+            so the button grows with long text or big images like the content frame with the labels does """
+
+        self.canvas.configure(width=max(self.apply_widget_scaling(self._desired_width), self._content_size[0]),
+                              height=max(self.apply_widget_scaling(self._desired_height), self._content_size[1]))
+
+    def set_content_size(self, width: float, height: float):
+        content_size = (math.ceil(width), math.ceil(height))
+        if content_size != self._content_size:
+            self._content_size = content_size
+            self.update_canvas_size()
 
     def draw(self, no_color_updates=False):
         requires_recoloring = self.draw_engine.draw_rounded_rect_with_border(self.apply_widget_scaling(self._current_width),
@@ -134,27 +165,40 @@ class CTkButton(CTkBaseClass):
                                                                              self.apply_widget_scaling(self.corner_radius),
                                                                              self.apply_widget_scaling(self.border_width))
 
-        if no_color_updates is False or requires_recoloring:
+        if self.canvas_text_rendering:
+            new_items_created = self.draw_canvas_content(raise_content=requires_recoloring)
+        else:
+            new_items_created = self.draw_content_labels()
 
-            self.canvas.configure(bg=ThemeManager.single_color(self.bg_color, self._appearance_mode))
+        if no_color_updates is False or requires_recoloring or new_items_created:
+            self.recolor()
 
-            # set color for the button border parts (outline)
-            self.canvas.itemconfig("border_parts",
-                                   outline=ThemeManager.single_color(self.border_color, self._appearance_mode),
-                                   fill=ThemeManager.single_color(self.border_color, self._appearance_mode))
+    def recolor(self):
+        self.canvas.configure(bg=self.resolve_color("bg_color"))
 
-            # set color for inner button parts
-            if self.fg_color is None:
-                self.canvas.itemconfig("inner_parts",
-                                       outline=ThemeManager.single_color(self.bg_color, self._appearance_mode),
-                                       fill=ThemeManager.single_color(self.bg_color, self._appearance_mode))
-            else:
-                self.canvas.itemconfig("inner_parts",
-                                       outline=ThemeManager.single_color(self.fg_color, self._appearance_mode),
-                                       fill=ThemeManager.single_color(self.fg_color, self._appearance_mode))
+        inner_color = self.resolve_color("bg_color" if self.fg_color is None else "fg_color")
+        text_color = self.resolve_color("text_color_disabled" if self.state == tkinter.DISABLED else "text_color")
+
+        # set color for the button border parts (outline) and inner button parts
+        tag_colors = {"border_parts": self.resolve_color("border_color"),
+                      "inner_parts": inner_color}
+        if self.canvas_text_rendering:
+            tag_colors["canvas_text"] = {"fill": text_color}
+        self.canvas.recolor_tags(tag_colors)
+
+        # set color for content frame and labels
+        if self.content_frame is not None:
+            self.content_frame.configure(bg=self.resolve_color("fg_color"))
+        if self.text_label is not None:
+            self.text_label.configure(fg=text_color, bg=inner_color)
+        if self.image_label is not None:
+            self.image_label.configure(bg=inner_color)
+
+    def draw_content_labels(self) -> bool:
+        """ creates or deletes the text and image label and places them in the content frame,
+            returns True if a label was created """
 
-            # set color for content frame
-            self.content_frame.configure(bg=ThemeManager.single_color(self.fg_color, self._appearance_mode))
+        labels_created = False
 
         # create text label if text given
         if self.text is not None and self.text != "":
@@ -167,21 +211,7 @@ class CTkButton(CTkBaseClass):
 
                 self.text_label.bind("<Enter>", self.on_enter)
                 self.text_label.bind("<Button-1>", self.clicked)
-                self.text_label.bind("<Button-1>", self.clicked)
-
-            if no_color_updates is False:
-                # set text_label fg color (text color)
-                self.text_label.configure(fg=ThemeManager.single_color(self.text_color, self._appearance_mode))
-
-                if self.state == tkinter.DISABLED:
-                    self.text_label.configure(fg=(ThemeManager.single_color(self.text_color_disabled, self._appearance_mode)))
-                else:
-                    self.text_label.configure(fg=ThemeManager.single_color(self.text_color, self._appearance_mode))
-
-                if self.fg_color is None:
-                    self.text_label.configure(bg=ThemeManager.single_color(self.bg_color, self._appearance_mode))
-                else:
-                    self.text_label.configure(bg=ThemeManager.single_color(self.fg_color, self._appearance_mode))
+                labels_created = True
 
         else:
             # delete text_label if no text given
@@ -197,14 +227,7 @@ class CTkButton(CTkBaseClass):
 
                 self.image_label.bind("<Enter>", self.on_enter)
                 self.image_label.bind("<Button-1>", self.clicked)
-                self.image_label.bind("<Button-1>", self.clicked)
-
-            if no_color_updates is False:
-                # set image_label bg color (background color of label)
-                if self.fg_color is None:
-                    self.image_label.configure(bg=ThemeManager.single_color(self.bg_color, self._appearance_mode))
-                else:
-                    self.image_label.configure(bg=ThemeManager.single_color(self.fg_color, self._appearance_mode))
+                labels_created = True
 
             self.image_label.configure(image=self.image)  # set image
 
@@ -263,10 +286,122 @@ class CTkButton(CTkBaseClass):
 
         # put central content onto frame
         self.content_frame.grid(row=0, column=0, rowspan=2, columnspan=2, sticky=self.align_content,
-                          padx=(max(self.apply_widget_scaling(self.corner_radius), self.apply_widget_scaling(self.border_width)),
-                                max(self.apply_widget_scaling(self.corner_radius), self.apply_widget_scaling(self.border_width))),
-                          pady=(self.apply_widget_scaling(self.border_width), self.apply_widget_scaling(self.border_width) + 1))
-        
+                                padx=(max(self.apply_widget_scaling(self.corner_radius), self.apply_widget_scaling(self.border_width)),
+                                      max(self.apply_widget_scaling(self.corner_radius), self.apply_widget_scaling(self.border_width))),
+                                pady=(self.apply_widget_scaling(self.border_width), self.apply_widget_scaling(self.border_width) + 1))
+
+        return labels_created
+
+    def draw_canvas_content(self, raise_content=False) -> bool:
+        """ draws text and image as canvas items, positioned like the labels of the content frame grid layout,
+            returns True if an item was created """
+
+        items_created = False
+        padding = 2  # padx and pady of the labels in the grid layout
+
+        # create or update text item if text given
+        if self.text is not None and self.text != "":
+            text = self.textvariable.get() if self.textvariable is not None else self.text
+
+            if not self.canvas.find_withtag("canvas_text"):
+                self.canvas.create_text(0, 0, tags="canvas_text", anchor=tkinter.CENTER)
+                items_created = True
+
+            self.canvas.itemconfig("canvas_text", text=text, font=self.apply_font_scaling(self.text_font))
+
+            # measure the text only if it changed, because bbox() is a round trip to tcl
+            if self._measured_text != (text, self.text_font, self._widget_scaling):
+                self._measured_text = (text, self.text_font, self._widget_scaling)
+                text_bbox = self.canvas.bbox("canvas_text")
+                self._text_size = (text_bbox[2] - text_bbox[0], text_bbox[3] - text_bbox[1]) if text_bbox is not None else (0, 0)
+            text_size = self._text_size
+        else:
+            self.canvas.delete("canvas_text")
+            text_size = None
+
+        # create or update image item if image given
+        if self.image is not None:
+            if not self.canvas.find_withtag("canvas_image"):
+                self.canvas.create_image(0, 0, tags="canvas_image", anchor=tkinter.CENTER)
+                items_created = True
+
+            self.canvas.itemconfig("canvas_image", image=self.image)
+            image_size = (self.image.width(), self.image.height())
+        else:
+            self.canvas.delete("canvas_image")
+            image_size = None
+
+        if text_size is None and image_size is None:
+            self.set_content_size(0, 0)
+            return items_created
+
+        # size of the content, the image and text are stacked according to compound
+        if text_size is not None and image_size is not None:
+            if self.compound in (tkinter.LEFT, tkinter.RIGHT):
+                content_width = image_size[0] + text_size[0] + 4 * padding
+                content_height = max(image_size[1], text_size[1]) + 2 * padding
+            else:
+                content_width = max(image_size[0], text_size[0]) + 2 * padding
+                content_height = image_size[1] + text_size[1] + 4 * padding
+        else:
+            single_size = text_size if text_size is not None else image_size
+            content_width, content_height = single_size[0] + 2 * padding, single_size[1] + 2 * padding
+
+        # area inside the border and the rounded corners, like the padding of the content frame
+        area_padx = max(self.apply_widget_scaling(self.corner_radius), self.apply_widget_scaling(self.border_width))
+        area_x_start, area_x_end = area_padx, self.apply_widget_scaling(self._current_width) - area_padx
+        area_y_start, area_y_end = self.apply_widget_scaling(self.border_width), self.apply_widget_scaling(self._current_height) - self.apply_widget_scaling(self.border_width) - 1
+
+        # if the content doesn't fit, the canvas requests more space and the button gets redrawn with the new size
+        self.set_content_size(content_width + 2 * area_padx, content_height + 2 * self.apply_widget_scaling(self.border_width) + 1)
+
+        # position of the content in the area according to align_content (sticky)
+        if "w" in self.align_content and "e" not in self.align_content:
+            content_x = area_x_start
+        elif "e" in self.align_content and "w" not in self.align_content:
+            content_x = area_x_end - content_width
+        else:
+            content_x = (area_x_start + area_x_end - content_width) / 2
+
+        if "n" in self.align_content and "s" not in self.align_content:
+            content_y = area_y_start
+        elif "s" in self.align_content and "n" not in self.align_content:
+            content_y = area_y_end - content_height
+        else:
+            content_y = (area_y_start + area_y_end - content_height) / 2
+
+        def stacked_x(item_width):
+            # horizontal position of vertically stacked items, which can stick to the left or right side
+            if self.align_content in ("e", "w"):
+                return content_x + padding + item_width / 2 if self.align_content == "w" else content_x + content_width - padding - item_width / 2
+            return content_x + content_width / 2
+
+        center_x, center_y = content_x + content_width / 2, content_y + content_height / 2
+
+        if text_size is not None and image_size is not None:
+            if self.compound == tkinter.LEFT:
+                self.canvas.coords("canvas_image", content_x + padding + image_size[0] / 2, center_y)
+                self.canvas.coords("canvas_text", content_x + content_width - padding - text_size[0] / 2, center_y)
+            elif self.compound == tkinter.RIGHT:
+                self.canvas.coords("canvas_text", content_x + padding + text_size[0] / 2, center_y)
+                self.canvas.coords("canvas_image", content_x + content_width - padding - image_size[0] / 2, center_y)
+            elif self.compound == tkinter.TOP:
+                self.canvas.coords("canvas_image", stacked_x(image_size[0]), content_y + padding + image_size[1] / 2)
+                self.canvas.coords("canvas_text", stacked_x(text_size[0]), content_y + content_height - padding - text_size[1] / 2)
+            elif self.compound == tkinter.BOTTOM:
+                self.canvas.coords("canvas_text", stacked_x(text_size[0]), content_y + padding + text_size[1] / 2)
+                self.canvas.coords("canvas_image", stacked_x(image_size[0]), content_y + content_height - padding - image_size[1] / 2)
+        elif text_size is not None:
+            self.canvas.coords("canvas_text", center_x, center_y)
+        else:
+            self.canvas.coords("canvas_image", center_x, center_y)
+
+        if raise_content or items_created:  # new parts were added -> keep text and image on top
+            self.canvas.tag_raise("canvas_image")
+            self.canvas.tag_raise("canvas_text")
+
+        return items_created
+
     def configure(self, require_redraw=False, **kwargs):
         if "text" in kwargs:
             self.text = kwargs.pop("text")
@@ -279,6 +414,8 @@ class CTkButton(CTkBaseClass):
             self.text_font = kwargs.pop("text_font")
             if self.text_label is not None:
                 self.text_label.configure(font=self.apply_font_scaling(self.text_font))
+            elif self.canvas_text_rendering:
+                require_redraw = True
 
         if "state" in kwargs:
             self.state = kwargs.pop("state")
@@ -317,9 +454,17 @@ class CTkButton(CTkBaseClass):
             self.command = kwargs.pop("command")
 
         if "textvariable" in kwargs:
+            if self.textvariable_callback_name is not None:
+                self.textvariable.trace_remove("write", self.textvariable_callback_name)
+                self.textvariable_callback_name = None
+
             self.textvariable = kwargs.pop("textvariable")
             if self.text_label is not None:
                 self.text_label.configure(textvariable=self.textvariable)
+            elif self.canvas_text_rendering:
+                if self.textvariable is not None:
+                    self.textvariable_callback_name = self.textvariable.trace_add("write", self.textvariable_callback)
+                require_redraw = True
 
         if "width" in kwargs:
             self.set_dimensions(width=kwargs.pop("width"))
@@ -343,6 +488,10 @@ class CTkButton(CTkBaseClass):
                 elif sys.platform.startswith("win") and self.command is not None and Settings.cursor_manipulation_enabled:
                     self.configure(cursor="hand2")
 
+    def textvariable_callback(self, var_name, index, mode):
+        if self.draw_canvas_content():
+            self.recolor()
+
     def set_image(self, image):
         """ will be removed in next major """
         self.configure(image=image)
@@ -354,50 +503,52 @@ class CTkButton(CTkBaseClass):
     def on_enter(self, event=None):
         if self.hover is True and self.state == tkinter.NORMAL:
             if self.hover_color is None:
-                inner_parts_color = self.fg_color
+                inner_parts_color = self.resolve_color("fg_color")
             else:
-                inner_parts_color = self.hover_color
+                inner_parts_color = self.resolve_color("hover_color")
 
             # set color of inner button parts to hover color
             self.canvas.itemconfig("inner_parts",
-                                   outline=ThemeManager.single_color(inner_parts_color, self._appearance_mode),
-                                   fill=ThemeManager.single_color(inner_parts_color, self._appearance_mode))
+                                   outline=inner_parts_color,
+                                   fill=inner_parts_color)
 
             # set text_label bg color to button hover color
             if self.text_label is not None:
-                self.text_label.configure(bg=ThemeManager.single_color(inner_parts_color, self._appearance_mode))
+                self.text_label.configure(bg=inner_parts_color)
 
             # set image_label bg color to button hover color
             if self.image_label is not None:
-                self.image_label.configure(bg=ThemeManager.single_color(inner_parts_color, self._appearance_mode))
+                self.image_label.configure(bg=inner_parts_color)
 
             # set content background to correct color
-            self.content_frame.configure(bg=ThemeManager.single_color(inner_parts_color, self._appearance_mode))
+            if self.content_frame is not None:
+                self.content_frame.configure(bg=inner_parts_color)
 
     def on_leave(self, event=None):
         self.click_animation_running = False
 
         if self.hover is True:
             if self.fg_color is None:
-                inner_parts_color = self.bg_color
+                inner_parts_color = self.resolve_color("bg_color")
             else:
-                inner_parts_color = self.fg_color
+                inner_parts_color = self.resolve_color("fg_color")
 
             # set color of inner button parts
             self.canvas.itemconfig("inner_parts",
-                                   outline=ThemeManager.single_color(inner_parts_color, self._appearance_mode),
-                                   fill=ThemeManager.single_color(inner_parts_color, self._appearance_mode))
+                                   outline=inner_parts_color,
+                                   fill=inner_parts_color)
 
             # set text_label bg color (label color)
             if self.text_label is not None:
-                self.text_label.configure(bg=ThemeManager.single_color(inner_parts_color, self._appearance_mode))
+                self.text_label.configure(bg=inner_parts_color)
 
             # set image_label bg color (image bg color)
             if self.image_label is not None:
-                self.image_label.configure(bg=ThemeManager.single_color(inner_parts_color, self._appearance_mode))
+                self.image_label.configure(bg=inner_parts_color)
 
             # set content background to correct color
-            self.content_frame.configure(bg=ThemeManager.single_color(inner_parts_color, self._appearance_mode))
+            if self.content_frame is not None:
+                self.content_frame.configure(bg=inner_parts_color)
 
     def click_animation(self):
         if self.click_animation_running:
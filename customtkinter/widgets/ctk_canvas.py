@@ -1,7 +1,46 @@
 import tkinter
 import sys
+import re
+from contextlib import contextmanager
 from typing import Union, Tuple
 
+from ..image_shape_renderer import ImageShapeRenderer
+
+
+class _BatchItemId(int):
+    """ placeholder id (negative) for an item whose creation is part of a not yet executed tcl batch script """
+    pass
+
+
+_TCL_SPECIAL_CHARACTERS = re.compile(r'([\\{}\[\]$";\s])')
+_TCL_ESCAPES = {"\n": "\\n", "\r": "\\r", "\t": "\\t"}
+
+
+def _tcl_quote(value) -> str:
+    """ converts value to a single word of a tcl script like tkinter does for command arguments,
+        tuples and lists become a tcl list """
+
+    if isinstance(value, (tuple, list)):
+        value = " ".join(_tcl_quote(element) for element in value)
+    else:
+        value = str(value)
+
+    if value == "":
+        return "{}"
+    return _TCL_SPECIAL_CHARACTERS.sub(lambda match: _TCL_ESCAPES.get(match.group(1), "\\" + match.group(1)), value)
+
+
+def _flatten_args(args) -> tuple:
+    """ flattens nested tuples and lists of create_<item>() arguments and drops None values """
+
+    flat_args = ()
+    for arg in args:
+        if isinstance(arg, (tuple, list)):
+            flat_args += _flatten_args(arg)
+        elif arg is not None:
+            flat_args += (arg,)
+    return flat_args
+
 
 class CTkCanvas(tkinter.Canvas):
     radius_to_char_fine: dict = None  # dict to map radius to font circle character
@@ -10,6 +49,31 @@ class CTkCanvas(tkinter.Canvas):
         super().__init__(*args, **kwargs)
         self.aa_circle_canvas_ids = set()
 
+        # python-side tag index, avoids gettags() and find_withtag() round trips to tcl
+        self._tag_to_ids: dict = {}  # tag -> set of item ids
+        self._id_to_tags: dict = {}  # item id -> set of tags
+
+        # last coords and options sent to tcl for every item, to drop writes that would not change anything
+        self._item_coords_cache: dict = {}  # item id -> coords tuple
+        self._item_options_cache: dict = {}  # item id -> dict of options
+        self.suppressed_calls_count = 0  # number of coords() and itemconfig() calls that were dropped
+
+        # item pool, shape parts that are not needed at the moment get hidden instead of deleted and re-created
+        self._hidden_item_ids: set = set()
+
+        # tcl batch script mode, collects canvas commands and executes them with a single tk.eval()
+        self._batch_commands: Union[list, None] = None  # list of (placeholder id or None, command words), None if no batch is running
+        self._batch_depth = 0
+        self._batch_placeholder_count = 0
+        self.batch_id_mapping: dict = {}  # placeholder id -> real item id, for the items created in the last (outermost) batch
+
+        # single image item for the 'image_shapes' drawing method, gets colored by itemconfig(<part tag>, fill=...)
+        self._image_shape_id: Union[int, None] = None
+        self._image_shape_spec: Union[tuple, None] = None
+        self._image_shape_colors: dict = {}  # part tag or 'bg' -> color
+        self._image_shape_image: Union[tkinter.PhotoImage, None] = None  # reference to the shown image, so it doesn't get garbage collected
+        self._image_shape_render_scheduled = False
+
     @classmethod
     def init_font_character_mapping(cls):
         """ optimizations made for Windows 10, 11 only """
@@ -43,6 +107,59 @@ class CTkCanvas(tkinter.Canvas):
         else:
             cls.radius_to_char_fine = radius_to_char_fine_windows_10
 
+    def configure(self, cnf=None, **kwargs):
+        background = kwargs.get("bg", kwargs.get("background"))
+        if background is None and isinstance(cnf, dict):
+            background = cnf.get("bg", cnf.get("background"))
+
+        if isinstance(background, str) and background != self._image_shape_colors.get("bg"):
+            self._image_shape_colors["bg"] = background
+            self._schedule_image_shape_render()
+
+        return super().configure(cnf, **kwargs)
+
+    config = configure
+
+    def set_image_shape(self, shape_spec: tuple, part_tags: Tuple[str, ...]) -> bool:
+        """ shows the shape described by shape_spec as a single pre-rendered image item (see ImageShapeRenderer),
+            the item gets the part_tags, so that it can be colored with itemconfig(<part tag>, fill=...)
+
+            returns bool if recoloring is necessary """
+
+        requires_recoloring = False
+
+        if self._image_shape_id is None:
+            self._image_shape_id = self.create_image(0, 0, anchor=tkinter.NW, tags=("ctk_image_shape",) + tuple(part_tags))
+            self.tag_lower("ctk_image_shape")
+            requires_recoloring = True
+
+        if shape_spec != self._image_shape_spec:
+            self._image_shape_spec = shape_spec
+            self._schedule_image_shape_render()
+
+        return requires_recoloring
+
+    def _schedule_image_shape_render(self):
+        """ colors get set one part tag after the other, so the rendering is done once at idle time """
+
+        if self._image_shape_id is not None and not self._image_shape_render_scheduled:
+            self._image_shape_render_scheduled = True
+            self.after_idle(self._render_image_shape)
+
+    def _render_image_shape(self):
+        self._image_shape_render_scheduled = False
+
+        if self._image_shape_id is None or self._image_shape_spec is None:
+            return
+
+        try:
+            image = ImageShapeRenderer.get_image(self, self._image_shape_spec, self._image_shape_colors)
+            if image is not self._image_shape_image:
+                self._image_shape_image = image
+                super().itemconfigure(self._image_shape_id, image=image)
+        except tkinter.TclError:
+            return  # canvas was destroyed in the meantime
+
     def get_char_from_radius(self, radius: int) -> str:
         if radius >= 20:
             return "A"
@@ -51,46 +168,431 @@ class CTkCanvas(tkinter.Canvas):
 
     def create_aa_circle(self, x_pos: int, y_pos: int, radius: int, angle: int = 0, fill: str = "white",
                          tags: Union[str, Tuple[str, ...]] = "", anchor: str = tkinter.CENTER) -> int:
-        # create a circle with a font element
+        # create a circle with a font element, the 'ctk_aa_circle_font_element' tag is added directly on creation
+        tags = self._normalize_tags(tags) + ("ctk_aa_circle_font_element",)
         circle_1 = self.create_text(x_pos, y_pos, text=self.get_char_from_radius(radius), anchor=anchor, fill=fill,
                                     font=("CustomTkinter_shapes_font", -radius * 2), tags=tags, angle=angle)
-        self.addtag_withtag("ctk_aa_circle_font_element", circle_1)
         self.aa_circle_canvas_ids.add(circle_1)
 
         return circle_1
 
+    def _normalize_tags(self, tags) -> Tuple[str, ...]:
+        """ convert tags argument (string, tuple or list) to tuple of single tags """
+
+        if tags is None:
+            return ()
+        elif isinstance(tags, str):
+            return tuple(self.tk.splitlist(tags))
+        else:
+            return tuple(str(tag) for tag in tags)
+
+    @contextmanager
+    def tcl_batch(self, enabled: bool = True):
+        """ context in which all create, coords, itemconfigure, delete, raise and lower commands are
+            collected into one tcl script, which is executed with a single tk.eval() at the end.
+            Item ids returned inside the context are placeholders, they get mapped to the real
+            ids after execution (see batch_id_mapping and resolve_item_id()). """
+
+        if not enabled:
+            yield
+            return
+
+        self._batch_depth += 1
+        if self._batch_commands is None:
+            self._batch_commands = []
+            self.batch_id_mapping = {}
+
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                try:
+                    self._flush_batch()
+                finally:
+                    self._batch_commands = None
+
+    def resolve_item_id(self, item_id: int) -> int:
+        """ returns the real item id for a placeholder id returned inside of tcl_batch() """
+
+        return self.batch_id_mapping.get(item_id, item_id)
+
+    def _add_to_batch(self, *words) -> bool:
+        """ adds canvas command to the running batch script, returns False if no batch is running """
+
+        if self._batch_commands is None:
+            return False
+        else:
+            self._batch_commands.append((None, words))
+            return True
+
+    def _tcl_word(self, word) -> str:
+        if isinstance(word, _BatchItemId):
+            if word in self.batch_id_mapping:
+                return str(self.batch_id_mapping[word])  # item was created by a script that was already executed
+            return f"$::ctk_batch_ids({-word})"  # reference to the id of an item created earlier in the same script
+        else:
+            return _tcl_quote(word)
+
+    def _flush_batch(self):
+        """ executes all collected commands as one tcl script and maps the placeholder ids to the real ids,
+            can happen several times during a batch (for example for complex tag searches) """
+
+        if not self._batch_commands:
+            return
+
+        commands, self._batch_commands = self._batch_commands, []
+        script_lines = ["unset -nocomplain ::ctk_batch_ids"]
+        placeholder_ids = []
+
+        for placeholder_id, words in commands:
+            command = " ".join(self._tcl_word(word) for word in (self._w,) + words)
+            if placeholder_id is None:
+                script_lines.append(command)
+            else:
+                script_lines.append(f"set ::ctk_batch_ids({-placeholder_id}) [{command}]")
+                placeholder_ids.append(placeholder_id)
+
+        script_lines.append("list " + " ".join(f"$::ctk_batch_ids({-placeholder_id})" for placeholder_id in placeholder_ids))
+
+        try:
+            real_ids = [self.tk.getint(real_id) for real_id in self.tk.splitlist(self.tk.eval("\n".join(script_lines)))]
+        except tkinter.TclError:
+            self._remove_ids_from_index(placeholder_ids)
+            raise
+
+        for placeholder_id, real_id in zip(placeholder_ids, real_ids):
+            self.batch_id_mapping[placeholder_id] = real_id
+            self._replace_id_in_index(placeholder_id, real_id)
+
+    def _replace_id_in_index(self, old_id: int, new_id: int):
+        tags = self._id_to_tags.pop(old_id, None)
+        if tags is None:
+            return  # item was already deleted again inside the batch
+
+        self._id_to_tags[new_id] = tags
+        for tag in tags:
+            tag_ids = self._tag_to_ids[tag]
+            tag_ids.discard(old_id)
+            tag_ids.add(new_id)
+
+        if old_id == self._image_shape_id:
+            self._image_shape_id = new_id
+        if old_id in self.aa_circle_canvas_ids:
+            self.aa_circle_canvas_ids.discard(old_id)
+            self.aa_circle_canvas_ids.add(new_id)
+        if old_id in self._hidden_item_ids:
+            self._hidden_item_ids.discard(old_id)
+            self._hidden_item_ids.add(new_id)
+        if old_id in self._item_coords_cache:
+            self._item_coords_cache[new_id] = self._item_coords_cache.pop(old_id)
+        if old_id in self._item_options_cache:
+            self._item_options_cache[new_id] = self._item_options_cache.pop(old_id)
+
+    def _create(self, item_type, args, kw):
+        """ every create_<item>() method calls _create(), so the tag index gets updated here """
+
+        if self._batch_commands is None:
+            item_id = super()._create(item_type, args, kw)
+        else:
+            flat_args = _flatten_args(args)
+            cnf = flat_args[-1]
+            if isinstance(cnf, (dict, tuple)):
+                flat_args = flat_args[:-1]
+            else:
+                cnf = {}
+
+            self._batch_placeholder_count += 1
+            item_id = _BatchItemId(-self._batch_placeholder_count)
+            self._batch_commands.append((item_id, ("create", item_type) + flat_args + self._options(cnf, kw)))
+
+        tags = ()
+        if args and isinstance(args[-1], dict) and "tags" in args[-1]:
+            tags = self._normalize_tags(args[-1]["tags"])
+        if kw is not None and "tags" in kw:
+            tags = self._normalize_tags(kw["tags"])
+
+        self._id_to_tags[item_id] = set(tags)
+        for tag in tags:
+            self._tag_to_ids.setdefault(tag, set()).add(item_id)
+
+        return item_id
+
+    def _find_ids(self, tag_or_id) -> Tuple[int, ...]:
+        """ find all item ids for a tag or id with the python-side tag index,
+            only complex tag expressions fall back to tkinter.Canvas.find_withtag() """
+
+        if isinstance(tag_or_id, int):
+            tag_or_id = self.batch_id_mapping.get(tag_or_id, tag_or_id)  # placeholder of an already executed batch script
+            return (tag_or_id,) if tag_or_id in self._id_to_tags else ()
+        elif isinstance(tag_or_id, str):
+            if tag_or_id.isdigit():
+                return self._find_ids(int(tag_or_id))
+            elif tag_or_id == "all":
+                return tuple(sorted(self._id_to_tags))
+            elif tag_or_id == "current" or any(c in tag_or_id for c in "&|^!()"):
+                self._flush_batch()
+                return super().find_withtag(tag_or_id)
+            elif tag_or_id in self._tag_to_ids:
+                return tuple(sorted(self._tag_to_ids[tag_or_id]))
+            else:
+                # index miss, the tag may have been set by a tkinter.Canvas call which bypasses the index
+                found_ids = super().find_withtag(tag_or_id)
+                for item_id in found_ids:
+                    self._id_to_tags.setdefault(item_id, set()).add(tag_or_id)
+                    self._tag_to_ids.setdefault(tag_or_id, set()).add(item_id)
+                return found_ids
+        else:
+            self._flush_batch()
+            return super().find_withtag(tag_or_id)
+
+    def find_withtag(self, tag_or_id):
+        """ inside of tcl_batch() the items are not created yet, so they are looked up in the tag index """
+
+        if self._batch_commands is not None:
+            return self._find_ids(tag_or_id)
+        else:
+            return super().find_withtag(tag_or_id)
+
+    def tag_lower(self, *args):
+        if not self._add_to_batch("lower", *args):
+            super().tag_lower(*args)
+
+    def tag_raise(self, *args):
+        if not self._add_to_batch("raise", *args):
+            super().tag_raise(*args)
+
+    def recolor_tags(self, tag_colors: dict):
+        """ bulk recolor: tag_colors maps tags to a color for fill and outline, or to a dict of options
+            (for items without outline option). All itemconfigure calls are executed as one tcl script,
+            calls with unchanged colors get dropped by the option cache. """
+
+        with self.tcl_batch():
+            for tag, color in tag_colors.items():
+                if isinstance(color, dict):
+                    self.itemconfig(tag, **color)
+                else:
+                    self.itemconfig(tag, fill=color, outline=color)
+
+    def set_items_hidden(self, hidden: bool, *tags):
+        """ hides the items with state=hidden and keeps them in the item pool of the canvas, or shows them again.
+            Re-shown items still have their coords and colors, so they need no new creation and no recoloring. """
+
+        for tag in tags:
+            item_ids = self._find_ids(tag)
+            if hidden:
+                changed_ids = [item_id for item_id in item_ids if item_id not in self._hidden_item_ids]
+                self._hidden_item_ids.update(changed_ids)
+            else:
+                changed_ids = [item_id for item_id in item_ids if item_id in self._hidden_item_ids]
+                self._hidden_item_ids.difference_update(changed_ids)
+
+            if len(changed_ids) > 0:
+                self._itemconfigure_or_batch(tag, {"state": "hidden" if hidden else "normal"})
+
+    def _set_tags_in_index(self, item_ids, tags: Tuple[str, ...]):
+        """ replaces the tags of the items in the index, after an itemconfigure() call with a tags option """
+
+        for item_id in item_ids:
+            for tag in self._id_to_tags.get(item_id, ()):
+                tag_ids = self._tag_to_ids.get(tag)
+                if tag_ids is not None:
+                    tag_ids.discard(item_id)
+                    if not tag_ids:
+                        del self._tag_to_ids[tag]
+
+            self._id_to_tags[item_id] = set(tags)
+            for tag in tags:
+                self._tag_to_ids.setdefault(tag, set()).add(item_id)
+
+    def _remove_ids_from_index(self, item_ids):
+        for item_id in item_ids:
+            for tag in self._id_to_tags.pop(item_id, ()):
+                tag_ids = self._tag_to_ids.get(tag)
+                if tag_ids is not None:
+                    tag_ids.discard(item_id)
+                    if not tag_ids:
+                        del self._tag_to_ids[tag]
+            self.aa_circle_canvas_ids.discard(item_id)
+            self._hidden_item_ids.discard(item_id)
+            if item_id == self._image_shape_id:
+                self._image_shape_id, self._image_shape_spec, self._image_shape_image = None, None, None
+            self._item_coords_cache.pop(item_id, None)
+            self._item_options_cache.pop(item_id, None)
+
+    def delete(self, *args):
+        deleted_ids = set()
+        for tag_or_id in args:
+            deleted_ids.update(self._find_ids(tag_or_id))
+
+        if not self._add_to_batch("delete", *args):
+            super().delete(*args)
+        self._remove_ids_from_index(deleted_ids)
+
+    def addtag(self, *args):
+        """ addtag_withtag(), addtag_above(), addtag_all(), ... all call addtag(newtag, search_spec, ...) """
+
+        newtag = str(args[0])
+
+        if len(args) == 3 and args[1] == "withtag":
+            if not self._add_to_batch("addtag", *args):
+                super().addtag(*args)
+            tagged_ids = self._find_ids(args[2])
+        else:
+            self._flush_batch()
+            super().addtag(*args)
+            tagged_ids = super().find_withtag(newtag)  # other search specs are resolved by tkinter itself
+
+        for item_id in tagged_ids:
+            self._id_to_tags.setdefault(item_id, set()).add(newtag)
+            self._tag_to_ids.setdefault(newtag, set()).add(item_id)
+
+    def dtag(self, *args):
+        tag_or_id = args[0]
+        tag_to_delete = str(args[1]) if len(args) > 1 else str(args[0])
+        affected_ids = self._find_ids(tag_or_id)
+
+        if not self._add_to_batch("dtag", *args):
+            super().dtag(*args)
+
+        for item_id in affected_ids:
+            self._id_to_tags.get(item_id, set()).discard(tag_to_delete)
+            tag_ids = self._tag_to_ids.get(tag_to_delete)
+            if tag_ids is not None:
+                tag_ids.discard(item_id)
+                if not tag_ids:
+                    del self._tag_to_ids[tag_to_delete]
+
+    def move(self, *args):
+        for item_id in self._find_ids(args[0]):
+            self._item_coords_cache.pop(item_id, None)
+        if not self._add_to_batch("move", *args):
+            super().move(*args)
+
+    def scale(self, *args):
+        for item_id in self._find_ids(args[0]):
+            self._item_coords_cache.pop(item_id, None)
+        if not self._add_to_batch("scale", *args):
+            super().scale(*args)
+
+    def itemconfigure(self, tag_or_id, cnf=None, **kw):
+        """ direct itemconfigure() calls bypass the option cache, so the cached options of the items get dropped """
+
+        item_ids = self._find_ids(tag_or_id)
+        for item_id in item_ids:
+            self._item_options_cache.pop(item_id, None)
+        self._flush_batch()
+        result = super().itemconfigure(tag_or_id, cnf, **kw)
+
+        options = {**cnf, **kw} if isinstance(cnf, dict) else kw
+        if "tags" in options:
+            self._set_tags_in_index(item_ids, self._normalize_tags(options["tags"]))
+        return result
+
     def coords(self, tag_or_id, *args):
+        item_ids = self._find_ids(tag_or_id)
 
-        if type(tag_or_id) == str and "ctk_aa_circle_font_element" in self.gettags(tag_or_id):
-            coords_id = self.find_withtag(tag_or_id)[0]  # take the lowest id for the given tag
-            super().coords(coords_id, *args[:2])
+        # drop the call if the item already has exactly these coordinates
+        if len(args) > 0:
+            new_coords = tuple(args[0]) if len(args) == 1 and isinstance(args[0], (tuple, list)) else args
 
-            if len(args) == 3:
-                super().itemconfigure(coords_id, font=("CustomTkinter_shapes_font", -int(args[2]) * 2), text=self.get_char_from_radius(args[2]))
+            if len(item_ids) == 1:
+                if self._item_coords_cache.get(item_ids[0]) == new_coords:
+                    self.suppressed_calls_count += 1
+                    return
+                self._item_coords_cache[item_ids[0]] = new_coords
+            else:
+                for item_id in item_ids:
+                    self._item_coords_cache.pop(item_id, None)
 
-        elif type(tag_or_id) == int and tag_or_id in self.aa_circle_canvas_ids:
-            super().coords(tag_or_id, *args[:2])
+        if len(item_ids) > 0 and "ctk_aa_circle_font_element" in self._id_to_tags.get(item_ids[0], ()):
+            coords_id = item_ids[0]  # take the lowest id for the given tag
+            if not self._add_to_batch("coords", coords_id, *args[:2]):
+                super().coords(coords_id, *args[:2])
 
             if len(args) == 3:
-                super().itemconfigure(tag_or_id, font=("CustomTkinter_shapes_font", -args[2] * 2), text=self.get_char_from_radius(args[2]))
+                font_options = {"font": ("CustomTkinter_shapes_font", -int(args[2]) * 2), "text": self.get_char_from_radius(args[2])}
+                if not self._add_to_batch("itemconfigure", coords_id, *self._options(font_options)):
+                    super().itemconfigure(coords_id, **font_options)
 
-        else:
-            super().coords(tag_or_id, *args)
+        elif len(args) == 0:
+            self._flush_batch()
+            return super().coords(tag_or_id)
+
+        elif len(item_ids) > 0:
+            if not self._add_to_batch("coords", tag_or_id, *args):
+                super().coords(tag_or_id, *args)
+
+    def _item_options_unchanged(self, item_id: int, options: dict) -> bool:
+        cached_options = self._item_options_cache.get(item_id)
+        if cached_options is None:
+            return False
+
+        for key, value in options.items():
+            if key not in cached_options or cached_options[key] != value:
+                return False
+        return True
 
     def itemconfig(self, tag_or_id, *args, **kwargs):
+        if len(args) > 0 and isinstance(args[0], dict):
+            kwargs = {**args[0], **kwargs}
+            args = args[1:]
+
+        if len(args) > 0 or len(kwargs) == 0:
+            self._flush_batch()
+            return super().itemconfigure(tag_or_id, *args, **kwargs)  # option query, no caching
+
         kwargs_except_outline = kwargs.copy()
         if "outline" in kwargs_except_outline:
             del kwargs_except_outline["outline"]
 
-        if type(tag_or_id) == int:
+        configure_ids = self._find_ids(tag_or_id)
+
+        if "tags" in kwargs:
+            self._set_tags_in_index(configure_ids, self._normalize_tags(kwargs["tags"]))
+
+        # the image shape item has no fill option, the color gets rendered into the image instead
+        if self._image_shape_id is not None and self._image_shape_id in configure_ids:
+            configure_ids = tuple(configure_id for configure_id in configure_ids if configure_id != self._image_shape_id)
+            if "fill" in kwargs and isinstance(tag_or_id, str):
+                if self._image_shape_colors.get(tag_or_id) == kwargs["fill"]:
+                    self.suppressed_calls_count += 1
+                else:
+                    self._image_shape_colors[tag_or_id] = kwargs["fill"]
+                    self._schedule_image_shape_render()
+
+            if len(configure_ids) > 0 and isinstance(tag_or_id, str):
+                tag_or_id = f"({tag_or_id})&&!ctk_image_shape"  # tag-level calls must not reach the image item
+
+        if len(configure_ids) == 0:
+            return  # no items with this tag, nothing to configure
+
+        # drop the call if every item already has these options
+        if all(self._item_options_unchanged(configure_id, kwargs_except_outline if configure_id in self.aa_circle_canvas_ids else kwargs)
+               for configure_id in configure_ids):
+            self.suppressed_calls_count += 1
+            return
+
+        for configure_id in configure_ids:
+            self._item_options_cache.setdefault(configure_id, {}).update(kwargs_except_outline if configure_id in self.aa_circle_canvas_ids else kwargs)
+
+        if isinstance(tag_or_id, int):
             if tag_or_id in self.aa_circle_canvas_ids:
-                super().itemconfigure(tag_or_id, *args, **kwargs_except_outline)
+                self._itemconfigure_or_batch(tag_or_id, kwargs_except_outline)
             else:
-                super().itemconfigure(tag_or_id, *args, **kwargs)
+                self._itemconfigure_or_batch(tag_or_id, kwargs)
         else:
-            configure_ids = self.find_withtag(tag_or_id)
-            for configure_id in configure_ids:
-                if configure_id in self.aa_circle_canvas_ids:
-                    super().itemconfigure(configure_id, *args, **kwargs_except_outline)
-                else:
-                    super().itemconfigure(configure_id, *args, **kwargs)
+            aa_circle_ids_count = sum(1 for configure_id in configure_ids if configure_id in self.aa_circle_canvas_ids)
+
+            if aa_circle_ids_count == 0 or "outline" not in kwargs:
+                self._itemconfigure_or_batch(tag_or_id, kwargs)
+            elif aa_circle_ids_count == len(configure_ids):
+                self._itemconfigure_or_batch(tag_or_id, kwargs_except_outline)
+            else:
+                # one tag-level call for the font circles (no outline option) and one for all other items
+                self._itemconfigure_or_batch(f"({tag_or_id})&&ctk_aa_circle_font_element", kwargs_except_outline)
+                self._itemconfigure_or_batch(f"({tag_or_id})&&!ctk_aa_circle_font_element", kwargs)
+
+    def _itemconfigure_or_batch(self, tag_or_id, options: dict):
+        if not self._add_to_batch("itemconfigure", tag_or_id, *self._options(options)):
+            super().itemconfigure(tag_or_id, **options)
@@ -0,0 +1,103 @@
+import tkinter
+from typing import Union, Tuple
+
+from .ctk_canvas import CTkCanvas
+
+
+class CTkCanvasItemGroup:
+    """
+    View on a part of a shared CTkCanvas, which can be passed to a DrawEngine instead of a canvas.
+    Every tag gets prefixed with the group tag, every created item additionally gets the group tag itself,
+    and all coordinates are shifted by the position of the group. So the DrawEngine routines can draw
+    many widgets on one canvas without their parts interfering, while they still draw at (0, 0).
+    """
+
+    def __init__(self, canvas: CTkCanvas, group_tag: str):
+        self.canvas = canvas
+        self.group_tag = group_tag
+        self.x = 0
+        self.y = 0
+
+    def _tag(self, tag_or_id: Union[str, int]) -> Union[str, int]:
+        if isinstance(tag_or_id, int):
+            return tag_or_id
+        else:
+            return f"{self.group_tag}.{tag_or_id}"
+
+    def _tags(self, tags) -> Tuple[str, ...]:
+        return tuple(self._tag(tag) for tag in self.canvas._normalize_tags(tags)) + (self.group_tag,)
+
+    def _shift_coords(self, coords: tuple) -> tuple:
+        if len(coords) == 1 and isinstance(coords[0], (tuple, list)):
+            coords = tuple(coords[0])
+
+        shifted_coords = tuple(coord + (self.x if index % 2 == 0 else self.y) for index, coord in enumerate(coords[:len(coords) - len(coords) % 2]))
+        return shifted_coords + coords[len(coords) - len(coords) % 2:]  # odd number of coords: (x, y, radius) of aa circle, radius is not shifted
+
+    def move_to(self, x: Union[int, float], y: Union[int, float]):
+        """ moves all items of the group to the new position """
+
+        if x != self.x or y != self.y:
+            self.canvas.move(self.group_tag, x - self.x, y - self.y)
+            self.x, self.y = x, y
+
+    def delete_all(self):
+        self.canvas.delete(self.group_tag)
+
+    def tcl_batch(self, enabled: bool = True):
+        return self.canvas.tcl_batch(enabled)
+
+    def find_withtag(self, tag_or_id):
+        return self.canvas.find_withtag(self._tag(tag_or_id))
+
+    def create_aa_circle(self, x_pos: int, y_pos: int, radius: int, angle: int = 0, fill: str = "white",
+                         tags: Union[str, Tuple[str, ...]] = "", anchor: str = tkinter.CENTER) -> int:
+        return self.canvas.create_aa_circle(x_pos + self.x, y_pos + self.y, radius, angle=angle, fill=fill, tags=self._tags(tags), anchor=anchor)
+
+    def create_rectangle(self, *args, tags="", **kwargs) -> int:
+        return self.canvas.create_rectangle(*self._shift_coords(args), tags=self._tags(tags), **kwargs)
+
+    def create_oval(self, *args, tags="", **kwargs) -> int:
+        return self.canvas.create_oval(*self._shift_coords(args), tags=self._tags(tags), **kwargs)
+
+    def create_polygon(self, *args, tags="", **kwargs) -> int:
+        return self.canvas.create_polygon(*self._shift_coords(args), tags=self._tags(tags), **kwargs)
+
+    def create_line(self, *args, tags="", **kwargs) -> int:
+        return self.canvas.create_line(*self._shift_coords(args), tags=self._tags(tags), **kwargs)
+
+    def create_text(self, *args, tags="", **kwargs) -> int:
+        return self.canvas.create_text(*self._shift_coords(args), tags=self._tags(tags), **kwargs)
+
+    def create_image(self, *args, tags="", **kwargs) -> int:
+        return self.canvas.create_image(*self._shift_coords(args), tags=self._tags(tags), **kwargs)
+
+    def coords(self, tag_or_id, *args):
+        if len(args) == 0:
+            return [coord - (self.x if index % 2 == 0 else self.y) for index, coord in enumerate(self.canvas.coords(self._tag(tag_or_id)))]
+        else:
+            return self.canvas.coords(self._tag(tag_or_id), *self._shift_coords(args))
+
+    def itemconfig(self, tag_or_id, *args, **kwargs):
+        return self.canvas.itemconfig(self._tag(tag_or_id), *args, **kwargs)
+
+    itemconfigure = itemconfig
+
+    def recolor_tags(self, tag_colors: dict):
+        self.canvas.recolor_tags({self._tag(tag): color for tag, color in tag_colors.items()})
+
+    def delete(self, *args):
+        self.canvas.delete(*[self._tag(tag_or_id) for tag_or_id in args])
+
+    def tag_lower(self, tag_or_id):
+        # only lower below the other items of the group, not below the items of the container or other groups
+        self.canvas.tag_lower(self._tag(tag_or_id), self.group_tag)
+
+    def tag_raise(self, tag_or_id):
+        self.canvas.tag_raise(self._tag(tag_or_id), self.group_tag)
+
+    def set_items_hidden(self, hidden: bool, *tags):
+        self.canvas.set_items_hidden(hidden, *[self._tag(tag) for tag in tags])
+
+    def bbox(self, tag_or_id):
+        return self.canvas.bbox(self._tag(tag_or_id))
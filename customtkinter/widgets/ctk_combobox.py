@@ -99,7 +99,7 @@ class CTkComboBox(CTkBaseClass):
         else:
             self.entry.insert(0, "CTkComboBox")
 
-        self.draw()  # initial draw
+        self.schedule_initial_draw()  # initial draw when mapped
 
         # event bindings
         self.canvas.tag_bind("right_parts", "<Enter>", self.on_enter)
@@ -125,14 +125,14 @@ class CTkComboBox(CTkBaseClass):
 
         self.canvas.configure(width=self.apply_widget_scaling(self._desired_width),
                               height=self.apply_widget_scaling(self._desired_height))
-        self.draw()
+        self.draw_after_scaling()
 
     def set_dimensions(self, width: int = None, height: int = None):
         super().set_dimensions(width, height)
 
         self.canvas.configure(width=self.apply_widget_scaling(self._desired_width),
                               height=self.apply_widget_scaling(self._desired_height))
-        self.draw()
+        self.schedule_draw()
 
     def draw(self, no_color_updates=False):
         left_section_width = self._current_width - self._current_height
@@ -147,33 +147,22 @@ class CTkComboBox(CTkBaseClass):
                                                                      self.apply_widget_scaling(self._current_height / 3))
 
         if no_color_updates is False or requires_recoloring or requires_recoloring_2:
+            self.recolor()
 
-            self.canvas.configure(bg=ThemeManager.single_color(self.bg_color, self._appearance_mode))
+    def recolor(self):
+        self.canvas.configure(bg=self.resolve_color("bg_color"))
 
-            self.canvas.itemconfig("inner_parts_left",
-                                   outline=ThemeManager.single_color(self.fg_color, self._appearance_mode),
-                                   fill=ThemeManager.single_color(self.fg_color, self._appearance_mode))
-            self.canvas.itemconfig("border_parts_left",
-                                   outline=ThemeManager.single_color(self.border_color, self._appearance_mode),
-                                   fill=ThemeManager.single_color(self.border_color, self._appearance_mode))
-            self.canvas.itemconfig("inner_parts_right",
-                                   outline=ThemeManager.single_color(self.border_color, self._appearance_mode),
-                                   fill=ThemeManager.single_color(self.border_color, self._appearance_mode))
-            self.canvas.itemconfig("border_parts_right",
-                                   outline=ThemeManager.single_color(self.border_color, self._appearance_mode),
-                                   fill=ThemeManager.single_color(self.border_color, self._appearance_mode))
-
-            self.entry.configure(bg=ThemeManager.single_color(self.fg_color, self._appearance_mode),
-                                 fg=ThemeManager.single_color(self.text_color, self._appearance_mode),
-                                 disabledforeground=ThemeManager.single_color(self.text_color_disabled, self._appearance_mode),
-                                 disabledbackground=ThemeManager.single_color(self.fg_color, self._appearance_mode))
+        arrow_color = "text_color_disabled" if self.state == tkinter.DISABLED else "text_color"
+        self.canvas.recolor_tags({"inner_parts_left": self.resolve_color("fg_color"),
+                                  "border_parts_left": self.resolve_color("border_color"),
+                                  "inner_parts_right": self.resolve_color("border_color"),
+                                  "border_parts_right": self.resolve_color("border_color"),
+                                  "dropdown_arrow": {"fill": self.resolve_color(arrow_color)}})
 
-            if self.state == tkinter.DISABLED:
-                self.canvas.itemconfig("dropdown_arrow",
-                                       fill=ThemeManager.single_color(self.text_color_disabled, self._appearance_mode))
-            else:
-                self.canvas.itemconfig("dropdown_arrow",
-                                       fill=ThemeManager.single_color(self.text_color, self._appearance_mode))
+        self.entry.configure(bg=self.resolve_color("fg_color"),
+                             fg=self.resolve_color("text_color"),
+                             disabledforeground=self.resolve_color("text_color_disabled"),
+                             disabledbackground=self.resolve_color("fg_color"))
 
     def open_dropdown_menu(self):
         self.dropdown_menu.open(self.winfo_rootx(),
@@ -245,11 +234,11 @@ class CTkComboBox(CTkBaseClass):
 
             # set color of inner button parts to hover color
             self.canvas.itemconfig("inner_parts_right",
-                                   outline=ThemeManager.single_color(self.button_hover_color, self._appearance_mode),
-                                   fill=ThemeManager.single_color(self.button_hover_color, self._appearance_mode))
+                                   outline=self.resolve_color("button_hover_color"),
+                                   fill=self.resolve_color("button_hover_color"))
             self.canvas.itemconfig("border_parts_right",
-                                   outline=ThemeManager.single_color(self.button_hover_color, self._appearance_mode),
-                                   fill=ThemeManager.single_color(self.button_hover_color, self._appearance_mode))
+                                   outline=self.resolve_color("button_hover_color"),
+                                   fill=self.resolve_color("button_hover_color"))
 
     def on_leave(self, event=0):
         if self.hover is True:
@@ -260,11 +249,11 @@ class CTkComboBox(CTkBaseClass):
 
             # set color of inner button parts
             self.canvas.itemconfig("inner_parts_right",
-                                   outline=ThemeManager.single_color(self.button_color, self._appearance_mode),
-                                   fill=ThemeManager.single_color(self.button_color, self._appearance_mode))
+                                   outline=self.resolve_color("button_color"),
+                                   fill=self.resolve_color("button_color"))
             self.canvas.itemconfig("border_parts_right",
-                                   outline=ThemeManager.single_color(self.button_color, self._appearance_mode),
-                                   fill=ThemeManager.single_color(self.button_color, self._appearance_mode))
+                                   outline=self.resolve_color("button_color"),
+                                   fill=self.resolve_color("button_color"))
 
     def dropdown_callback(self, value: str):
         if self.state == "readonly":
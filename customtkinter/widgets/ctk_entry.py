@@ -78,7 +78,7 @@ class CTkEntry(CTkBaseClass):
         self.entry.bind('<FocusIn>', self.entry_focus_in)
 
         self.activate_placeholder()
-        self.draw()
+        self.schedule_initial_draw()
 
     def set_scaling(self, *args, **kwargs):
         super().set_scaling( *args, **kwargs)
@@ -88,51 +88,44 @@ class CTkEntry(CTkBaseClass):
                         padx=self.apply_widget_scaling(self.corner_radius) if self.corner_radius >= 6 else self.apply_widget_scaling(6))
 
         self.canvas.configure(width=self.apply_widget_scaling(self._desired_width), height=self.apply_widget_scaling(self._desired_height))
-        self.draw()
+        self.draw_after_scaling()
 
     def set_dimensions(self, width=None, height=None):
         super().set_dimensions(width, height)
 
         self.canvas.configure(width=self.apply_widget_scaling(self._desired_width),
                               height=self.apply_widget_scaling(self._desired_height))
-        self.draw()
+        self.schedule_draw()
 
     def draw(self, no_color_updates=False):
-        self.canvas.configure(bg=ThemeManager.single_color(self.bg_color, self._appearance_mode))
-
         requires_recoloring = self.draw_engine.draw_rounded_rect_with_border(self.apply_widget_scaling(self._current_width),
                                                                              self.apply_widget_scaling(self._current_height),
                                                                              self.apply_widget_scaling(self.corner_radius),
                                                                              self.apply_widget_scaling(self.border_width))
 
         if requires_recoloring or no_color_updates is False:
-            if ThemeManager.single_color(self.fg_color, self._appearance_mode) is not None:
-                self.canvas.itemconfig("inner_parts",
-                                       fill=ThemeManager.single_color(self.fg_color, self._appearance_mode),
-                                       outline=ThemeManager.single_color(self.fg_color, self._appearance_mode))
-                self.entry.configure(bg=ThemeManager.single_color(self.fg_color, self._appearance_mode),
-                                     disabledbackground=ThemeManager.single_color(self.fg_color, self._appearance_mode),
-                                     highlightcolor=ThemeManager.single_color(self.fg_color, self._appearance_mode),
-                                     fg=ThemeManager.single_color(self.text_color, self._appearance_mode),
-                                     disabledforeground=ThemeManager.single_color(self.text_color, self._appearance_mode),
-                                     insertbackground=ThemeManager.single_color(self.text_color, self._appearance_mode))
-            else:
-                self.canvas.itemconfig("inner_parts",
-                                       fill=ThemeManager.single_color(self.bg_color, self._appearance_mode),
-                                       outline=ThemeManager.single_color(self.bg_color, self._appearance_mode))
-                self.entry.configure(bg=ThemeManager.single_color(self.bg_color, self._appearance_mode),
-                                     disabledbackground=ThemeManager.single_color(self.bg_color, self._appearance_mode),
-                                     highlightcolor=ThemeManager.single_color(self.bg_color, self._appearance_mode),
-                                     fg=ThemeManager.single_color(self.text_color, self._appearance_mode),
-                                     disabledforeground=ThemeManager.single_color(self.text_color, self._appearance_mode),
-                                     insertbackground=ThemeManager.single_color(self.text_color, self._appearance_mode))
-
-            self.canvas.itemconfig("border_parts",
-                                   fill=ThemeManager.single_color(self.border_color, self._appearance_mode),
-                                   outline=ThemeManager.single_color(self.border_color, self._appearance_mode))
+            self.recolor()
 
-            if self.placeholder_text_active:
-                self.entry.config(fg=ThemeManager.single_color(self.placeholder_text_color, self._appearance_mode))
+    def recolor(self):
+        self.canvas.configure(bg=self.resolve_color("bg_color"))
+
+        # inner parts and entry have the bg_color if the fg_color is None
+        if self.resolve_color("fg_color") is not None:
+            inner_color = self.resolve_color("fg_color")
+        else:
+            inner_color = self.resolve_color("bg_color")
+
+        self.canvas.recolor_tags({"inner_parts": inner_color,
+                                  "border_parts": self.resolve_color("border_color")})
+        self.entry.configure(bg=inner_color,
+                             disabledbackground=inner_color,
+                             highlightcolor=inner_color,
+                             fg=self.resolve_color("text_color"),
+                             disabledforeground=self.resolve_color("text_color"),
+                             insertbackground=self.resolve_color("text_color"))
+
+        if self.placeholder_text_active:
+            self.entry.config(fg=self.resolve_color("placeholder_text_color"))
 
     def bind(self, *args, **kwargs):
         self.entry.bind(*args, **kwargs)
@@ -209,7 +202,7 @@ class CTkEntry(CTkBaseClass):
             self.placeholder_text_active = True
 
             self.pre_placeholder_arguments = {"show": self.entry.cget("show")}
-            self.entry.config(fg=ThemeManager.single_color(self.placeholder_text_color, self._appearance_mode), show="")
+            self.entry.config(fg=self.resolve_color("placeholder_text_color"), show="")
             self.entry.delete(0, tkinter.END)
             self.entry.insert(0, self.placeholder_text)
 
@@ -217,7 +210,7 @@ class CTkEntry(CTkBaseClass):
         if self.placeholder_text_active:
             self.placeholder_text_active = False
 
-            self.entry.config(fg=ThemeManager.single_color(self.text_color, self._appearance_mode))
+            self.entry.config(fg=self.resolve_color("text_color"))
             self.entry.delete(0, tkinter.END)
             for argument, value in self.pre_placeholder_arguments.items():
                 self.entry[argument] = value
@@ -1,6 +1,7 @@
 from .ctk_canvas import CTkCanvas
 from ..theme_manager import ThemeManager
 from ..draw_engine import DrawEngine
+from ..bg_color_dispatcher import BgColorDispatcher
 from .widget_base_class import CTkBaseClass
 
 
@@ -41,15 +42,15 @@ class CTkFrame(CTkBaseClass):
         self.canvas = CTkCanvas(master=self,
                                 highlightthickness=0,
                                 width=self.apply_widget_scaling(self._current_width),
-                                height=self.apply_widget_scaling(self._current_height))
+                                height=self.apply_widget_scaling(self._current_height),
+                                bg=self.resolve_color("bg_color"))
         self.canvas.place(x=0, y=0, relwidth=1, relheight=1)
-        self.canvas.configure(bg=ThemeManager.single_color(self.bg_color, self._appearance_mode))
         self.draw_engine = DrawEngine(self.canvas)
         self._overwrite_preferred_drawing_method = overwrite_preferred_drawing_method
 
         self.bind('<Configure>', self.update_dimensions_event)
 
-        self.draw()
+        self.schedule_initial_draw()
 
     def winfo_children(self):
         """ winfo_children of CTkFrame without self.canvas widget,
@@ -66,14 +67,14 @@ class CTkFrame(CTkBaseClass):
         super().set_scaling(*args, **kwargs)
 
         self.canvas.configure(width=self.apply_widget_scaling(self._desired_width), height=self.apply_widget_scaling(self._desired_height))
-        self.draw()
+        self.draw_after_scaling()
 
     def set_dimensions(self, width=None, height=None):
         super().set_dimensions(width, height)
 
         self.canvas.configure(width=self.apply_widget_scaling(self._desired_width),
                               height=self.apply_widget_scaling(self._desired_height))
-        self.draw()
+        self.schedule_draw()
 
     def draw(self, no_color_updates=False):
 
@@ -84,32 +85,25 @@ class CTkFrame(CTkBaseClass):
                                                                              overwrite_preferred_drawing_method=self._overwrite_preferred_drawing_method)
 
         if no_color_updates is False or requires_recoloring:
-            if self.fg_color is None:
-                self.canvas.itemconfig("inner_parts",
-                                       fill=ThemeManager.single_color(self.bg_color, self._appearance_mode),
-                                       outline=ThemeManager.single_color(self.bg_color, self._appearance_mode))
-            else:
-                self.canvas.itemconfig("inner_parts",
-                                       fill=ThemeManager.single_color(self.fg_color, self._appearance_mode),
-                                       outline=ThemeManager.single_color(self.fg_color, self._appearance_mode))
-
-            self.canvas.itemconfig("border_parts",
-                                   fill=ThemeManager.single_color(self.border_color, self._appearance_mode),
-                                   outline=ThemeManager.single_color(self.border_color, self._appearance_mode))
-            self.canvas.configure(bg=ThemeManager.single_color(self.bg_color, self._appearance_mode))
+            self.recolor()
 
         self.canvas.tag_lower("inner_parts")
         self.canvas.tag_lower("border_parts")
 
+    def recolor(self):
+        inner_color = "bg_color" if self.fg_color is None else "fg_color"
+
+        self.canvas.recolor_tags({"inner_parts": self.resolve_color(inner_color),
+                                  "border_parts": self.resolve_color("border_color")})
+        self.canvas.configure(bg=self.resolve_color("bg_color"))
+
     def configure(self, require_redraw=False, **kwargs):
         if "fg_color" in kwargs:
             self.fg_color = kwargs.pop("fg_color")
             require_redraw = True
 
-            # check if CTk widgets are children of the frame and change their bg_color to new frame fg_color
-            for child in self.winfo_children():
-                if isinstance(child, CTkBaseClass):
-                    child.configure(bg_color=self.fg_color)
+            # change bg_color of the CTk widgets which are children of the frame to new frame fg_color
+            BgColorDispatcher.dispatch_bg_color(self, self.fg_color)
 
         if "border_color" in kwargs:
             self.border_color = kwargs.pop("border_color")
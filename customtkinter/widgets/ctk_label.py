@@ -3,11 +3,17 @@ import tkinter
 
 from .ctk_canvas import CTkCanvas
 from ..theme_manager import ThemeManager
+from ..settings import Settings
 from ..draw_engine import DrawEngine
 from .widget_base_class import CTkBaseClass
 
 
 class CTkLabel(CTkBaseClass):
+    # with canvas_text_rendering, these label options are passed to the canvas text item
+    text_item_option_names = ("textvariable", "wraplength", "justify", "underline", "state")
+    # with canvas_text_rendering, these label options apply to the whole widget and are passed to the frame
+    frame_option_names = ("cursor", "takefocus")
+
     def __init__(self, *args,
                  bg_color=None,
                  fg_color="default_theme",
@@ -18,6 +24,7 @@ class CTkLabel(CTkBaseClass):
                  text="CTkLabel",
                  text_font="default_theme",
                  anchor="center",  # label anchor: center, n, e, s, w
+                 canvas_text_rendering=None,
                  **kwargs):
 
         # transfer basic functionality (bg_color, size, _appearance_mode, scaling) to CTkBaseClass
@@ -51,37 +58,54 @@ class CTkLabel(CTkBaseClass):
         self.canvas.grid(row=0, column=0, sticky="nswe")
         self.draw_engine = DrawEngine(self.canvas)
 
-        self.text_label = tkinter.Label(master=self,
-                                        highlightthickness=0,
-                                        bd=0,
-                                        anchor=self.anchor,
-                                        text=self.text,
-                                        font=self.apply_font_scaling(self.text_font),
-                                        **kwargs)
-        text_label_grid_sticky = self.anchor if self.anchor != "center" else ""
-        self.text_label.grid(row=0, column=0, padx=self.apply_widget_scaling(self.corner_radius),
-                             sticky=text_label_grid_sticky)
+        # draw the text as item on the canvas instead of a tkinter.Label (no extra tkinter widget)
+        self.canvas_text_rendering = Settings.canvas_text_rendering if canvas_text_rendering is None else canvas_text_rendering
+        self.textvariable = None
+        self.textvariable_callback_name = None
+
+        if self.canvas_text_rendering:
+            self.text_label = None
+            self.text_item_options = {}  # options of text_item_option_names, passed to the text item instead of the label
+            self.configure_text_item(**kwargs)
+        else:
+            self.text_label = tkinter.Label(master=self,
+                                            highlightthickness=0,
+                                            bd=0,
+                                            anchor=self.anchor,
+                                            text=self.text,
+                                            font=self.apply_font_scaling(self.text_font),
+                                            **kwargs)
+            text_label_grid_sticky = self.anchor if self.anchor != "center" else ""
+            self.text_label.grid(row=0, column=0, padx=self.apply_widget_scaling(self.corner_radius),
+                                 sticky=text_label_grid_sticky)
 
         self.bind('<Configure>', self.update_dimensions_event)
-        self.draw()
+        self.schedule_initial_draw()
+
+    def destroy(self):
+        if self.textvariable_callback_name is not None:
+            self.textvariable.trace_remove("write", self.textvariable_callback_name)
+
+        super().destroy()
 
     def set_scaling(self, *args, **kwargs):
         super().set_scaling(*args, **kwargs)
 
         self.canvas.configure(width=self.apply_widget_scaling(self._desired_width), height=self.apply_widget_scaling(self._desired_height))
-        self.text_label.configure(font=self.apply_font_scaling(self.text_font))
-        text_label_grid_sticky = self.anchor if self.anchor != "center" else ""
-        self.text_label.grid(row=0, column=0, padx=self.apply_widget_scaling(self.corner_radius),
-                             sticky=text_label_grid_sticky)
+        if self.text_label is not None:
+            self.text_label.configure(font=self.apply_font_scaling(self.text_font))
+            text_label_grid_sticky = self.anchor if self.anchor != "center" else ""
+            self.text_label.grid(row=0, column=0, padx=self.apply_widget_scaling(self.corner_radius),
+                                 sticky=text_label_grid_sticky)
 
-        self.draw()
+        self.draw_after_scaling()
 
     def set_dimensions(self, width=None, height=None):
         super().set_dimensions(width, height)
 
         self.canvas.configure(width=self.apply_widget_scaling(self._desired_width),
                               height=self.apply_widget_scaling(self._desired_height))
-        self.draw()
+        self.schedule_draw()
 
     def draw(self, no_color_updates=False):
         requires_recoloring = self.draw_engine.draw_rounded_rect_with_border(self.apply_widget_scaling(self._current_width),
@@ -89,23 +113,95 @@ class CTkLabel(CTkBaseClass):
                                                                              self.apply_widget_scaling(self.corner_radius),
                                                                              0)
 
-        if no_color_updates is False or requires_recoloring:
-            if ThemeManager.single_color(self.fg_color, self._appearance_mode) is not None:
-                self.canvas.itemconfig("inner_parts",
-                                       fill=ThemeManager.single_color(self.fg_color, self._appearance_mode),
-                                       outline=ThemeManager.single_color(self.fg_color, self._appearance_mode))
+        text_item_created = False
+        if self.canvas_text_rendering:
+            text_item_created = self.draw_text_item(raise_text=requires_recoloring)
+
+        if no_color_updates is False or requires_recoloring or text_item_created:
+            self.recolor()
+
+    def recolor(self):
+        inner_color = "bg_color" if self.resolve_color("fg_color") is None else "fg_color"
+
+        tag_colors = {"inner_parts": self.resolve_color(inner_color)}
+        if self.canvas_text_rendering:
+            tag_colors["canvas_text"] = {"fill": self.resolve_color("text_color")}
+        self.canvas.recolor_tags(tag_colors)
+
+        if self.text_label is not None:
+            self.text_label.configure(fg=self.resolve_color("text_color"),
+                                      bg=self.resolve_color(inner_color))
+
+        self.canvas.configure(bg=self.resolve_color("bg_color"))
+
+    def draw_text_item(self, raise_text=False) -> bool:
+        """ draws the text as canvas item, positioned like the text_label with its anchor and the corner_radius as padx,
+            returns True if the text item was created """
+
+        text_item_created = False
+        if not self.canvas.find_withtag("canvas_text"):
+            self.canvas.create_text(0, 0, tags="canvas_text")
+            text_item_created = True
+
+        width, height = self.apply_widget_scaling(self._current_width), self.apply_widget_scaling(self._current_height)
+        if self.anchor in ("w", "nw", "sw"):
+            text_x = self.apply_widget_scaling(self.corner_radius)
+        elif self.anchor in ("e", "ne", "se"):
+            text_x = width - self.apply_widget_scaling(self.corner_radius)
+        else:
+            text_x = width / 2
 
-                self.text_label.configure(fg=ThemeManager.single_color(self.text_color, self._appearance_mode),
-                                          bg=ThemeManager.single_color(self.fg_color, self._appearance_mode))
+        if self.anchor in ("n", "nw", "ne"):
+            text_y = 0
+        elif self.anchor in ("s", "sw", "se"):
+            text_y = height
+        else:
+            text_y = height / 2
+
+        self.canvas.coords("canvas_text", text_x, text_y)
+        self.canvas.itemconfig("canvas_text",
+                               text=self.textvariable.get() if self.textvariable is not None else self.text,
+                               anchor=self.anchor,
+                               font=self.apply_font_scaling(self.text_font),
+                               **self.text_item_options)
+
+        if raise_text or text_item_created:  # new parts were added -> keep text on top
+            self.canvas.tag_raise("canvas_text")
+
+        return text_item_created
+
+    def configure_text_item(self, **kwargs):
+        """ passes label options to the canvas text item, textvariable is handled with a trace callback,
+            options of the whole widget go to the frame, all other options raise a ValueError """
+
+        unsupported_options = [key for key in kwargs if key not in self.text_item_option_names + self.frame_option_names]
+        if len(unsupported_options) > 0:
+            raise ValueError(f"{', '.join(unsupported_options)} not supported by {type(self).__name__} with canvas_text_rendering, " +
+                             f"supported label options are: {', '.join(self.text_item_option_names + self.frame_option_names)}")
+
+        frame_options = {key: kwargs.pop(key) for key in self.frame_option_names if key in kwargs}
+        if len(frame_options) > 0:
+            tkinter.Frame.configure(self, **frame_options)
+
+        if "textvariable" in kwargs:
+            if self.textvariable_callback_name is not None:
+                self.textvariable.trace_remove("write", self.textvariable_callback_name)
+                self.textvariable_callback_name = None
+
+            self.textvariable = kwargs.pop("textvariable")
+            if self.textvariable is not None and self.textvariable != "":
+                self.textvariable_callback_name = self.textvariable.trace_add("write", self.textvariable_callback)
             else:
-                self.canvas.itemconfig("inner_parts",
-                                       fill=ThemeManager.single_color(self.bg_color, self._appearance_mode),
-                                       outline=ThemeManager.single_color(self.bg_color, self._appearance_mode))
+                self.textvariable = None
+
+        if "wraplength" in kwargs:
+            kwargs["width"] = kwargs.pop("wraplength")  # the text item option for line wrapping is called width
 
-                self.text_label.configure(fg=ThemeManager.single_color(self.text_color, self._appearance_mode),
-                                          bg=ThemeManager.single_color(self.bg_color, self._appearance_mode))
+        self.text_item_options.update(kwargs)
 
-            self.canvas.configure(bg=ThemeManager.single_color(self.bg_color, self._appearance_mode))
+    def textvariable_callback(self, var_name, index, mode):
+        if self.draw_text_item():
+            self.recolor()
 
     def config(self, **kwargs):
         sys.stderr.write("Warning: Use .configure() instead of .config()")
@@ -114,18 +210,27 @@ class CTkLabel(CTkBaseClass):
     def configure(self, require_redraw=False, **kwargs):
         if "anchor" in kwargs:
             self.anchor = kwargs.pop("anchor")
-            text_label_grid_sticky = self.anchor if self.anchor != "center" else ""
-            self.text_label.grid(row=0, column=0, padx=self.apply_widget_scaling(self.corner_radius),
-                                 sticky=text_label_grid_sticky)
+            if self.text_label is not None:
+                text_label_grid_sticky = self.anchor if self.anchor != "center" else ""
+                self.text_label.grid(row=0, column=0, padx=self.apply_widget_scaling(self.corner_radius),
+                                     sticky=text_label_grid_sticky)
+            else:
+                require_redraw = True
 
         if "text" in kwargs:
             self.text = kwargs["text"]
-            self.text_label.configure(text=self.text)
+            if self.text_label is not None:
+                self.text_label.configure(text=self.text)
+            else:
+                require_redraw = True
             del kwargs["text"]
 
         if "text_font" in kwargs:
             self.text_font = kwargs.pop("text_font")
-            self.text_label.configure(font=self.apply_font_scaling(self.text_font))
+            if self.text_label is not None:
+                self.text_label.configure(font=self.apply_font_scaling(self.text_font))
+            else:
+                require_redraw = True
 
         if "fg_color" in kwargs:
             self.fg_color = kwargs["fg_color"]
@@ -145,15 +250,20 @@ class CTkLabel(CTkBaseClass):
             self.set_dimensions(height=kwargs["height"])
             del kwargs["height"]
 
+        if self.text_label is None and len(kwargs) > 0:
+            self.configure_text_item(**{key: value for key, value in kwargs.items() if key != "bg_color"})
+            kwargs = {"bg_color": kwargs["bg_color"]} if "bg_color" in kwargs else {}
+            require_redraw = True
+
         if "bg_color" in kwargs:
             super().configure(bg_color=kwargs.pop("bg_color"), require_redraw=require_redraw)
         else:
             super().configure(require_redraw=require_redraw)
 
-        self.text_label.configure(**kwargs)  # pass remaining kwargs to label
+        if self.text_label is not None:
+            self.text_label.configure(**kwargs)  # pass remaining kwargs to label
 
     def set_text(self, text):
         """ Will be removed in the next major release """
 
-        self.text = text
-        self.text_label.configure(text=self.text)
+        self.configure(text=text)
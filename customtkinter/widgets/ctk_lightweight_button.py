@@ -0,0 +1,172 @@
+import tkinter
+from typing import Union, Tuple, Callable
+
+from ..theme_manager import ThemeManager
+from .lightweight_widget_base_class import CTkLightweightBaseClass
+
+
+class CTkLightweightButton(CTkLightweightBaseClass):
+    """ button with border, rounded corners and hover effect, drawn on the canvas of a CTkLightweightCanvas """
+
+    def __init__(self, master,
+                 bg_color: Union[str, Tuple[str, str], None] = None,
+                 fg_color: Union[str, Tuple[str, str], None] = "default_theme",
+                 hover_color: Union[str, Tuple[str, str]] = "default_theme",
+                 border_color: Union[str, Tuple[str, str]] = "default_theme",
+                 text_color: Union[str, Tuple[str, str]] = "default_theme",
+                 text_color_disabled: Union[str, Tuple[str, str]] = "default_theme",
+                 width: int = 140,
+                 height: int = 28,
+                 corner_radius: Union[int, str] = "default_theme",
+                 border_width: Union[int, str] = "default_theme",
+                 text: str = "CTkLightweightButton",
+                 text_font: any = "default_theme",
+                 hover: bool = True,
+                 state: str = "normal",
+                 command: Callable = None):
+
+        # transfer basic functionality (bg_color, size, _appearance_mode, scaling) to CTkLightweightBaseClass
+        super().__init__(master, bg_color=bg_color, width=width, height=height)
+
+        # color
+        self.fg_color = ThemeManager.theme["color"]["button"] if fg_color == "default_theme" else fg_color
+        self.hover_color = ThemeManager.theme["color"]["button_hover"] if hover_color == "default_theme" else hover_color
+        self.border_color = ThemeManager.theme["color"]["button_border"] if border_color == "default_theme" else border_color
+        self.text_color = ThemeManager.theme["color"]["text"] if text_color == "default_theme" else text_color
+        self.text_color_disabled = ThemeManager.theme["color"]["text_button_disabled"] if text_color_disabled == "default_theme" else text_color_disabled
+
+        # shape
+        self.corner_radius = ThemeManager.theme["shape"]["button_corner_radius"] if corner_radius == "default_theme" else corner_radius
+        self.border_width = ThemeManager.theme["shape"]["button_border_width"] if border_width == "default_theme" else border_width
+
+        # text
+        self.text = text
+        self.text_font = (ThemeManager.theme["text"]["font"], ThemeManager.theme["text"]["size"]) if text_font == "default_theme" else text_font
+
+        # callback and hover functionality
+        self.command = command
+        self.state = state
+        self.hover = hover
+        self.hovered = False
+        self.click_animation_running = False
+
+    def get_cursor(self) -> str:
+        return self.get_pointer_cursor(self.command is not None and self.state == tkinter.NORMAL)
+
+    def get_inner_parts_color(self):
+        if self.hovered and self.hover is True and self.state == tkinter.NORMAL and self.hover_color is not None:
+            return self.resolve_color("hover_color")
+        elif self.fg_color is None:
+            return self.resolve_color("bg_color")
+        else:
+            return self.resolve_color("fg_color")
+
+    def rounded_rect_spec(self) -> tuple:
+        return (self.apply_widget_scaling(self._current_width), self.apply_widget_scaling(self._current_height),
+                self.apply_widget_scaling(self.corner_radius), self.apply_widget_scaling(self.border_width), self.draw_engine.preferred_drawing_method)
+
+    def draw(self, no_color_updates=False):
+        if not self._placed:
+            return  # items get created on place()
+
+        requires_recoloring = self.draw_rounded_rect()
+
+        if not self.item_group.find_withtag("text"):
+            self.item_group.create_text(0, 0, tags="text", anchor=tkinter.CENTER)
+            requires_recoloring = True
+
+        self.item_group.coords("text", self.apply_widget_scaling(self._current_width) / 2, self.apply_widget_scaling(self._current_height) / 2)
+        self.item_group.itemconfig("text", text=self.text, font=self.apply_font_scaling(self.text_font))
+
+        if requires_recoloring:  # new parts were added -> keep text on top
+            self.item_group.tag_raise("text")
+
+        if no_color_updates is False or requires_recoloring:
+            self.recolor()
+
+    def recolor(self):
+        if not self._placed:
+            return
+
+        text_color = "text_color_disabled" if self.state == tkinter.DISABLED else "text_color"
+        self.item_group.recolor_tags({"border_parts": self.resolve_color("border_color"),
+                                      "inner_parts": self.get_inner_parts_color(),
+                                      "text": {"fill": self.resolve_color(text_color)}})
+
+    def configure(self, require_redraw=False, **kwargs):
+        if "text" in kwargs:
+            self.text = kwargs.pop("text")
+            require_redraw = True
+
+        if "text_font" in kwargs:
+            self.text_font = kwargs.pop("text_font")
+            require_redraw = True
+
+        if "state" in kwargs:
+            self.state = kwargs.pop("state")
+            self.master.update_cursor()
+            require_redraw = True
+
+        if "corner_radius" in kwargs:
+            self.corner_radius = kwargs.pop("corner_radius")
+            require_redraw = True
+
+        if "border_width" in kwargs:
+            self.border_width = kwargs.pop("border_width")
+            require_redraw = True
+
+        if "fg_color" in kwargs:
+            self.fg_color = kwargs.pop("fg_color")
+            require_redraw = True
+
+        if "border_color" in kwargs:
+            self.border_color = kwargs.pop("border_color")
+            require_redraw = True
+
+        if "hover_color" in kwargs:
+            self.hover_color = kwargs.pop("hover_color")
+            require_redraw = True
+
+        if "text_color" in kwargs:
+            self.text_color = kwargs.pop("text_color")
+            require_redraw = True
+
+        if "hover" in kwargs:
+            self.hover = kwargs.pop("hover")
+
+        if "command" in kwargs:
+            self.command = kwargs.pop("command")
+            self.master.update_cursor()
+
+        super().configure(require_redraw=require_redraw, **kwargs)
+
+    def on_enter(self, event=None):
+        self.hovered = True
+        if self.hover is True and self.state == tkinter.NORMAL:
+            self.item_group.itemconfig("inner_parts",
+                                       outline=self.get_inner_parts_color(),
+                                       fill=self.get_inner_parts_color())
+
+    def on_leave(self, event=None):
+        self.hovered = False
+        self.click_animation_running = False
+
+        if self.hover is True:
+            self.item_group.itemconfig("inner_parts",
+                                       outline=self.get_inner_parts_color(),
+                                       fill=self.get_inner_parts_color())
+
+    def click_animation(self):
+        if self.click_animation_running:
+            self.on_enter()
+
+    def clicked(self, event=None):
+        if self.command is not None:
+            if self.state != tkinter.DISABLED:
+
+                # click animation: change color with .on_leave() and back to normal after 100ms with click_animation()
+                self.on_leave()
+                self.click_animation_running = True
+                self.master.after(100, self.click_animation)
+
+                self.command()
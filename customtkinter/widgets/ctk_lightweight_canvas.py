@@ -0,0 +1,122 @@
+from typing import Union, TYPE_CHECKING
+
+from ..draw_engine import DrawEngine
+from .ctk_frame import CTkFrame
+
+if TYPE_CHECKING:
+    from .lightweight_widget_base_class import CTkLightweightBaseClass
+
+
+class CTkLightweightCanvas(CTkFrame):
+    """ Frame which draws lightweight widgets (CTkLightweightButton, CTkLightweightLabel, CTkLightweightCheckBox,
+        CTkLightweightProgressBar) as tagged item groups on its own canvas, instead of creating several tkinter
+        widgets for every single one. Does the hit-testing and the dispatch of hover and click events. """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.lightweight_widgets: list = []  # in drawing order, the last one is on top
+        self._lightweight_widget_count = 0
+        self._hovered_widget: Union["CTkLightweightBaseClass", None] = None
+        self._current_cursor = ""
+        self._precomputed_layouts: dict = {}  # rounded rect spec -> layout, only filled during draw_lightweight_widgets()
+
+        self.canvas.bind("<Motion>", self._on_motion)
+        self.canvas.bind("<Leave>", self._on_canvas_leave)
+        self.canvas.bind("<Button-1>", self._on_click)
+
+    def add_lightweight_widget(self, widget: "CTkLightweightBaseClass") -> str:
+        """ registers widget and returns its group tag """
+
+        self._lightweight_widget_count += 1
+        self.lightweight_widgets.append(widget)
+        return f"ctk_lightweight_{self._lightweight_widget_count}"
+
+    def remove_lightweight_widget(self, widget: "CTkLightweightBaseClass"):
+        if widget in self.lightweight_widgets:
+            self.lightweight_widgets.remove(widget)
+        if widget is self._hovered_widget:
+            self._set_hovered_widget(None)
+
+    def lightweight_widget_at(self, x: Union[int, float], y: Union[int, float]) -> Union["CTkLightweightBaseClass", None]:
+        """ returns the topmost lightweight widget at x, y in canvas coordinates or None """
+
+        # the mouse mostly moves inside of the same widget, so check the hovered one first
+        if self._hovered_widget is not None and self._hovered_widget.contains(x, y):
+            return self._hovered_widget
+
+        for widget in reversed(self.lightweight_widgets):
+            if widget.contains(x, y):
+                return widget
+        return None
+
+    def _set_hovered_widget(self, widget: Union["CTkLightweightBaseClass", None], event=None):
+        if widget is not self._hovered_widget:
+            if self._hovered_widget is not None:
+                self._hovered_widget.on_leave(event)
+            self._hovered_widget = widget
+            if widget is not None:
+                widget.on_enter(event)
+
+        self.update_cursor()
+
+    def update_cursor(self):
+        cursor = self._hovered_widget.get_cursor() if self._hovered_widget is not None else ""
+        if cursor != self._current_cursor:
+            self._current_cursor = cursor
+            self.canvas.configure(cursor=cursor)
+
+    def _on_motion(self, event):
+        self._set_hovered_widget(self.lightweight_widget_at(event.x, event.y), event)
+
+    def _on_canvas_leave(self, event):
+        self._set_hovered_widget(None, event)
+
+    def _on_click(self, event):
+        widget = self.lightweight_widget_at(event.x, event.y)
+        if widget is not None:
+            widget.clicked(event)
+
+    def get_precomputed_layout(self, spec: tuple) -> Union[dict, None]:
+        return self._precomputed_layouts.get(spec)
+
+    def draw_lightweight_widgets(self):
+        """ draws all placed lightweight widgets, the rounded rect geometry of all of them is computed before
+            in one DrawEngine.compute_layouts() pass, in which equal widgets (like the cells of a grid) share one layout """
+
+        placed_widgets = [widget for widget in self.lightweight_widgets if widget.winfo_ismapped()]
+        specs = [spec for spec in (widget.rounded_rect_spec() for widget in placed_widgets) if spec is not None]
+        self._precomputed_layouts = dict(zip(specs, DrawEngine.compute_layouts(specs)))
+
+        try:
+            for widget in placed_widgets:
+                widget.draw()
+        finally:
+            self._precomputed_layouts = {}
+
+    def set_appearance_mode(self, mode_string):
+        super().set_appearance_mode(mode_string)
+
+        for widget in self.lightweight_widgets:
+            widget.set_appearance_mode(mode_string)
+
+    def set_scaling(self, *args, **kwargs):
+        super().set_scaling(*args, **kwargs)
+
+        for widget in self.lightweight_widgets:
+            widget.set_scaling(self._widget_scaling, self._spacing_scaling, redraw=False)
+        self.draw_lightweight_widgets()
+
+    def destroy(self):
+        self.lightweight_widgets.clear()
+        self._hovered_widget = None
+        super().destroy()
+
+    def configure(self, require_redraw=False, **kwargs):
+        if "fg_color" in kwargs:
+            # lightweight widgets have their bg_color from the fg_color of the CTkLightweightCanvas
+            for widget in self.lightweight_widgets:
+                if widget.bg_color == self.fg_color:
+                    widget.configure(bg_color=kwargs["fg_color"])
+
+        super().configure(require_redraw=require_redraw, **kwargs)
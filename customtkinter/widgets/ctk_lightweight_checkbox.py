@@ -0,0 +1,243 @@
+import tkinter
+from typing import Union, Tuple, Callable
+
+from ..theme_manager import ThemeManager
+from .lightweight_widget_base_class import CTkLightweightBaseClass
+
+
+class CTkLightweightCheckBox(CTkLightweightBaseClass):
+    """ checkbox with border, rounded corners and hover effect, drawn on the canvas of a CTkLightweightCanvas """
+
+    def __init__(self, master,
+                 bg_color: Union[str, Tuple[str, str], None] = None,
+                 fg_color: Union[str, Tuple[str, str]] = "default_theme",
+                 hover_color: Union[str, Tuple[str, str]] = "default_theme",
+                 border_color: Union[str, Tuple[str, str]] = "default_theme",
+                 border_width: Union[int, str] = "default_theme",
+                 checkmark_color: Union[str, Tuple[str, str]] = "default_theme",
+                 width: int = 24,
+                 height: int = 24,
+                 corner_radius: Union[int, str] = "default_theme",
+                 text_font: any = "default_theme",
+                 text_color: Union[str, Tuple[str, str]] = "default_theme",
+                 text: str = "CTkLightweightCheckBox",
+                 text_color_disabled: Union[str, Tuple[str, str]] = "default_theme",
+                 hover: bool = True,
+                 command: Callable = None,
+                 state: str = tkinter.NORMAL,
+                 onvalue=1,
+                 offvalue=0,
+                 variable: tkinter.Variable = None):
+
+        # transfer basic functionality (bg_color, size, _appearance_mode, scaling) to CTkLightweightBaseClass
+        super().__init__(master, bg_color=bg_color, width=width, height=height)
+
+        # color
+        self.fg_color = ThemeManager.theme["color"]["button"] if fg_color == "default_theme" else fg_color
+        self.hover_color = ThemeManager.theme["color"]["button_hover"] if hover_color == "default_theme" else hover_color
+        self.border_color = ThemeManager.theme["color"]["checkbox_border"] if border_color == "default_theme" else border_color
+        self.checkmark_color = ThemeManager.theme["color"]["checkmark"] if checkmark_color == "default_theme" else checkmark_color
+
+        # shape
+        self.corner_radius = ThemeManager.theme["shape"]["checkbox_corner_radius"] if corner_radius == "default_theme" else corner_radius
+        self.border_width = ThemeManager.theme["shape"]["checkbox_border_width"] if border_width == "default_theme" else border_width
+
+        # text
+        self.text = text
+        self.text_width = 0  # scaled width of the text item, the text is part of the clickable area
+        self._measured_text = None  # (text, text_font, scaling) of the last text_width measurement
+        self.text_color = ThemeManager.theme["color"]["text"] if text_color == "default_theme" else text_color
+        self.text_color_disabled = ThemeManager.theme["color"]["text_disabled"] if text_color_disabled == "default_theme" else text_color_disabled
+        self.text_font = (ThemeManager.theme["text"]["font"], ThemeManager.theme["text"]["size"]) if text_font == "default_theme" else text_font
+
+        # callback and hover functionality
+        self.command = command
+        self.state = state
+        self.hover = hover
+        self.hovered = False
+        self.check_state = False
+
+        self.onvalue = onvalue
+        self.offvalue = offvalue
+        self.variable: tkinter.Variable = variable
+        self.variable_callback_blocked = False
+        self.variable_callback_name = None
+
+        # register variable callback and set state according to variable
+        if self.variable is not None and self.variable != "":
+            self.variable_callback_name = self.variable.trace_add("write", self.variable_callback)
+            self.check_state = True if self.variable.get() == self.onvalue else False
+
+    def destroy(self):
+        if self.variable is not None:
+            self.variable.trace_remove("write", self.variable_callback_name)
+
+        super().destroy()
+
+    def contains(self, x: Union[int, float], y: Union[int, float]) -> bool:
+        if not self._placed:
+            return False
+
+        return (self.item_group.x <= x < self.item_group.x + self.apply_widget_scaling(self._current_width + 6) + self.text_width and
+                self.item_group.y <= y < self.item_group.y + self.apply_widget_scaling(self._current_height))
+
+    def get_cursor(self) -> str:
+        return self.get_pointer_cursor(self.state == tkinter.NORMAL)
+
+    def rounded_rect_spec(self) -> tuple:
+        return (self.apply_widget_scaling(self._current_width), self.apply_widget_scaling(self._current_height),
+                self.apply_widget_scaling(self.corner_radius), self.apply_widget_scaling(self.border_width), self.draw_engine.preferred_drawing_method)
+
+    def draw(self, no_color_updates=False):
+        if not self._placed:
+            return  # items get created on place()
+
+        requires_recoloring = self.draw_rounded_rect()
+
+        if self.check_state is True:
+            if self.draw_engine.draw_checkmark(self.apply_widget_scaling(self._current_width),
+                                               self.apply_widget_scaling(self._current_height),
+                                               self.apply_widget_scaling(self._current_height * 0.58)):
+                requires_recoloring = True  # new checkmark item
+        else:
+            self.item_group.delete("checkmark")
+
+        # text on the right side of the box, with 6 pixel spacing like CTkCheckBox
+        if not self.item_group.find_withtag("text"):
+            self.item_group.create_text(0, 0, tags="text", anchor=tkinter.W)
+            requires_recoloring = True
+        self.item_group.coords("text", self.apply_widget_scaling(self._current_width + 6), self.apply_widget_scaling(self._current_height) / 2)
+        self.item_group.itemconfig("text", text=self.text, font=self.apply_font_scaling(self.text_font))
+
+        # measure the text only if it changed, because bbox() is a round trip to tcl
+        if self._measured_text != (self.text, self.text_font, self._widget_scaling):
+            self._measured_text = (self.text, self.text_font, self._widget_scaling)
+            text_bbox = self.item_group.bbox("text")
+            self.text_width = text_bbox[2] - text_bbox[0] if text_bbox is not None else 0
+
+        if no_color_updates is False or requires_recoloring:
+            self.recolor()
+
+    def recolor(self):
+        if not self._placed:
+            return
+
+        hovered = self.hovered and self.hover is True and self.state == tkinter.NORMAL
+        if self.check_state is True:
+            inner_color = border_color = "hover_color" if hovered else "fg_color"
+        else:
+            inner_color = "hover_color" if hovered else "bg_color"
+            border_color = "border_color"
+
+        text_color = "text_color_disabled" if self.state == tkinter.DISABLED else "text_color"
+        self.item_group.recolor_tags({"text": {"fill": self.resolve_color(text_color)},
+                                      "checkmark": {"fill": self.resolve_color("checkmark_color")},
+                                      "inner_parts": self.resolve_color(inner_color),
+                                      "border_parts": self.resolve_color(border_color)})
+
+    def configure(self, require_redraw=False, **kwargs):
+        if "text" in kwargs:
+            self.text = kwargs.pop("text")
+            require_redraw = True
+
+        if "text_font" in kwargs:
+            self.text_font = kwargs.pop("text_font")
+            require_redraw = True
+
+        if "state" in kwargs:
+            self.state = kwargs.pop("state")
+            self.master.update_cursor()
+            require_redraw = True
+
+        if "fg_color" in kwargs:
+            self.fg_color = kwargs.pop("fg_color")
+            require_redraw = True
+
+        if "hover_color" in kwargs:
+            self.hover_color = kwargs.pop("hover_color")
+            require_redraw = True
+
+        if "text_color" in kwargs:
+            self.text_color = kwargs.pop("text_color")
+            require_redraw = True
+
+        if "border_color" in kwargs:
+            self.border_color = kwargs.pop("border_color")
+            require_redraw = True
+
+        if "checkmark_color" in kwargs:
+            self.checkmark_color = kwargs.pop("checkmark_color")
+            require_redraw = True
+
+        if "hover" in kwargs:
+            self.hover = kwargs.pop("hover")
+
+        if "command" in kwargs:
+            self.command = kwargs.pop("command")
+
+        if "variable" in kwargs:
+            if self.variable is not None and self.variable != "":
+                self.variable.trace_remove("write", self.variable_callback_name)  # remove old variable callback
+
+            self.variable = kwargs.pop("variable")
+
+            if self.variable is not None and self.variable != "":
+                self.variable_callback_name = self.variable.trace_add("write", self.variable_callback)
+                self.check_state = True if self.variable.get() == self.onvalue else False
+                require_redraw = True
+
+        super().configure(require_redraw=require_redraw, **kwargs)
+
+    def on_enter(self, event=None):
+        self.hovered = True
+        if self.hover is True and self.state == tkinter.NORMAL:
+            self.draw()
+
+    def on_leave(self, event=None):
+        self.hovered = False
+        if self.hover is True:
+            self.draw()
+
+    def clicked(self, event=None):
+        self.toggle()
+
+    def variable_callback(self, var_name, index, mode):
+        if not self.variable_callback_blocked:
+            if self.variable.get() == self.onvalue:
+                self.select(from_variable_callback=True)
+            elif self.variable.get() == self.offvalue:
+                self.deselect(from_variable_callback=True)
+
+    def toggle(self, event=None):
+        if self.state == tkinter.NORMAL:
+            self.check_state = not self.check_state
+            self.draw()
+
+            if self.variable is not None:
+                self.variable_callback_blocked = True
+                self.variable.set(self.onvalue if self.check_state is True else self.offvalue)
+                self.variable_callback_blocked = False
+
+            if self.command is not None:
+                self.command()
+
+    def select(self, from_variable_callback=False):
+        self.check_state = True
+        self.draw()
+
+        if self.variable is not None and not from_variable_callback:
+            self.variable_callback_blocked = True
+            self.variable.set(self.onvalue)
+            self.variable_callback_blocked = False
+
+    def deselect(self, from_variable_callback=False):
+        self.check_state = False
+        self.draw()
+
+        if self.variable is not None and not from_variable_callback:
+            self.variable_callback_blocked = True
+            self.variable.set(self.offvalue)
+            self.variable_callback_blocked = False
+
+    def get(self):
+        return self.onvalue if self.check_state is True else self.offvalue
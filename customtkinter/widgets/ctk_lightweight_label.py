@@ -0,0 +1,108 @@
+from typing import Union, Tuple
+
+from ..theme_manager import ThemeManager
+from .lightweight_widget_base_class import CTkLightweightBaseClass
+
+
+class CTkLightweightLabel(CTkLightweightBaseClass):
+    """ label with rounded corners, drawn on the canvas of a CTkLightweightCanvas """
+
+    def __init__(self, master,
+                 bg_color: Union[str, Tuple[str, str], None] = None,
+                 fg_color: Union[str, Tuple[str, str], None] = "default_theme",
+                 text_color: Union[str, Tuple[str, str]] = "default_theme",
+                 corner_radius: Union[int, str] = "default_theme",
+                 width: int = 140,
+                 height: int = 28,
+                 text: str = "CTkLightweightLabel",
+                 text_font: any = "default_theme",
+                 anchor: str = "center"):  # label anchor: center, n, e, s, w
+
+        # transfer basic functionality (bg_color, size, _appearance_mode, scaling) to CTkLightweightBaseClass
+        super().__init__(master, bg_color=bg_color, width=width, height=height)
+
+        # color
+        self.fg_color = ThemeManager.theme["color"]["label"] if fg_color == "default_theme" else fg_color
+        self.text_color = ThemeManager.theme["color"]["text"] if text_color == "default_theme" else text_color
+
+        # shape
+        self.corner_radius = ThemeManager.theme["shape"]["label_corner_radius"] if corner_radius == "default_theme" else corner_radius
+
+        # text
+        self.anchor = anchor
+        self.text = text
+        self.text_font = (ThemeManager.theme["text"]["font"], ThemeManager.theme["text"]["size"]) if text_font == "default_theme" else text_font
+
+    def rounded_rect_spec(self) -> tuple:
+        return (self.apply_widget_scaling(self._current_width), self.apply_widget_scaling(self._current_height),
+                self.apply_widget_scaling(self.corner_radius), 0, self.draw_engine.preferred_drawing_method)
+
+    def draw(self, no_color_updates=False):
+        if not self._placed:
+            return  # items get created on place()
+
+        requires_recoloring = self.draw_rounded_rect()
+
+        if not self.item_group.find_withtag("text"):
+            self.item_group.create_text(0, 0, tags="text")
+            requires_recoloring = True
+
+        # position of the text inside the label according to the anchor, with the corner_radius as horizontal padding
+        width, height = self.apply_widget_scaling(self._current_width), self.apply_widget_scaling(self._current_height)
+        if self.anchor in ("w", "nw", "sw"):
+            text_x = self.apply_widget_scaling(self.corner_radius)
+        elif self.anchor in ("e", "ne", "se"):
+            text_x = width - self.apply_widget_scaling(self.corner_radius)
+        else:
+            text_x = width / 2
+
+        if self.anchor in ("n", "nw", "ne"):
+            text_y = 0
+        elif self.anchor in ("s", "sw", "se"):
+            text_y = height
+        else:
+            text_y = height / 2
+
+        self.item_group.coords("text", text_x, text_y)
+        self.item_group.itemconfig("text", text=self.text, anchor=self.anchor, font=self.apply_font_scaling(self.text_font))
+
+        if requires_recoloring:  # new parts were added -> keep text on top
+            self.item_group.tag_raise("text")
+
+        if no_color_updates is False or requires_recoloring:
+            self.recolor()
+
+    def recolor(self):
+        if not self._placed:
+            return
+
+        inner_color = "bg_color" if self.resolve_color("fg_color") is None else "fg_color"
+        self.item_group.recolor_tags({"inner_parts": self.resolve_color(inner_color),
+                                      "text": {"fill": self.resolve_color("text_color")}})
+
+    def configure(self, require_redraw=False, **kwargs):
+        if "anchor" in kwargs:
+            self.anchor = kwargs.pop("anchor")
+            require_redraw = True
+
+        if "text" in kwargs:
+            self.text = kwargs.pop("text")
+            require_redraw = True
+
+        if "text_font" in kwargs:
+            self.text_font = kwargs.pop("text_font")
+            require_redraw = True
+
+        if "fg_color" in kwargs:
+            self.fg_color = kwargs.pop("fg_color")
+            require_redraw = True
+
+        if "text_color" in kwargs:
+            self.text_color = kwargs.pop("text_color")
+            require_redraw = True
+
+        if "corner_radius" in kwargs:
+            self.corner_radius = kwargs.pop("corner_radius")
+            require_redraw = True
+
+        super().configure(require_redraw=require_redraw, **kwargs)
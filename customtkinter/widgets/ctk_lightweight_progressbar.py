@@ -0,0 +1,135 @@
+import tkinter
+from typing import Union, Tuple
+
+from ..theme_manager import ThemeManager
+from .lightweight_widget_base_class import CTkLightweightBaseClass
+
+
+class CTkLightweightProgressBar(CTkLightweightBaseClass):
+    """ progressbar, values from 0 to 1, drawn on the canvas of a CTkLightweightCanvas """
+
+    def __init__(self, master,
+                 variable: tkinter.Variable = None,
+                 bg_color: Union[str, Tuple[str, str], None] = None,
+                 border_color: Union[str, Tuple[str, str]] = "default_theme",
+                 fg_color: Union[str, Tuple[str, str]] = "default_theme",
+                 progress_color: Union[str, Tuple[str, str]] = "default_theme",
+                 corner_radius: Union[int, str] = "default_theme",
+                 width: int = None,
+                 height: int = None,
+                 border_width: Union[int, str] = "default_theme",
+                 orient: str = "horizontal"):
+
+        # set default dimensions according to orientation
+        if width is None:
+            width = 8 if orient.lower() == "vertical" else 200
+        if height is None:
+            height = 200 if orient.lower() == "vertical" else 8
+
+        # transfer basic functionality (bg_color, size, _appearance_mode, scaling) to CTkLightweightBaseClass
+        super().__init__(master, bg_color=bg_color, width=width, height=height)
+
+        # color
+        self.border_color = ThemeManager.theme["color"]["progressbar_border"] if border_color == "default_theme" else border_color
+        self.fg_color = ThemeManager.theme["color"]["progressbar"] if fg_color == "default_theme" else fg_color
+        self.progress_color = ThemeManager.theme["color"]["progressbar_progress"] if progress_color == "default_theme" else progress_color
+
+        # control variable
+        self.variable = variable
+        self.variable_callback_blocked = False
+        self.variable_callback_name = None
+
+        # shape
+        self.corner_radius = ThemeManager.theme["shape"]["progressbar_corner_radius"] if corner_radius == "default_theme" else corner_radius
+        self.border_width = ThemeManager.theme["shape"]["progressbar_border_width"] if border_width == "default_theme" else border_width
+        self.determinate_value = 0.5  # range 0-1
+        self.orient = orient
+
+        if self.variable is not None:
+            self.variable_callback_name = self.variable.trace_add("write", self.variable_callback)
+            self.variable_callback_blocked = True
+            self.set(self.variable.get(), from_variable_callback=True)
+            self.variable_callback_blocked = False
+
+    def destroy(self):
+        if self.variable is not None:
+            self.variable.trace_remove("write", self.variable_callback_name)
+
+        super().destroy()
+
+    def draw(self, no_color_updates=False):
+        if not self._placed:
+            return  # items get created on place()
+
+        requires_recoloring = self.draw_engine.draw_rounded_progress_bar_with_border(self.apply_widget_scaling(self._current_width),
+                                                                                     self.apply_widget_scaling(self._current_height),
+                                                                                     self.apply_widget_scaling(self.corner_radius),
+                                                                                     self.apply_widget_scaling(self.border_width),
+                                                                                     0,
+                                                                                     self.determinate_value,
+                                                                                     "s" if self.orient.lower() == "vertical" else "w")
+
+        if no_color_updates is False or requires_recoloring:
+            self.recolor()
+
+    def recolor(self):
+        if not self._placed:
+            return
+
+        self.item_group.recolor_tags({"border_parts": self.resolve_color("border_color"),
+                                      "inner_parts": self.resolve_color("fg_color"),
+                                      "progress_parts": self.resolve_color("progress_color")})
+
+    def configure(self, require_redraw=False, **kwargs):
+        if "fg_color" in kwargs:
+            self.fg_color = kwargs.pop("fg_color")
+            require_redraw = True
+
+        if "border_color" in kwargs:
+            self.border_color = kwargs.pop("border_color")
+            require_redraw = True
+
+        if "progress_color" in kwargs:
+            self.progress_color = kwargs.pop("progress_color")
+            require_redraw = True
+
+        if "border_width" in kwargs:
+            self.border_width = kwargs.pop("border_width")
+            require_redraw = True
+
+        if "corner_radius" in kwargs:
+            self.corner_radius = kwargs.pop("corner_radius")
+            require_redraw = True
+
+        if "variable" in kwargs:
+            if self.variable is not None:
+                self.variable.trace_remove("write", self.variable_callback_name)
+
+            self.variable = kwargs.pop("variable")
+
+            if self.variable is not None and self.variable != "":
+                self.variable_callback_name = self.variable.trace_add("write", self.variable_callback)
+                self.set(self.variable.get(), from_variable_callback=True)
+            else:
+                self.variable = None
+
+        super().configure(require_redraw=require_redraw, **kwargs)
+
+    def variable_callback(self, var_name, index, mode):
+        if not self.variable_callback_blocked:
+            self.set(self.variable.get(), from_variable_callback=True)
+
+    def set(self, value, from_variable_callback=False):
+        """ set determinate value """
+        self.determinate_value = min(1, max(0, value))
+
+        self.draw(no_color_updates=True)
+
+        if self.variable is not None and not from_variable_callback:
+            self.variable_callback_blocked = True
+            self.variable.set(round(self.determinate_value) if isinstance(self.variable, tkinter.IntVar) else self.determinate_value)
+            self.variable_callback_blocked = False
+
+    def get(self):
+        """ get determinate value """
+        return self.determinate_value
@@ -120,7 +120,7 @@ class CTkOptionMenu(CTkBaseClass):
 
         self.bind('<Configure>', self.update_dimensions_event)
 
-        self.draw()  # initial draw
+        self.schedule_initial_draw()  # initial draw when mapped
 
         if self.variable is not None:
             self.variable_callback_name = self.variable.trace_add("write", self.variable_callback)
@@ -139,14 +139,14 @@ class CTkOptionMenu(CTkBaseClass):
 
         self.canvas.configure(width=self.apply_widget_scaling(self._desired_width),
                               height=self.apply_widget_scaling(self._desired_height))
-        self.draw()
+        self.draw_after_scaling()
 
     def set_dimensions(self, width: int = None, height: int = None):
         super().set_dimensions(width, height)
 
         self.canvas.configure(width=self.apply_widget_scaling(self._desired_width),
                               height=self.apply_widget_scaling(self._desired_height))
-        self.draw()
+        self.schedule_draw()
 
     def draw(self, no_color_updates=False):
         left_section_width = self._current_width - self._current_height
@@ -161,30 +161,20 @@ class CTkOptionMenu(CTkBaseClass):
                                                                      self.apply_widget_scaling(self._current_height / 3))
 
         if no_color_updates is False or requires_recoloring or requires_recoloring_2:
+            self.recolor()
 
-            self.canvas.configure(bg=ThemeManager.single_color(self.bg_color, self._appearance_mode))
-
-            self.canvas.itemconfig("inner_parts_left",
-                                   outline=ThemeManager.single_color(self.fg_color, self._appearance_mode),
-                                   fill=ThemeManager.single_color(self.fg_color, self._appearance_mode))
-            self.canvas.itemconfig("inner_parts_right",
-                                   outline=ThemeManager.single_color(self.button_color, self._appearance_mode),
-                                   fill=ThemeManager.single_color(self.button_color, self._appearance_mode))
-
-            self.text_label.configure(fg=ThemeManager.single_color(self.text_color, self._appearance_mode))
+        self.canvas.update_idletasks()
 
-            if self.state == tkinter.DISABLED:
-                self.text_label.configure(fg=(ThemeManager.single_color(self.text_color_disabled, self._appearance_mode)))
-                self.canvas.itemconfig("dropdown_arrow",
-                                       fill=ThemeManager.single_color(self.text_color_disabled, self._appearance_mode))
-            else:
-                self.text_label.configure(fg=ThemeManager.single_color(self.text_color, self._appearance_mode))
-                self.canvas.itemconfig("dropdown_arrow",
-                                       fill=ThemeManager.single_color(self.text_color, self._appearance_mode))
+    def recolor(self):
+        self.canvas.configure(bg=self.resolve_color("bg_color"))
 
-            self.text_label.configure(bg=ThemeManager.single_color(self.fg_color, self._appearance_mode))
+        text_color = "text_color_disabled" if self.state == tkinter.DISABLED else "text_color"
+        self.canvas.recolor_tags({"inner_parts_left": self.resolve_color("fg_color"),
+                                  "inner_parts_right": self.resolve_color("button_color"),
+                                  "dropdown_arrow": {"fill": self.resolve_color(text_color)}})
 
-        self.canvas.update_idletasks()
+        self.text_label.configure(fg=self.resolve_color(text_color),
+                                  bg=self.resolve_color("fg_color"))
 
     def open_dropdown_menu(self):
         self.dropdown_menu.open(self.winfo_rootx(),
@@ -267,15 +257,15 @@ class CTkOptionMenu(CTkBaseClass):
         if self.hover is True and self.state == tkinter.NORMAL and len(self.values) > 0:
             # set color of inner button parts to hover color
             self.canvas.itemconfig("inner_parts_right",
-                                   outline=ThemeManager.single_color(self.button_hover_color, self._appearance_mode),
-                                   fill=ThemeManager.single_color(self.button_hover_color, self._appearance_mode))
+                                   outline=self.resolve_color("button_hover_color"),
+                                   fill=self.resolve_color("button_hover_color"))
 
     def on_leave(self, event=0):
         if self.hover is True:
             # set color of inner button parts
             self.canvas.itemconfig("inner_parts_right",
-                                   outline=ThemeManager.single_color(self.button_color, self._appearance_mode),
-                                   fill=ThemeManager.single_color(self.button_color, self._appearance_mode))
+                                   outline=self.resolve_color("button_color"),
+                                   fill=self.resolve_color("button_color"))
 
     def variable_callback(self, var_name, index, mode):
         if not self.variable_callback_blocked:
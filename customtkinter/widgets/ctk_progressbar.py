@@ -76,7 +76,7 @@ class CTkProgressBar(CTkBaseClass):
         # Each time an item is resized due to pack position mode, the binding Configure is called on the widget
         self.bind('<Configure>', self.update_dimensions_event)
 
-        self.draw()  # initial draw
+        self.schedule_initial_draw()  # initial draw when mapped
 
         if self.variable is not None:
             self.variable_callback_name = self.variable.trace_add("write", self.variable_callback)
@@ -88,14 +88,14 @@ class CTkProgressBar(CTkBaseClass):
         super().set_scaling(*args, **kwargs)
 
         self.canvas.configure(width=self.apply_widget_scaling(self._desired_width), height=self.apply_widget_scaling(self._desired_height))
-        self.draw()
+        self.draw_after_scaling()
 
     def set_dimensions(self, width=None, height=None):
         super().set_dimensions(width, height)
 
         self.canvas.configure(width=self.apply_widget_scaling(self._desired_width),
                               height=self.apply_widget_scaling(self._desired_height))
-        self.draw()
+        self.schedule_draw()
 
     def destroy(self):
         if self.variable is not None:
@@ -133,16 +133,13 @@ class CTkProgressBar(CTkBaseClass):
                                                                                          orientation)
 
         if no_color_updates is False or requires_recoloring:
-            self.canvas.configure(bg=ThemeManager.single_color(self.bg_color, self._appearance_mode))
-            self.canvas.itemconfig("border_parts",
-                                   fill=ThemeManager.single_color(self.border_color, self._appearance_mode),
-                                   outline=ThemeManager.single_color(self.border_color, self._appearance_mode))
-            self.canvas.itemconfig("inner_parts",
-                                   fill=ThemeManager.single_color(self.fg_color, self._appearance_mode),
-                                   outline=ThemeManager.single_color(self.fg_color, self._appearance_mode))
-            self.canvas.itemconfig("progress_parts",
-                                   fill=ThemeManager.single_color(self.progress_color, self._appearance_mode),
-                                   outline=ThemeManager.single_color(self.progress_color, self._appearance_mode))
+            self.recolor()
+
+    def recolor(self):
+        self.canvas.configure(bg=self.resolve_color("bg_color"))
+        self.canvas.recolor_tags({"border_parts": self.resolve_color("border_color"),
+                                  "inner_parts": self.resolve_color("fg_color"),
+                                  "progress_parts": self.resolve_color("progress_color")})
 
     def configure(self, require_redraw=False, **kwargs):
         if "fg_color" in kwargs:
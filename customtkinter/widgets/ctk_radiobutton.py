@@ -103,7 +103,7 @@ class CTkRadioButton(CTkBaseClass):
             self.variable_callback_name = self.variable.trace_add("write", self.variable_callback)
             self.check_state = True if self.variable.get() == self.value else False
 
-        self.draw()  # initial draw
+        self.schedule_initial_draw()  # initial draw when mapped
         self.set_cursor()
 
     def set_scaling(self, *args, **kwargs):
@@ -114,7 +114,7 @@ class CTkRadioButton(CTkBaseClass):
 
         self.bg_canvas.configure(width=self.apply_widget_scaling(self._desired_width), height=self.apply_widget_scaling(self._desired_height))
         self.canvas.configure(width=self.apply_widget_scaling(self._desired_width), height=self.apply_widget_scaling(self._desired_height))
-        self.draw()
+        self.draw_after_scaling()
 
     def destroy(self):
         if self.variable is not None:
@@ -128,28 +128,22 @@ class CTkRadioButton(CTkBaseClass):
                                                                              self.apply_widget_scaling(self.corner_radius),
                                                                              self.apply_widget_scaling(self.border_width))
 
-        self.bg_canvas.configure(bg=ThemeManager.single_color(self.bg_color, self._appearance_mode))
-        self.canvas.configure(bg=ThemeManager.single_color(self.bg_color, self._appearance_mode))
+        self.recolor()
 
-        if self.check_state is False:
-            self.canvas.itemconfig("border_parts",
-                                   outline=ThemeManager.single_color(self.border_color, self._appearance_mode),
-                                   fill=ThemeManager.single_color(self.border_color, self._appearance_mode))
-        else:
-            self.canvas.itemconfig("border_parts",
-                                   outline=ThemeManager.single_color(self.fg_color, self._appearance_mode),
-                                   fill=ThemeManager.single_color(self.fg_color, self._appearance_mode))
+    def recolor(self):
+        self.bg_canvas.configure(bg=self.resolve_color("bg_color"))
+        self.canvas.configure(bg=self.resolve_color("bg_color"))
 
-        self.canvas.itemconfig("inner_parts",
-                               outline=ThemeManager.single_color(self.bg_color, self._appearance_mode),
-                               fill=ThemeManager.single_color(self.bg_color, self._appearance_mode))
+        border_color = "border_color" if self.check_state is False else "fg_color"
+        self.canvas.recolor_tags({"border_parts": self.resolve_color(border_color),
+                                  "inner_parts": self.resolve_color("bg_color")})
 
         if self.state == tkinter.DISABLED:
-            self.text_label.configure(fg=ThemeManager.single_color(self.text_color_disabled, self._appearance_mode))
+            self.text_label.configure(fg=self.resolve_color("text_color_disabled"))
         else:
-            self.text_label.configure(fg=ThemeManager.single_color(self.text_color, self._appearance_mode))
+            self.text_label.configure(fg=self.resolve_color("text_color"))
 
-        self.text_label.configure(bg=ThemeManager.single_color(self.bg_color, self._appearance_mode))
+        self.text_label.configure(bg=self.resolve_color("bg_color"))
 
     def configure(self, require_redraw=False, **kwargs):
         if "text" in kwargs:
@@ -230,19 +224,19 @@ class CTkRadioButton(CTkBaseClass):
     def on_enter(self, event=0):
         if self.hover is True and self.state == tkinter.NORMAL:
             self.canvas.itemconfig("border_parts",
-                                   fill=ThemeManager.single_color(self.hover_color, self._appearance_mode),
-                                   outline=ThemeManager.single_color(self.hover_color, self._appearance_mode))
+                                   fill=self.resolve_color("hover_color"),
+                                   outline=self.resolve_color("hover_color"))
 
     def on_leave(self, event=0):
         if self.hover is True:
             if self.check_state is True:
                 self.canvas.itemconfig("border_parts",
-                                       fill=ThemeManager.single_color(self.fg_color, self._appearance_mode),
-                                       outline=ThemeManager.single_color(self.fg_color, self._appearance_mode))
+                                       fill=self.resolve_color("fg_color"),
+                                       outline=self.resolve_color("fg_color"))
             else:
                 self.canvas.itemconfig("border_parts",
-                                       fill=ThemeManager.single_color(self.border_color, self._appearance_mode),
-                                       outline=ThemeManager.single_color(self.border_color, self._appearance_mode))
+                                       fill=self.resolve_color("border_color"),
+                                       outline=self.resolve_color("border_color"))
 
     def variable_callback(self, var_name, index, mode):
         if not self.variable_callback_blocked:
@@ -68,20 +68,20 @@ class CTkScrollbar(CTkBaseClass):
         self.canvas.bind("<MouseWheel>", self.mouse_scroll_event)
         self.bind('<Configure>', self.update_dimensions_event)
 
-        self.draw()
+        self.schedule_initial_draw()
 
     def set_scaling(self, *args, **kwargs):
         super().set_scaling(*args, **kwargs)
 
         self.canvas.configure(width=self.apply_widget_scaling(self._desired_width), height=self.apply_widget_scaling(self._desired_height))
-        self.draw(no_color_updates=True)
+        self.draw_after_scaling()
 
     def set_dimensions(self, width=None, height=None):
         super().set_dimensions(width, height)
 
         self.canvas.configure(width=self.apply_widget_scaling(self._desired_width),
                               height=self.apply_widget_scaling(self._desired_height))
-        self.draw(no_color_updates=True)
+        self.schedule_draw(no_color_updates=True)
 
     def get_scrollbar_values_for_minimum_pixel_size(self):
         # correct scrollbar float values if scrollbar is too small
@@ -118,28 +118,18 @@ class CTkScrollbar(CTkBaseClass):
                                                                       self.orientation)
 
         if no_color_updates is False or requires_recoloring:
-            if self.hover_state is True:
-                self.canvas.itemconfig("scrollbar_parts",
-                                       fill=ThemeManager.single_color(self.scrollbar_hover_color, self._appearance_mode),
-                                       outline=ThemeManager.single_color(self.scrollbar_hover_color, self._appearance_mode))
-            else:
-                self.canvas.itemconfig("scrollbar_parts",
-                                       fill=ThemeManager.single_color(self.scrollbar_color, self._appearance_mode),
-                                       outline=ThemeManager.single_color(self.scrollbar_color, self._appearance_mode))
-
-            if self.fg_color is None:
-                self.canvas.configure(bg=ThemeManager.single_color(self.bg_color, self._appearance_mode))
-                self.canvas.itemconfig("border_parts",
-                                       fill=ThemeManager.single_color(self.bg_color, self._appearance_mode),
-                                       outline=ThemeManager.single_color(self.bg_color, self._appearance_mode))
-            else:
-                self.canvas.configure(bg=ThemeManager.single_color(self.fg_color, self._appearance_mode))
-                self.canvas.itemconfig("border_parts",
-                                       fill=ThemeManager.single_color(self.fg_color, self._appearance_mode),
-                                       outline=ThemeManager.single_color(self.fg_color, self._appearance_mode))
+            self.recolor()
 
         self.canvas.update_idletasks()
 
+    def recolor(self):
+        scrollbar_color = "scrollbar_hover_color" if self.hover_state is True else "scrollbar_color"
+        border_color = "bg_color" if self.fg_color is None else "fg_color"
+
+        self.canvas.configure(bg=self.resolve_color(border_color))
+        self.canvas.recolor_tags({"scrollbar_parts": self.resolve_color(scrollbar_color),
+                                  "border_parts": self.resolve_color(border_color)})
+
     def set(self, start_value: float, end_value: float):
         self.start_value = float(start_value)
         self.end_value = float(end_value)
@@ -192,14 +182,14 @@ class CTkScrollbar(CTkBaseClass):
         if self.hover is True:
             self.hover_state = True
             self.canvas.itemconfig("scrollbar_parts",
-                                   outline=ThemeManager.single_color(self.scrollbar_hover_color, self._appearance_mode),
-                                   fill=ThemeManager.single_color(self.scrollbar_hover_color, self._appearance_mode))
+                                   outline=self.resolve_color("scrollbar_hover_color"),
+                                   fill=self.resolve_color("scrollbar_hover_color"))
 
     def on_leave(self, event=0):
         self.hover_state = False
         self.canvas.itemconfig("scrollbar_parts",
-                               outline=ThemeManager.single_color(self.scrollbar_color, self._appearance_mode),
-                               fill=ThemeManager.single_color(self.scrollbar_color, self._appearance_mode))
+                               outline=self.resolve_color("scrollbar_color"),
+                               fill=self.resolve_color("scrollbar_color"))
 
     def clicked(self, event):
         if self.orientation == "vertical":
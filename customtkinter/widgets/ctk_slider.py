@@ -97,7 +97,7 @@ class CTkSlider(CTkBaseClass):
         self.bind('<Configure>', self.update_dimensions_event)
 
         self.set_cursor()
-        self.draw()  # initial draw
+        self.schedule_initial_draw()  # initial draw when mapped
 
         if self.variable is not None:
             self.variable_callback_name = self.variable.trace_add("write", self.variable_callback)
@@ -109,14 +109,14 @@ class CTkSlider(CTkBaseClass):
         super().set_scaling(*args, **kwargs)
 
         self.canvas.configure(width=self.apply_widget_scaling(self._desired_width), height=self.apply_widget_scaling(self._desired_height))
-        self.draw()
+        self.draw_after_scaling()
 
     def set_dimensions(self, width=None, height=None):
         super().set_dimensions(width, height)
 
         self.canvas.configure(width=self.apply_widget_scaling(self._desired_width),
                               height=self.apply_widget_scaling(self._desired_height))
-        self.draw()
+        self.schedule_draw()
 
     def destroy(self):
         # remove variable_callback from variable callbacks if variable exists
@@ -155,33 +155,18 @@ class CTkSlider(CTkBaseClass):
                                                                                           self.value, orientation)
 
         if no_color_updates is False or requires_recoloring:
-            self.canvas.configure(bg=ThemeManager.single_color(self.bg_color, self._appearance_mode))
+            self.recolor()
 
-            if self.border_color is None:
-                self.canvas.itemconfig("border_parts", fill=ThemeManager.single_color(self.bg_color, self._appearance_mode),
-                                       outline=ThemeManager.single_color(self.bg_color, self._appearance_mode))
-            else:
-                self.canvas.itemconfig("border_parts", fill=ThemeManager.single_color(self.border_color, self._appearance_mode),
-                                       outline=ThemeManager.single_color(self.border_color, self._appearance_mode))
-
-            self.canvas.itemconfig("inner_parts", fill=ThemeManager.single_color(self.fg_color, self._appearance_mode),
-                                   outline=ThemeManager.single_color(self.fg_color, self._appearance_mode))
+    def recolor(self):
+        self.canvas.configure(bg=self.resolve_color("bg_color"))
 
-            if self.progress_color is None:
-                self.canvas.itemconfig("progress_parts", fill=ThemeManager.single_color(self.fg_color, self._appearance_mode),
-                                       outline=ThemeManager.single_color(self.fg_color, self._appearance_mode))
-            else:
-                self.canvas.itemconfig("progress_parts", fill=ThemeManager.single_color(self.progress_color, self._appearance_mode),
-                                       outline=ThemeManager.single_color(self.progress_color, self._appearance_mode))
-
-            if self.hover_state is True:
-                self.canvas.itemconfig("slider_parts",
-                                       fill=ThemeManager.single_color(self.button_hover_color, self._appearance_mode),
-                                       outline=ThemeManager.single_color(self.button_hover_color, self._appearance_mode))
-            else:
-                self.canvas.itemconfig("slider_parts",
-                                       fill=ThemeManager.single_color(self.button_color, self._appearance_mode),
-                                       outline=ThemeManager.single_color(self.button_color, self._appearance_mode))
+        border_color = "bg_color" if self.border_color is None else "border_color"
+        progress_color = "fg_color" if self.progress_color is None else "progress_color"
+        slider_color = "button_hover_color" if self.hover_state is True else "button_color"
+        self.canvas.recolor_tags({"border_parts": self.resolve_color(border_color),
+                                  "inner_parts": self.resolve_color("fg_color"),
+                                  "progress_parts": self.resolve_color(progress_color),
+                                  "slider_parts": self.resolve_color(slider_color)})
 
     def clicked(self, event=None):
         if self.state == "normal":
@@ -212,14 +197,14 @@ class CTkSlider(CTkBaseClass):
         if self.state == "normal":
             self.hover_state = True
             self.canvas.itemconfig("slider_parts",
-                                   fill=ThemeManager.single_color(self.button_hover_color, self._appearance_mode),
-                                   outline=ThemeManager.single_color(self.button_hover_color, self._appearance_mode))
+                                   fill=self.resolve_color("button_hover_color"),
+                                   outline=self.resolve_color("button_hover_color"))
 
     def on_leave(self, event=0):
         self.hover_state = False
         self.canvas.itemconfig("slider_parts",
-                               fill=ThemeManager.single_color(self.button_color, self._appearance_mode),
-                               outline=ThemeManager.single_color(self.button_color, self._appearance_mode))
+                               fill=self.resolve_color("button_color"),
+                               outline=self.resolve_color("button_color"))
 
     def round_to_step_size(self, value):
         if self.number_of_steps is not None:
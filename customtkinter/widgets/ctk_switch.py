@@ -108,7 +108,7 @@ class CTkSwitch(CTkBaseClass):
             self.variable_callback_name = self.variable.trace_add("write", self.variable_callback)
             self.check_state = True if self.variable.get() == self.onvalue else False
 
-        self.draw()  # initial draw
+        self.schedule_initial_draw()  # initial draw when mapped
         self.set_cursor()
 
     def set_scaling(self, *args, **kwargs):
@@ -119,7 +119,7 @@ class CTkSwitch(CTkBaseClass):
 
         self.bg_canvas.configure(width=self.apply_widget_scaling(self._desired_width), height=self.apply_widget_scaling(self._desired_height))
         self.canvas.configure(width=self.apply_widget_scaling(self._desired_width), height=self.apply_widget_scaling(self._desired_height))
-        self.draw()
+        self.draw_after_scaling()
 
     def destroy(self):
         # remove variable_callback from variable callbacks if variable exists
@@ -170,35 +170,30 @@ class CTkSwitch(CTkBaseClass):
                                                                                               0, "w")
 
         if no_color_updates is False or requires_recoloring:
-            self.bg_canvas.configure(bg=ThemeManager.single_color(self.bg_color, self._appearance_mode))
-            self.canvas.configure(bg=ThemeManager.single_color(self.bg_color, self._appearance_mode))
-
-            if self.border_color is None:
-                self.canvas.itemconfig("border_parts", fill=ThemeManager.single_color(self.bg_color, self._appearance_mode),
-                                       outline=ThemeManager.single_color(self.bg_color, self._appearance_mode))
-            else:
-                self.canvas.itemconfig("border_parts", fill=ThemeManager.single_color(self.border_color, self._appearance_mode),
-                                       outline=ThemeManager.single_color(self.border_color, self._appearance_mode))
+            self.recolor()
+        else:
+            self.recolor_text_label()
 
-            self.canvas.itemconfig("inner_parts", fill=ThemeManager.single_color(self.fg_color, self._appearance_mode),
-                                   outline=ThemeManager.single_color(self.fg_color, self._appearance_mode))
+    def recolor(self):
+        self.bg_canvas.configure(bg=self.resolve_color("bg_color"))
+        self.canvas.configure(bg=self.resolve_color("bg_color"))
 
-            if self.progress_color is None:
-                self.canvas.itemconfig("progress_parts", fill=ThemeManager.single_color(self.fg_color, self._appearance_mode),
-                                       outline=ThemeManager.single_color(self.fg_color, self._appearance_mode))
-            else:
-                self.canvas.itemconfig("progress_parts", fill=ThemeManager.single_color(self.progress_color, self._appearance_mode),
-                                       outline=ThemeManager.single_color(self.progress_color, self._appearance_mode))
+        border_color = "bg_color" if self.border_color is None else "border_color"
+        progress_color = "fg_color" if self.progress_color is None else "progress_color"
+        self.canvas.recolor_tags({"border_parts": self.resolve_color(border_color),
+                                  "inner_parts": self.resolve_color("fg_color"),
+                                  "progress_parts": self.resolve_color(progress_color),
+                                  "slider_parts": self.resolve_color("button_color")})
 
-            self.canvas.itemconfig("slider_parts", fill=ThemeManager.single_color(self.button_color, self._appearance_mode),
-                                   outline=ThemeManager.single_color(self.button_color, self._appearance_mode))
+        self.recolor_text_label()
 
+    def recolor_text_label(self):
         if self.state == tkinter.DISABLED:
-            self.text_label.configure(fg=(ThemeManager.single_color(self.text_color_disabled, self._appearance_mode)))
+            self.text_label.configure(fg=(self.resolve_color("text_color_disabled")))
         else:
-            self.text_label.configure(fg=ThemeManager.single_color(self.text_color, self._appearance_mode))
+            self.text_label.configure(fg=self.resolve_color("text_color"))
 
-        self.text_label.configure(bg=ThemeManager.single_color(self.bg_color, self._appearance_mode))
+        self.text_label.configure(bg=self.resolve_color("bg_color"))
 
     def toggle(self, event=None):
         if self.state is not tkinter.DISABLED:
@@ -246,13 +241,13 @@ class CTkSwitch(CTkBaseClass):
         self.hover_state = True
 
         if self.state is not tkinter.DISABLED:
-            self.canvas.itemconfig("slider_parts", fill=ThemeManager.single_color(self.button_hover_color, self._appearance_mode),
-                                   outline=ThemeManager.single_color(self.button_hover_color, self._appearance_mode))
+            self.canvas.itemconfig("slider_parts", fill=self.resolve_color("button_hover_color"),
+                                   outline=self.resolve_color("button_hover_color"))
 
     def on_leave(self, event=0):
         self.hover_state = False
-        self.canvas.itemconfig("slider_parts", fill=ThemeManager.single_color(self.button_color, self._appearance_mode),
-                               outline=ThemeManager.single_color(self.button_color, self._appearance_mode))
+        self.canvas.itemconfig("slider_parts", fill=self.resolve_color("button_color"),
+                               outline=self.resolve_color("button_color"))
 
     def variable_callback(self, var_name, index, mode):
         if not self.variable_callback_blocked:
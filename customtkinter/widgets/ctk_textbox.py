@@ -3,6 +3,7 @@ import tkinter
 from .ctk_canvas import CTkCanvas
 from ..theme_manager import ThemeManager
 from ..draw_engine import DrawEngine
+from ..bg_color_dispatcher import BgColorDispatcher
 from .widget_base_class import CTkBaseClass
 
 
@@ -44,41 +45,41 @@ class CTkTextbox(CTkBaseClass):
         self.canvas = CTkCanvas(master=self,
                                 highlightthickness=0,
                                 width=self.apply_widget_scaling(self._current_width),
-                                height=self.apply_widget_scaling(self._current_height))
+                                height=self.apply_widget_scaling(self._current_height),
+                                bg=self.resolve_color("bg_color"))
         self.canvas.grid(row=0, column=0, padx=0, pady=0, rowspan=1, columnspan=1, sticky="nsew")
-        self.canvas.configure(bg=ThemeManager.single_color(self.bg_color, self._appearance_mode))
         self.draw_engine = DrawEngine(self.canvas)
 
         for arg in ["highlightthickness", "fg", "bg", "font", "width", "height"]:
             kwargs.pop(arg, None)
         self.textbox = tkinter.Text(self,
-                                    fg=ThemeManager.single_color(self.text_color, self._appearance_mode),
+                                    fg=self.resolve_color("text_color"),
                                     width=0,
                                     height=0,
                                     font=self.text_font,
                                     highlightthickness=0,
                                     relief="flat",
                                     insertbackground=ThemeManager.single_color(("black", "white"), self._appearance_mode),
-                                    bg=ThemeManager.single_color(self.fg_color, self._appearance_mode),
+                                    bg=self.resolve_color("fg_color"),
                                     **kwargs)
         self.textbox.grid(row=0, column=0, padx=self.corner_radius, pady=self.corner_radius, rowspan=1, columnspan=1, sticky="nsew")
 
         self.bind('<Configure>', self.update_dimensions_event)
-        self.draw()
+        self.schedule_initial_draw()
 
     def set_scaling(self, *args, **kwargs):
         super().set_scaling(*args, **kwargs)
 
         self.textbox.configure(font=self.apply_font_scaling(self.text_font))
         self.canvas.configure(width=self.apply_widget_scaling(self._desired_width), height=self.apply_widget_scaling(self._desired_height))
-        self.draw()
+        self.draw_after_scaling()
 
     def set_dimensions(self, width=None, height=None):
         super().set_dimensions(width, height)
 
         self.canvas.configure(width=self.apply_widget_scaling(self._desired_width),
                               height=self.apply_widget_scaling(self._desired_height))
-        self.draw()
+        self.schedule_draw()
 
     def draw(self, no_color_updates=False):
 
@@ -88,27 +89,22 @@ class CTkTextbox(CTkBaseClass):
                                                                              self.apply_widget_scaling(self.border_width))
 
         if no_color_updates is False or requires_recoloring:
-            if self.fg_color is None:
-                self.canvas.itemconfig("inner_parts",
-                                       fill=ThemeManager.single_color(self.bg_color, self._appearance_mode),
-                                       outline=ThemeManager.single_color(self.bg_color, self._appearance_mode))
-            else:
-                self.canvas.itemconfig("inner_parts",
-                                       fill=ThemeManager.single_color(self.fg_color, self._appearance_mode),
-                                       outline=ThemeManager.single_color(self.fg_color, self._appearance_mode))
-
-            self.canvas.itemconfig("border_parts",
-                                   fill=ThemeManager.single_color(self.border_color, self._appearance_mode),
-                                   outline=ThemeManager.single_color(self.border_color, self._appearance_mode))
-            self.canvas.configure(bg=ThemeManager.single_color(self.bg_color, self._appearance_mode))
-
-            self.textbox.configure(fg=ThemeManager.single_color(self.text_color, self._appearance_mode),
-                                   bg=ThemeManager.single_color(self.fg_color, self._appearance_mode),
-                                   insertbackground=ThemeManager.single_color(("black", "white"), self._appearance_mode))
+            self.recolor()
 
         self.canvas.tag_lower("inner_parts")
         self.canvas.tag_lower("border_parts")
 
+    def recolor(self):
+        inner_color = "bg_color" if self.fg_color is None else "fg_color"
+
+        self.canvas.recolor_tags({"inner_parts": self.resolve_color(inner_color),
+                                  "border_parts": self.resolve_color("border_color")})
+        self.canvas.configure(bg=self.resolve_color("bg_color"))
+
+        self.textbox.configure(fg=self.resolve_color("text_color"),
+                               bg=self.resolve_color("fg_color"),
+                               insertbackground=ThemeManager.single_color(("black", "white"), self._appearance_mode))
+
     def yview(self, *args):
         return self.textbox.yview(*args)
 
@@ -138,10 +134,8 @@ class CTkTextbox(CTkBaseClass):
             self.fg_color = kwargs.pop("fg_color")
             require_redraw = True
 
-            # check if CTk widgets are children of the frame and change their bg_color to new frame fg_color
-            for child in self.winfo_children():
-                if isinstance(child, CTkBaseClass):
-                    child.configure(bg_color=self.fg_color)
+            # change bg_color of the CTk widgets which are children of the frame to new frame fg_color
+            BgColorDispatcher.dispatch_bg_color(self, self.fg_color)
 
         if "border_color" in kwargs:
             self.border_color = kwargs.pop("border_color")
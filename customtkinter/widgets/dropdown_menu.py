@@ -7,6 +7,7 @@ from typing import Union
 from ..theme_manager import ThemeManager
 from ..appearance_mode_tracker import AppearanceModeTracker
 from ..scaling_tracker import ScalingTracker
+from ..font_manager import FontManager
 
 
 class DropdownMenu(tkinter.Menu):
@@ -41,6 +42,11 @@ class DropdownMenu(tkinter.Menu):
 
         self.add_menu_commands()
 
+    def destroy(self):
+        AppearanceModeTracker.remove(self.set_appearance_mode)
+        ScalingTracker.remove_widget(self.set_scaling, self)
+        super().destroy()
+
     def configure_menu_for_platforms(self):
         """ apply platform specific appearance attributes """
 
@@ -130,6 +136,10 @@ class DropdownMenu(tkinter.Menu):
 
     def apply_font_scaling(self, font):
         if type(font) == tuple or type(font) == list:
+            named_font = FontManager.get_named_font(ScalingTracker.get_window_root_of_widget(self), font, self._widget_scaling)
+            if named_font is not None:
+                return named_font
+
             font_list = list(font)
             for i in range(len(font_list)):
                 if (type(font_list[i]) == int or type(font_list[i]) == float) and font_list[i] < 0:
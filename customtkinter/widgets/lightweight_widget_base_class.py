@@ -0,0 +1,202 @@
+import sys
+from typing import Union, Tuple, TYPE_CHECKING
+
+from ..settings import Settings
+from ..theme_manager import ThemeManager
+from ..draw_engine import DrawEngine
+from .ctk_canvas_item_group import CTkCanvasItemGroup
+from .widget_base_class import CTkBaseClass
+
+if TYPE_CHECKING:
+    from .ctk_lightweight_canvas import CTkLightweightCanvas
+
+
+class CTkLightweightBaseClass:
+    """ Base class of every lightweight widget. Lightweight widgets are no tkinter widgets, but groups of items
+        on the canvas of a CTkLightweightCanvas. The appearance mode, scaling and hover and click events
+        get passed down from the CTkLightweightCanvas, so there are no tracker callbacks and bindings per widget.
+
+        Lightweight widgets can only be positioned with place(x, y) in coordinates of the CTkLightweightCanvas,
+        pack() and grid() are not supported, and they don't resize with the canvas or their content. """
+
+    # same scaling methods as the normal CTk widgets
+    apply_widget_scaling = CTkBaseClass.apply_widget_scaling
+    apply_spacing_scaling = CTkBaseClass.apply_spacing_scaling
+
+    def __init__(self,
+                 master: "CTkLightweightCanvas",
+                 bg_color: Union[str, Tuple[str, str], None] = None,
+                 width: int = 0,
+                 height: int = 0):
+
+        self.master = master
+        self.canvas = master.canvas
+
+        # dimensions, lightweight widgets have no geometry manager, so the current size is always the desired size
+        self._current_width = width
+        self._current_height = height
+
+        # position (unscaled), the widget only has items on the canvas while it is placed
+        self._x = 0
+        self._y = 0
+        self._placed = False
+
+        # scaling and appearance mode of the CTkLightweightCanvas
+        self._widget_scaling = master._widget_scaling
+        self._spacing_scaling = master._spacing_scaling
+        self._appearance_mode = master._appearance_mode
+        self._resolved_colors = {}  # (attribute_name, appearance_mode) -> (color, single color string)
+
+        # background color
+        self.bg_color = self.detect_color_of_master() if bg_color is None else bg_color
+
+        # all items of the widget have the group tag, and their own tags are prefixed with it
+        self.group_tag = master.add_lightweight_widget(self)
+        self.item_group = CTkCanvasItemGroup(self.canvas, self.group_tag)
+        self.draw_engine = DrawEngine(self.item_group)
+
+        if self.draw_engine.preferred_drawing_method == "image_shapes":
+            # 'image_shapes' uses a single image item per canvas, which can't be shared between widgets
+            self.draw_engine.preferred_drawing_method = "font_shapes" if DrawEngine.shapes_font_available else "polygon_shapes"
+
+    def apply_font_scaling(self, font):
+        # the window and its shared named fonts can only be looked up from a real widget,
+        # so the CTkLightweightCanvas, which always has the same scaling, scales the font
+        return self.master.apply_font_scaling(font)
+
+    def detect_color_of_master(self):
+        return self.master.fg_color if self.master.fg_color is not None else self.master.bg_color
+
+    def destroy(self):
+        self.item_group.delete_all()
+        self.master.remove_lightweight_widget(self)
+
+    def place(self, x: Union[int, float] = 0, y: Union[int, float] = 0):
+        self._x = x
+        self._y = y
+        self._placed = True
+
+        self.item_group.move_to(self.apply_spacing_scaling(self._x), self.apply_spacing_scaling(self._y))
+        self.draw()
+
+    def place_forget(self):
+        """ deletes all items of the widget, they get created again on the next place() call """
+
+        self._placed = False
+        self.item_group.delete_all()
+        self.draw_engine.reset_draw_signatures()
+
+    def winfo_ismapped(self) -> bool:
+        return self._placed
+
+    def contains(self, x: Union[int, float], y: Union[int, float]) -> bool:
+        """ hit-test for x, y in canvas coordinates """
+
+        if not self._placed:
+            return False
+
+        return (self.item_group.x <= x < self.item_group.x + self.apply_widget_scaling(self._current_width) and
+                self.item_group.y <= y < self.item_group.y + self.apply_widget_scaling(self._current_height))
+
+    def get_cursor(self) -> str:
+        """ cursor of the canvas while the mouse is over the widget """
+        return ""
+
+    def get_pointer_cursor(self, active: bool) -> str:
+        """ pointing hand cursor for active clickable widgets, same as the set_cursor() methods of the normal widgets """
+
+        if Settings.cursor_manipulation_enabled and active:
+            if sys.platform == "darwin":
+                return "pointinghand"
+            elif sys.platform.startswith("win"):
+                return "hand2"
+        return ""
+
+    def configure(self, require_redraw=False, **kwargs):
+        """ basic configure with bg_color and size support, to be overridden """
+
+        self._resolved_colors.clear()  # color attributes may have been changed by the subclass configure
+
+        if "bg_color" in kwargs:
+            new_bg_color = kwargs.pop("bg_color")
+            if new_bg_color is None:
+                self.bg_color = self.detect_color_of_master()
+            else:
+                self.bg_color = new_bg_color
+            require_redraw = True
+
+        if "width" in kwargs:
+            self._current_width = kwargs.pop("width")
+            require_redraw = True
+
+        if "height" in kwargs:
+            self._current_height = kwargs.pop("height")
+            require_redraw = True
+
+        if len(kwargs) > 0:
+            raise ValueError(f"{', '.join(kwargs.keys())} not supported by {type(self).__name__}")
+
+        if require_redraw:
+            self.draw()
+
+    def resolve_color(self, attribute_name: str) -> str:
+        """ returns the single color of a color attribute for the current appearance mode,
+            cached per (attribute, mode), a new color object assigned to the attribute invalidates its entry """
+
+        color = getattr(self, attribute_name)
+        cache_key = (attribute_name, self._appearance_mode)
+        cached = self._resolved_colors.get(cache_key)
+        if cached is not None and cached[0] is color:
+            return cached[1]
+
+        single_color = ThemeManager.single_color(color, self._appearance_mode)
+        self._resolved_colors[cache_key] = (color, single_color)
+        return single_color
+
+    def set_appearance_mode(self, mode_string):
+        if mode_string.lower() == "dark":
+            self._appearance_mode = 1
+        elif mode_string.lower() == "light":
+            self._appearance_mode = 0
+
+        self.recolor()
+
+    def set_scaling(self, new_widget_scaling, new_spacing_scaling, redraw: bool = True):
+        self._widget_scaling = new_widget_scaling
+        self._spacing_scaling = new_spacing_scaling
+
+        self.item_group.move_to(self.apply_spacing_scaling(self._x), self.apply_spacing_scaling(self._y))
+        if redraw:
+            self.draw()
+
+    def rounded_rect_spec(self) -> Union[tuple, None]:
+        """ (width, height, corner_radius, border_width, drawing_method) of the scaled rounded rect
+            the widget draws, or None if it draws no rounded rect, to be overridden """
+        return None
+
+    def draw_rounded_rect(self) -> bool:
+        """ draws the rounded rect of rounded_rect_spec(), with the layout precomputed by the
+            CTkLightweightCanvas if it draws all widgets at once, returns bool if recoloring is necessary """
+
+        spec = self.rounded_rect_spec()
+        layout = self.master.get_precomputed_layout(spec)
+        if layout is None:
+            layout = DrawEngine.compute_layouts((spec,))[0]
+        return self.draw_engine.draw_rounded_rect_with_border_from_layout(layout)
+
+    def draw(self, no_color_updates: bool = False):
+        """ abstract of draw method to be overridden """
+        pass
+
+    def recolor(self):
+        """ updates only the colors of the drawn items, to be overridden """
+        self.draw()
+
+    def on_enter(self, event=None):
+        pass
+
+    def on_leave(self, event=None):
+        pass
+
+    def clicked(self, event=None):
+        pass
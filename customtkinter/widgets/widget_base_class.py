@@ -2,6 +2,8 @@ import tkinter
 import tkinter.ttk as ttk
 import copy
 import re
+import weakref
+from contextlib import contextmanager
 from typing import Callable, Union
 
 try:
@@ -14,12 +16,24 @@ from ..windows.ctk_toplevel import CTkToplevel
 from ..appearance_mode_tracker import AppearanceModeTracker
 from ..scaling_tracker import ScalingTracker
 from ..theme_manager import ThemeManager
+from ..font_manager import FontManager
+from ..redraw_scheduler import RedrawScheduler
+from ..bg_color_dispatcher import BgColorDispatcher
+
+
+class GeometryCallDict(TypedDict):
+    """ latest geometry manager call of a widget, re-applied with new scaling """
+    function: Callable
+    kwargs: dict
 
 
 class CTkBaseClass(tkinter.Frame):
     """ Base class of every CTk widget, handles the dimensions, bg_color,
         appearance_mode changes, scaling, bg changes of master if master is not a CTk widget """
 
+    # background colors of ttk styles, per tk root and ttk widget class, cleared on <<ThemeChanged>>
+    ttk_background_cache = weakref.WeakKeyDictionary()
+
     def __init__(self,
                  *args,
                  bg_color: Union[str, tuple] = None,
@@ -40,48 +54,36 @@ class CTkBaseClass(tkinter.Frame):
         self._widget_scaling = ScalingTracker.get_widget_scaling(self)
         self._spacing_scaling = ScalingTracker.get_spacing_scaling(self)
 
-        super().configure(width=self.apply_widget_scaling(self._desired_width),
-                          height=self.apply_widget_scaling(self._desired_height))
-
         # save latest geometry function and kwargs
-        class GeometryCallDict(TypedDict):
-            function: Callable
-            kwargs: dict
-
         self._last_geometry_manager_call: Union[GeometryCallDict, None] = None
+        self._batch_update_depth = 0  # > 0 inside of batch_update() blocks
+        self._initial_draw_pending = False  # True until the widget gets mapped and drawn the first time
+        self._mapped = False  # kept up to date by <Map> and <Unmap> events, without round trip to tcl
 
         # add set_appearance_mode method to callback list of AppearanceModeTracker for appearance mode changes
         AppearanceModeTracker.add(self.set_appearance_mode, self)
         self._appearance_mode = AppearanceModeTracker.get_mode()  # 0: "Light" 1: "Dark"
+        self._resolved_colors = {}  # (attribute_name, appearance_mode) -> (color, single color string)
 
         # background color
         self.bg_color = self.detect_color_of_master() if bg_color is None else bg_color
 
-        super().configure(bg=ThemeManager.single_color(self.bg_color, self._appearance_mode))
+        # scaled size and bg color in one configure call
+        super().configure(width=self.apply_widget_scaling(self._desired_width),
+                          height=self.apply_widget_scaling(self._desired_height),
+                          bg=self.resolve_color("bg_color"))
 
-        # overwrite configure methods of master when master is tkinter widget, so that bg changes get applied on child CTk widget as well
+        # register at the master, so that bg changes of the master get applied on this widget as well,
+        # configure methods of a tkinter master get overwritten once per master
+        BgColorDispatcher.add_child(self.master, self)
         if isinstance(self.master, (tkinter.Tk, tkinter.Toplevel, tkinter.Frame)) and not isinstance(self.master, (CTkBaseClass, CTk, CTkToplevel)):
-            master_old_configure = self.master.config
-
-            def new_configure(*args, **kwargs):
-                if "bg" in kwargs:
-                    self.configure(bg_color=kwargs["bg"])
-                elif "background" in kwargs:
-                    self.configure(bg_color=kwargs["background"])
-
-                # args[0] is dict when attribute gets changed by widget[<attribute>] syntax
-                elif len(args) > 0 and type(args[0]) == dict:
-                    if "bg" in args[0]:
-                        self.configure(bg_color=args[0]["bg"])
-                    elif "background" in args[0]:
-                        self.configure(bg_color=args[0]["background"])
-                master_old_configure(*args, **kwargs)
-
-            self.master.config = new_configure
-            self.master.configure = new_configure
+            BgColorDispatcher.hook_master_configure(self.master)
 
     def destroy(self):
         AppearanceModeTracker.remove(self.set_appearance_mode)
+        ScalingTracker.remove_widget(self.set_scaling, self)
+        RedrawScheduler.remove(self)
+        BgColorDispatcher.remove_child(self.master, self)
         super().destroy()
 
     def place(self, **kwargs):
@@ -120,6 +122,8 @@ class CTkBaseClass(tkinter.Frame):
     def configure(self, require_redraw=False, **kwargs):
         """ basic configure with bg_color support, to be overridden """
 
+        self._resolved_colors.clear()  # color attributes may have been changed by the subclass configure
+
         if "bg_color" in kwargs:
             new_bg_color = kwargs.pop("bg_color")
             if new_bg_color is None:
@@ -131,7 +135,7 @@ class CTkBaseClass(tkinter.Frame):
         super().configure(**kwargs)
 
         if require_redraw:
-            self.draw()
+            self.schedule_draw()
 
     def update_dimensions_event(self, event):
         # only redraw if dimensions changed (for performance), independent of scaling
@@ -139,7 +143,7 @@ class CTkBaseClass(tkinter.Frame):
             self._current_width = (event.width / self._widget_scaling)  # adjust current size according to new size given by event
             self._current_height = (event.height / self._widget_scaling)  # _current_width and _current_height are independent of the scale
 
-            self.draw(no_color_updates=True)  # faster drawing without color changes
+            self.schedule_draw(no_color_updates=True)  # faster drawing without color changes
 
     def detect_color_of_master(self, master_widget=None):
         """ detect color of self.master widget to set correct bg_color """
@@ -157,8 +161,7 @@ class CTkBaseClass(tkinter.Frame):
 
         elif isinstance(master_widget, (ttk.Frame, ttk.LabelFrame, ttk.Notebook, ttk.Label)):  # master is ttk widget
             try:
-                ttk_style = ttk.Style()
-                return ttk_style.lookup(master_widget.winfo_class(), 'background')
+                return self.lookup_ttk_background(master_widget)
             except Exception:
                 return "#FFFFFF", "#000000"
 
@@ -168,13 +171,50 @@ class CTkBaseClass(tkinter.Frame):
             except Exception:
                 return "#FFFFFF", "#000000"
 
+    @classmethod
+    def lookup_ttk_background(cls, ttk_widget) -> str:
+        """ returns the background color of the ttk style of the widget class, the lookup
+            is done once per tk root and widget class until the ttk theme changes """
+
+        tk_root = ttk_widget._root()
+        if tk_root not in cls.ttk_background_cache:
+            cls.ttk_background_cache[tk_root] = {}
+            tk_root.bind("<<ThemeChanged>>", lambda event: cls.clear_ttk_background_cache(tk_root, event), add="+")
+
+        widget_class = ttk_widget.winfo_class()
+        root_cache = cls.ttk_background_cache[tk_root]
+        if widget_class not in root_cache:
+            root_cache[widget_class] = ttk.Style(tk_root).lookup(widget_class, "background")
+        return root_cache[widget_class]
+
+    @classmethod
+    def clear_ttk_background_cache(cls, tk_root, event=None):
+        # <<ThemeChanged>> is sent to every widget, the binding of the root also gets the events of all children
+        if event is None or event.widget is tk_root:
+            cls.ttk_background_cache.get(tk_root, {}).clear()
+
+    def resolve_color(self, attribute_name: str) -> str:
+        """ returns the single color of a color attribute for the current appearance mode,
+            cached per (attribute, mode), a new color object assigned to the attribute invalidates its entry """
+
+        color = getattr(self, attribute_name)
+        cache_key = (attribute_name, self._appearance_mode)
+        cached = self._resolved_colors.get(cache_key)
+        if cached is not None and cached[0] is color:
+            return cached[1]
+
+        single_color = ThemeManager.single_color(color, self._appearance_mode)
+        self._resolved_colors[cache_key] = (color, single_color)
+        return single_color
+
     def set_appearance_mode(self, mode_string):
         if mode_string.lower() == "dark":
             self._appearance_mode = 1
         elif mode_string.lower() == "light":
             self._appearance_mode = 0
 
-        self.draw()
+        if not self._initial_draw_pending:  # the initial draw uses the new mode anyway
+            self.recolor()
 
     def set_scaling(self, new_widget_scaling, new_spacing_scaling, new_window_scaling):
         self._widget_scaling = new_widget_scaling
@@ -183,9 +223,74 @@ class CTkBaseClass(tkinter.Frame):
         super().configure(width=self.apply_widget_scaling(self._desired_width),
                           height=self.apply_widget_scaling(self._desired_height))
 
+        if self._last_geometry_manager_call is not None:
+            if ScalingTracker.scaling_update_running:
+                ScalingTracker.add_pending_geometry_call(self)  # re-applied in one pass after all widgets are scaled
+            else:
+                self.apply_last_geometry_manager_call()
+
+    def apply_last_geometry_manager_call(self):
         if self._last_geometry_manager_call is not None:
             self._last_geometry_manager_call["function"](**self.apply_argument_scaling(self._last_geometry_manager_call["kwargs"]))
 
+    def draw_after_scaling(self):
+        """ redraws the widget after a scaling change, during a ScalingTracker update only once at idle """
+
+        if self._initial_draw_pending:
+            return
+        elif ScalingTracker.scaling_update_running:
+            RedrawScheduler.mark_dirty(self, no_color_updates=True)  # scaling doesn't change colors
+        else:
+            self.draw(no_color_updates=True)
+
+    @contextmanager
+    def batch_update(self):
+        """ with widget.batch_update(): all redraws caused by configure() calls inside
+            the with block get merged into one draw at the end of the block """
+
+        self._batch_update_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_update_depth -= 1
+            if self._batch_update_depth == 0 and RedrawScheduler.batch_depth == 0:
+                RedrawScheduler.draw_batched_widget(self)
+
+    def schedule_draw(self, no_color_updates: bool = False):
+        """ redraws the widget once at idle, multiple calls until then get merged into one draw,
+            inside of batch_update() or customtkinter.batch() the draw is executed at the end of the block """
+
+        if self._initial_draw_pending:
+            return  # the initial draw when the widget gets mapped covers all changes until then
+        elif self._batch_update_depth > 0 or RedrawScheduler.batch_depth > 0:
+            RedrawScheduler.add_to_batch(self, no_color_updates=no_color_updates)
+        elif RedrawScheduler.enabled:
+            RedrawScheduler.mark_dirty(self, no_color_updates=no_color_updates)
+        else:
+            self.draw(no_color_updates=no_color_updates)
+
+    def schedule_initial_draw(self):
+        """ called at the end of __init__, the first draw is deferred until the widget gets mapped,
+            so it's done once with the final size and widgets which are never shown don't get drawn """
+
+        tkinter.Frame.bind(self, "<Map>", self.map_event, add="+")  # subclasses may override bind()
+        tkinter.Frame.bind(self, "<Unmap>", self.unmap_event, add="+")
+
+        if RedrawScheduler.enabled:
+            self._initial_draw_pending = True
+        else:
+            self.draw()
+
+    def map_event(self, event=None):
+        self._mapped = True
+
+        if self._initial_draw_pending:
+            self._initial_draw_pending = False
+            self.draw()
+
+    def unmap_event(self, event=None):
+        self._mapped = False
+
     def set_dimensions(self, width=None, height=None):
         if width is not None:
             self._desired_width = width
@@ -209,6 +314,11 @@ class CTkBaseClass(tkinter.Frame):
 
     def apply_font_scaling(self, font):
         if type(font) == tuple or type(font) == list:
+            # theme fonts and other font tuples with pixel size use a named font shared by the whole window
+            named_font = FontManager.get_named_font(ScalingTracker.get_window_root_of_widget(self), font, self._widget_scaling)
+            if named_font is not None:
+                return named_font
+
             font_list = list(font)
             for i in range(len(font_list)):
                 if (type(font_list[i]) == int or type(font_list[i]) == float) and font_list[i] < 0:
@@ -232,3 +342,8 @@ class CTkBaseClass(tkinter.Frame):
     def draw(self, no_color_updates: bool = False):
         """ abstract of draw method to be overridden """
         pass
+
+    def recolor(self):
+        """ updates only the colors of the already drawn widget, without recomputing the geometry,
+            used for appearance mode changes, to be overridden """
+        self.draw()
@@ -10,7 +10,9 @@ from typing import Union, Tuple
 from ..appearance_mode_tracker import AppearanceModeTracker
 from ..theme_manager import ThemeManager
 from ..scaling_tracker import ScalingTracker
+from ..bg_color_dispatcher import BgColorDispatcher
 from ..settings import Settings
+from ..drawing_method_calibrator import DrawingMethodCalibrator
 
 
 class CTk(tkinter.Tk):
@@ -23,6 +25,10 @@ class CTk(tkinter.Tk):
 
         super().__init__(*args, **kwargs)
 
+        # optionally use the fastest drawing method on this setup, measured after the first frame if not cached yet
+        if DrawingMethodCalibrator.enabled and not DrawingMethodCalibrator.calibrated:
+            DrawingMethodCalibrator.apply_cached_method(self)
+
         # add set_appearance_mode method to callback list of AppearanceModeTracker for appearance mode changes
         AppearanceModeTracker.add(self.set_appearance_mode, self)
         self.appearance_mode = AppearanceModeTracker.get_mode()  # 0: "Light" 1: "Dark"
@@ -65,12 +71,31 @@ class CTk(tkinter.Tk):
 
         self.bind('<Configure>', self.update_dimensions_event)
 
+        self._mapped = False  # kept up to date by <Map> and <Unmap> events of the window, without round trip to tcl
+        self.bind('<Map>', self.map_event, add="+")
+        self.bind('<Unmap>', self.unmap_event, add="+")
+
         self.block_update_dimensions_event = False
 
+    def map_event(self, event):
+        if event.widget is self:  # the window bind tag is also in the bindtags of every child widget
+            self._mapped = True
+
+    def unmap_event(self, event):
+        if event.widget is self:
+            self._mapped = False
+
     def update_dimensions_event(self, event=None):
+        # the window bind tag is also in the bindtags of every child widget, so only events of the window itself are relevant
+        if event is not None and event.widget is not self:
+            return
+
         if not self.block_update_dimensions_event:
-            detected_width = self.winfo_width()  # detect current window size
-            detected_height = self.winfo_height()
+            if event is not None:
+                detected_width, detected_height = event.width, event.height  # current window size, no round trip to tcl
+            else:
+                detected_width = self.winfo_width()  # detect current window size
+                detected_height = self.winfo_height()
 
             if self.current_width != round(detected_width / self.window_scaling) or self.current_height != round(detected_height / self.window_scaling):
                 self.current_width = round(detected_width / self.window_scaling)  # adjust current size according to new size given by event
@@ -249,11 +274,7 @@ class CTk(tkinter.Tk):
                 args[0]["background"] = ThemeManager.single_color(self.fg_color, self.appearance_mode)
 
         if bg_changed:
-            from ..widgets.widget_base_class import CTkBaseClass
-
-            for child in self.winfo_children():
-                if isinstance(child, CTkBaseClass):
-                    child.configure(bg_color=self.fg_color)
+            BgColorDispatcher.dispatch_bg_color(self, self.fg_color)
 
         super().configure(*args, **kwargs)
 
@@ -11,6 +11,7 @@ from ..appearance_mode_tracker import AppearanceModeTracker
 from ..theme_manager import ThemeManager
 from ..settings import Settings
 from ..scaling_tracker import ScalingTracker
+from ..bg_color_dispatcher import BgColorDispatcher
 
 
 class CTkToplevel(tkinter.Toplevel):
@@ -61,9 +62,28 @@ class CTkToplevel(tkinter.Toplevel):
 
         self.bind('<Configure>', self.update_dimensions_event)
 
+        self._mapped = False  # kept up to date by <Map> and <Unmap> events of the window, without round trip to tcl
+        self.bind('<Map>', self.map_event, add="+")
+        self.bind('<Unmap>', self.unmap_event, add="+")
+
+    def map_event(self, event):
+        if event.widget is self:  # the window bind tag is also in the bindtags of every child widget
+            self._mapped = True
+
+    def unmap_event(self, event):
+        if event.widget is self:
+            self._mapped = False
+
     def update_dimensions_event(self, event=None):
-        detected_width = self.winfo_width()  # detect current window size
-        detected_height = self.winfo_height()
+        # the window bind tag is also in the bindtags of every child widget, so only events of the window itself are relevant
+        if event is not None and event.widget is not self:
+            return
+
+        if event is not None:
+            detected_width, detected_height = event.width, event.height  # current window size, no round trip to tcl
+        else:
+            detected_width = self.winfo_width()  # detect current window size
+            detected_height = self.winfo_height()
 
         if self.current_width != round(detected_width / self.window_scaling) or self.current_height != round(detected_height / self.window_scaling):
             self.current_width = round(detected_width / self.window_scaling)  # adjust current size according to new size given by event
@@ -213,11 +233,7 @@ class CTkToplevel(tkinter.Toplevel):
                 args[0]["background"] = ThemeManager.single_color(self.fg_color, self.appearance_mode)
 
         if bg_changed:
-            from ..widgets.widget_base_class import CTkBaseClass
-
-            for child in self.winfo_children():
-                if isinstance(child, CTkBaseClass):
-                    child.configure(bg_color=self.fg_color)
+            BgColorDispatcher.dispatch_bg_color(self, self.fg_color)
 
         super().configure(*args, **kwargs)
 
@@ -0,0 +1,79 @@
+import sys
+import time
+import tkinter
+import customtkinter
+
+# Creates NUMBER_OF_WIDGETS widgets of every class and prints the construction time in microseconds per widget,
+# once with the first draw deferred until the widget gets mapped (default) and once with an immediate draw in
+# __init__ (RedrawScheduler disabled). The deferred draws are measured separately when the widgets get packed.
+# Exits with code 1 if the deferred construction of a widget class exceeds its budget.
+
+NUMBER_OF_WIDGETS = 200
+BUDGET_MICROSECONDS_PER_WIDGET = 1500  # deferred construction, without the draw when mapped
+BUDGET_OVERRIDES = {customtkinter.CTkTextbox: 2500,
+                    customtkinter.CTkComboBox: 2500,
+                    customtkinter.CTkOptionMenu: 2500}
+
+WIDGET_CLASSES = [customtkinter.CTkFrame,
+                  customtkinter.CTkLabel,
+                  customtkinter.CTkButton,
+                  customtkinter.CTkEntry,
+                  customtkinter.CTkCheckBox,
+                  customtkinter.CTkRadioButton,
+                  customtkinter.CTkSwitch,
+                  customtkinter.CTkSlider,
+                  customtkinter.CTkProgressBar,
+                  customtkinter.CTkScrollbar,
+                  customtkinter.CTkOptionMenu,
+                  customtkinter.CTkComboBox,
+                  customtkinter.CTkTextbox]
+
+app = customtkinter.CTk()
+app.geometry("800x600")
+app.update()
+
+
+def construct_widgets(widget_class, container):
+    start_time = time.perf_counter()
+    widgets = [widget_class(container) for _ in range(NUMBER_OF_WIDGETS)]
+    return widgets, (time.perf_counter() - start_time) / NUMBER_OF_WIDGETS * 1e6
+
+
+def map_widgets(widgets, container):
+    start_time = time.perf_counter()
+    for i, widget in enumerate(widgets):
+        widget.grid(row=i // 10, column=i % 10)
+    container.update()
+    return (time.perf_counter() - start_time) / NUMBER_OF_WIDGETS * 1e6
+
+
+print(f"{'widget class':<24}{'deferred':>12}{'when mapped':>14}{'immediate':>12}{'budget':>10}")
+over_budget = []
+
+for widget_class in WIDGET_CLASSES:
+    # first draw deferred until the widget gets mapped
+    container = tkinter.Frame(app)
+    container.pack(fill="both", expand=True)
+    widgets, deferred_time = construct_widgets(widget_class, container)
+    mapped_time = map_widgets(widgets, container)
+    container.destroy()
+
+    # first draw immediately in __init__
+    customtkinter.RedrawScheduler.enabled = False
+    container = tkinter.Frame(app)
+    widgets, immediate_time = construct_widgets(widget_class, container)
+    container.destroy()
+    customtkinter.RedrawScheduler.enabled = True
+
+    budget = BUDGET_OVERRIDES.get(widget_class, BUDGET_MICROSECONDS_PER_WIDGET)
+    if deferred_time > budget:
+        over_budget.append(widget_class.__name__)
+
+    print(f"{widget_class.__name__:<24}{deferred_time:>10.0f}us{mapped_time:>12.0f}us{immediate_time:>10.0f}us{budget:>8}us"
+          f"{'  OVER BUDGET' if deferred_time > budget else ''}")
+
+app.destroy()
+
+if over_budget:
+    print(f"over budget: {', '.join(over_budget)}")
+    sys.exit(1)
@@ -0,0 +1,59 @@
+import time
+import tkinter
+import customtkinter
+
+# The <Configure> binding of the window also gets the events of all child widgets (the window bind tag is in their
+# bindtags), this benchmark resizes a window with 1000 children and counts how many events actually get handled.
+
+NUMBER_OF_CHILDREN = 1000
+NUMBER_OF_RESIZES = 20
+
+app = customtkinter.CTk()
+app.geometry("800x600")
+
+container = tkinter.Frame(app)
+container.pack(fill="both", expand=True)
+for i in range(NUMBER_OF_CHILDREN):
+    container.grid_columnconfigure(i % 40, weight=1)
+    tkinter.Frame(container, height=2).grid(row=i // 40, column=i % 40, sticky="nsew")
+
+app.update()
+
+handler_time = 0
+original_update_dimensions_event = app.update_dimensions_event
+
+
+def timed_update_dimensions_event(event=None):
+    global handler_time
+    start_time = time.perf_counter()
+    original_update_dimensions_event(event)
+    handler_time += time.perf_counter() - start_time
+
+
+events_received = 0
+window_events_received = 0
+
+
+def count_event(event):
+    global events_received, window_events_received
+    events_received += 1
+    if event.widget is app:
+        window_events_received += 1
+
+
+app.bind("<Configure>", timed_update_dimensions_event)  # replaces the binding of CTk
+app.bind("<Configure>", count_event, add="+")
+
+start_time = time.perf_counter()
+for i in range(NUMBER_OF_RESIZES):
+    app.geometry(f"{800 + (i % 2) * 100}x{600 + (i % 2) * 50}")
+    app.update()
+total_time = time.perf_counter() - start_time
+
+print(f"{NUMBER_OF_RESIZES} resizes with {NUMBER_OF_CHILDREN} children in {total_time * 1000:.1f} ms")
+print(f"<Configure> events received by the window binding: {events_received}")
+print(f"events handled as window resize (event.widget is the window): {window_events_received}")
+print(f"winfo_width()/winfo_height() round trips saved: {2 * events_received}")
+print(f"time spent in update_dimensions_event: {handler_time * 1000:.2f} ms")
+
+app.destroy()
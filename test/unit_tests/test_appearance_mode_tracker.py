@@ -0,0 +1,257 @@
+import gc
+import sys
+import time
+import tkinter
+import unittest
+
+from customtkinter.appearance_mode_tracker import AppearanceModeTracker
+
+
+class FakeApp:
+    """ records the scheduled .after() calls and generated events instead of running a tk mainloop """
+
+    def __init__(self):
+        self.scheduled = []
+        self.intervals = []
+        self.bindings = []
+        self.generated_events = []  # appended from the listener thread
+
+    def after(self, ms, function, *args):
+        self.scheduled.append(function)
+        self.intervals.append(ms)
+        return f"after#{len(self.scheduled)}"
+
+    def after_cancel(self, after_id):
+        pass
+
+    def bind(self, sequence, function, add=None):
+        self.bindings.append((sequence, function))
+
+    def event_generate(self, sequence, when=None):
+        self.generated_events.append(sequence)
+
+
+class FakeTk(tkinter.Tk):
+    """ tkinter.Tk instance without tk interpreter, ends the uncached and the cached root lookup """
+
+    def __init__(self):
+        self._w = "."
+        self.master = None
+
+
+class FakeToplevel(tkinter.Toplevel):
+    def __init__(self, master):
+        self._w = f".toplevel{id(self)}"
+        self.master = master
+
+
+class FakeChild:
+    def __init__(self, master):
+        self.master = master
+
+
+def uncached_tk_root(widget):
+    while not isinstance(widget, tkinter.Tk):
+        widget = widget.master
+    return widget
+
+
+class TestTkRootCache(unittest.TestCase):
+    def test_cached_lookup_matches_uncached_walk(self):
+        roots = [FakeTk(), FakeTk()]
+        widgets = []
+        for root in roots:
+            toplevel = FakeToplevel(root)
+            frame = FakeChild(root)
+            widgets += [toplevel, frame, FakeChild(frame), FakeChild(FakeChild(toplevel)), FakeChild(toplevel)]
+
+        # deepest widgets first, so the later lookups hit the cache of their masters, then all again from the cache
+        for widget in list(reversed(widgets)) + widgets:
+            self.assertIs(AppearanceModeTracker.get_tk_root_of_widget(widget), uncached_tk_root(widget))
+            self.assertIs(widget.__dict__.get("_ctk_tk_root"), uncached_tk_root(widget))  # cached on the widget
+
+
+class TrackerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.saved_state = (AppearanceModeTracker.app_list, AppearanceModeTracker.callback_dict, AppearanceModeTracker.appearance_mode,
+                            AppearanceModeTracker.appearance_mode_set_by, AppearanceModeTracker.detection_method,
+                            AppearanceModeTracker.listener_command, AppearanceModeTracker.incremental_update)
+        AppearanceModeTracker.app_list = []
+        AppearanceModeTracker.callback_dict = {}
+        AppearanceModeTracker.appearance_mode = 0
+        AppearanceModeTracker.appearance_mode_set_by = "system"
+        AppearanceModeTracker.incremental_update = False
+        AppearanceModeTracker.update_loop_running = False
+
+    def tearDown(self):
+        AppearanceModeTracker.stop_detection()
+        AppearanceModeTracker.update_loop_running = False
+        (AppearanceModeTracker.app_list, AppearanceModeTracker.callback_dict, AppearanceModeTracker.appearance_mode,
+         AppearanceModeTracker.appearance_mode_set_by, AppearanceModeTracker.detection_method,
+         AppearanceModeTracker.listener_command, AppearanceModeTracker.incremental_update) = self.saved_state
+
+
+class FakeWidget:
+    def __init__(self):
+        self.modes = []
+
+    def set_appearance_mode(self, mode_string):
+        self.modes.append(mode_string)
+
+
+class TestCallbackRegistry(TrackerTestCase):
+    def setUp(self):
+        super().setUp()
+        AppearanceModeTracker.detection_method = "none"
+
+    def test_add_and_remove(self):
+        widget = FakeWidget()
+        AppearanceModeTracker.add(widget.set_appearance_mode)
+        AppearanceModeTracker.add(widget.set_appearance_mode)  # same bound method is only registered once
+        self.assertEqual(AppearanceModeTracker.get_callback_count(), 1)
+
+        AppearanceModeTracker.remove(widget.set_appearance_mode)
+        self.assertEqual(AppearanceModeTracker.get_callback_count(), 0)
+
+    def test_registry_does_not_keep_widgets_alive(self):
+        widgets = [FakeWidget() for _ in range(10)]
+        for widget in widgets:
+            AppearanceModeTracker.add(widget.set_appearance_mode)
+        self.assertEqual(AppearanceModeTracker.get_callback_count(), 10)
+
+        del widget, widgets[:5]
+        gc.collect()
+        self.assertEqual(AppearanceModeTracker.get_callback_count(), 5)
+
+        AppearanceModeTracker.set_appearance_mode("dark")
+        self.assertTrue(all(widget.modes == ["Dark"] for widget in widgets))
+
+    def test_plain_functions_are_kept(self):
+        modes = []
+        AppearanceModeTracker.add(lambda mode_string: modes.append(mode_string))
+        gc.collect()
+
+        AppearanceModeTracker.set_appearance_mode("dark")
+        self.assertEqual(modes, ["Dark"])
+
+
+class TestIncrementalUpdate(TrackerTestCase):
+    def setUp(self):
+        super().setUp()
+        AppearanceModeTracker.detection_method = "none"
+        AppearanceModeTracker.update_queue.clear()
+        AppearanceModeTracker.update_slice_scheduled = False
+
+    def tearDown(self):
+        AppearanceModeTracker.update_queue.clear()
+        AppearanceModeTracker.update_slice_scheduled = False
+        super().tearDown()
+
+    def test_mapped_widgets_first_and_slices_at_idle(self):
+        app = FakeApp()
+        app.after_idle = lambda *args: app.scheduled.append(args)
+        AppearanceModeTracker.app_list.append(app)
+
+        call_order = []
+
+        class OrderedWidget(FakeWidget):
+            def __init__(self, name, mapped, master=None):
+                super().__init__()
+                self.name, self._mapped, self.master = name, mapped, master
+
+            def set_appearance_mode(self, mode_string):
+                super().set_appearance_mode(mode_string)
+                call_order.append(self.name)
+
+        hidden_tab = OrderedWidget("hidden_tab", mapped=False)
+        widgets = [OrderedWidget("unmapped", mapped=False),
+                   OrderedWidget("mapped_1", mapped=True),
+                   OrderedWidget("in_hidden_tab", mapped=True, master=hidden_tab),  # was drawn, but the tab is hidden now
+                   hidden_tab,
+                   OrderedWidget("mapped_2", mapped=True, master=OrderedWidget("shown_tab", mapped=True))]
+        for widget in widgets:
+            AppearanceModeTracker.add(widget.set_appearance_mode)
+
+        AppearanceModeTracker.incremental_update_frame_budget = 0  # one callback per slice
+        try:
+            AppearanceModeTracker.set_appearance_mode("dark", incremental=True)
+            self.assertEqual(call_order, ["mapped_1"])
+            self.assertEqual(len(app.scheduled), 1)  # next slice after the idle tasks
+
+            while len(AppearanceModeTracker.update_queue) > 0:
+                AppearanceModeTracker.run_scheduled_update_slice()
+        finally:
+            AppearanceModeTracker.incremental_update_frame_budget = 12
+
+        self.assertEqual(call_order, ["mapped_1", "mapped_2", "unmapped", "in_hidden_tab", "hidden_tab"])
+        self.assertTrue(all(widget.modes == ["Dark"] for widget in widgets))
+
+
+class TestListener(TrackerTestCase):
+    def setUp(self):
+        super().setUp()
+        AppearanceModeTracker.detection_method = "auto"
+        AppearanceModeTracker.listener_command = (sys.executable, "-c", "import time; print('Dark', flush=True); time.sleep(60)")
+
+    def start_listener(self) -> FakeApp:
+        app = FakeApp()
+        AppearanceModeTracker.app_list.append(app)
+        AppearanceModeTracker.start_detection()
+        self.listener_process = AppearanceModeTracker.listener_process
+        self.assertIsNotNone(self.listener_process)
+        return app
+
+    def assertListenerStopped(self):
+        self.assertIsNone(AppearanceModeTracker.listener_process)
+        self.assertEqual(self.listener_process.wait(timeout=10), self.listener_process.returncode)
+
+    def wait_for(self, condition):
+        deadline = time.perf_counter() + 10
+        while not condition() and time.perf_counter() < deadline:
+            time.sleep(0.01)
+
+    def test_change_is_passed_to_tk_loop_with_virtual_event(self):
+        app = self.start_listener()
+        self.assertEqual(app.intervals, [AppearanceModeTracker.listener_check_interval])  # no polling while the listener runs
+
+        self.wait_for(lambda: len(app.generated_events) > 0)
+        self.assertEqual(app.generated_events, [AppearanceModeTracker.listener_event])
+        self.assertEqual(AppearanceModeTracker.appearance_mode, 0)  # the listener thread doesn't apply the change itself
+
+        AppearanceModeTracker.apply_listener_changes()  # bound to the virtual event
+        self.assertEqual(AppearanceModeTracker.appearance_mode, 1)
+
+    def test_fallback_check_keeps_long_interval(self):
+        app = self.start_listener()
+        self.wait_for(lambda: len(AppearanceModeTracker.listener_queue) > 0)
+
+        AppearanceModeTracker.update()
+        self.assertEqual(AppearanceModeTracker.appearance_mode, 1)
+        self.assertEqual(app.intervals, [AppearanceModeTracker.listener_check_interval] * 2)
+
+    def test_ended_listener_falls_back_to_polling(self):
+        AppearanceModeTracker.listener_command = (sys.executable, "-c", "pass")
+        app = self.start_listener()
+        self.wait_for(lambda: not AppearanceModeTracker.listener_thread.is_alive())
+
+        AppearanceModeTracker.apply_listener_changes()
+        self.assertIsNone(AppearanceModeTracker.listener_thread)
+        self.assertEqual(app.intervals[-1], AppearanceModeTracker.update_loop_interval)
+        self.assertTrue(AppearanceModeTracker.update_loop_running)
+
+    def test_user_set_mode_stops_listener(self):
+        self.start_listener()
+        AppearanceModeTracker.set_appearance_mode("light")
+        self.assertListenerStopped()
+
+        AppearanceModeTracker.update()
+        self.assertFalse(AppearanceModeTracker.update_loop_running)
+
+    def test_last_destroyed_app_stops_listener(self):
+        app = self.start_listener()
+        AppearanceModeTracker.remove_app(app)
+        self.assertListenerStopped()
+
+
+if __name__ == "__main__":
+    unittest.main()
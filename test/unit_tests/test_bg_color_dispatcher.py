@@ -0,0 +1,69 @@
+import gc
+import unittest
+
+from customtkinter.bg_color_dispatcher import BgColorDispatcher
+
+
+class FakeMaster:
+    """ tkinter master stand-in, records the options passed to configure """
+
+    def __init__(self):
+        self.options = {}
+
+    def configure(self, cnf=None, **kwargs):
+        self.options.update(cnf or {}, **kwargs)
+
+
+class FakeChild:
+    def __init__(self):
+        self.bg_colors = []
+
+    def configure(self, bg_color=None):
+        self.bg_colors.append(bg_color)
+
+
+class TestBgColorDispatcher(unittest.TestCase):
+    def setUp(self):
+        self.master = FakeMaster()
+        self.children = [FakeChild() for _ in range(3)]
+        for child in self.children:
+            BgColorDispatcher.add_child(self.master, child)
+
+    def test_dispatch_once_per_child(self):
+        BgColorDispatcher.add_child(self.master, self.children[0])  # added twice, still dispatched once
+        BgColorDispatcher.dispatch_bg_color(self.master, "#101010")
+
+        self.assertEqual([child.bg_colors for child in self.children], [["#101010"]] * 3)
+
+    def test_remove_child(self):
+        BgColorDispatcher.remove_child(self.master, self.children[1])
+        BgColorDispatcher.remove_child(FakeMaster(), self.children[0])  # unknown master is ignored
+        BgColorDispatcher.dispatch_bg_color(self.master, "red")
+
+        self.assertEqual([child.bg_colors for child in self.children], [["red"], [], ["red"]])
+
+    def test_registry_does_not_keep_children_and_masters_alive(self):
+        del self.children[:2]
+        gc.collect()
+        self.assertEqual(len(BgColorDispatcher.get_children(self.master)), 1)
+
+        master_count = len(BgColorDispatcher.master_children_dict)
+        del self.master
+        gc.collect()
+        self.assertEqual(len(BgColorDispatcher.master_children_dict), master_count - 1)
+
+    def test_hooked_master_configure(self):
+        BgColorDispatcher.hook_master_configure(self.master)
+        BgColorDispatcher.hook_master_configure(self.master)  # hooked only once
+
+        self.master.configure(bg="red")
+        self.master.config(background="blue")
+        self.master.configure({"bg": "green"})
+        self.master.configure(width=10)
+
+        self.assertEqual(self.master.options, {"bg": "green", "background": "blue", "width": 10})
+        self.assertEqual([child.bg_colors for child in self.children], [["red", "blue", "green"]] * 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import tkinter
+import unittest
+
+from customtkinter.widgets.ctk_button import CTkButton
+
+
+class TestButtonContentSize(unittest.TestCase):
+    """ the button grows with its content in both rendering modes, labels in a content frame or canvas items """
+
+    @classmethod
+    def setUpClass(cls):
+        try:
+            cls.root = tkinter.Tk()
+        except tkinter.TclError:
+            raise unittest.SkipTest("no display available")
+        cls.root.withdraw()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.root.destroy()
+
+    def setUp(self):
+        self.buttons = []
+
+    def tearDown(self):
+        for button in self.buttons:
+            button.destroy()
+
+    def requested_size(self, canvas_text_rendering: bool, **kwargs):
+        button = CTkButton(self.root, width=60, height=28, canvas_text_rendering=canvas_text_rendering, **kwargs)
+        self.buttons.append(button)
+        button.pack()
+        button.draw()  # the root is withdrawn, so the initial draw on <Map> doesn't happen
+        self.root.update_idletasks()
+        return button, button.winfo_reqwidth(), button.winfo_reqheight()
+
+    def test_small_content_keeps_desired_size(self):
+        for canvas_text_rendering in (False, True):
+            with self.subTest(canvas_text_rendering=canvas_text_rendering):
+                button, width, height = self.requested_size(canvas_text_rendering, text="a", text_font=("Arial", 8))
+                self.assertEqual((width, height), (round(button.apply_widget_scaling(60)), round(button.apply_widget_scaling(28))))
+
+    def test_long_text(self):
+        for canvas_text_rendering in (False, True):
+            with self.subTest(canvas_text_rendering=canvas_text_rendering):
+                text = "long button text " * 5
+                button, width, height = self.requested_size(canvas_text_rendering, text=text)
+
+                text_width = self.root.tk.call("font", "measure", button.apply_font_scaling(button.text_font), text)
+                self.assertGreaterEqual(width, text_width + 2 * button.apply_widget_scaling(button.corner_radius))
+
+    def test_big_image(self):
+        image = tkinter.PhotoImage(master=self.root, width=120, height=80)
+
+        for canvas_text_rendering in (False, True):
+            with self.subTest(canvas_text_rendering=canvas_text_rendering):
+                button, width, height = self.requested_size(canvas_text_rendering, text="", image=image)
+                self.assertGreaterEqual(width, 120)
+                self.assertGreaterEqual(height, 80)
+
+    def test_canvas_shrinks_with_content(self):
+        button, width, height = self.requested_size(True, text="long button text " * 5)
+        button.configure(text="a", text_font=("Arial", 8))
+        button.draw()
+        self.root.update_idletasks()
+
+        self.assertEqual(button.winfo_reqwidth(), round(button.apply_widget_scaling(60)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,207 @@
+import tkinter
+import unittest
+
+from customtkinter.widgets.ctk_canvas import CTkCanvas, _tcl_quote, _flatten_args
+
+
+class TestTclQuote(unittest.TestCase):
+    """ the quoted words must be parsed back by tcl to the original values, needs no display """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tcl = tkinter.Tcl()
+
+    def assertRoundTrip(self, value):
+        self.assertEqual(self.tcl.eval(f"set value {_tcl_quote(value)}"), value)
+
+    def test_plain_words(self):
+        for value in ("border_parts", "12", "-fill", "#1F6AA5", "0.5"):
+            self.assertEqual(_tcl_quote(value), value)
+
+    def test_special_characters(self):
+        for value in ("two words", "a;b", "$var", "[cmd]", "{brace", "brace}", "\"quoted\"", "back\\slash",
+                      "new\nline", "tab\tbed", "(tag)&&!other", ""):
+            self.assertRoundTrip(value)
+
+    def test_numbers(self):
+        self.assertEqual(self.tcl.eval(f"expr {{{_tcl_quote(2.5)} * 2}}"), "5.0")
+        self.assertEqual(_tcl_quote(-3), "-3")
+
+    def test_sequences_become_tcl_lists(self):
+        value = ("inner_parts", "two words", "", "x{y")
+        self.assertEqual(self.tcl.splitlist(self.tcl.eval(f"set value {_tcl_quote(value)}")), value)
+
+    def test_flatten_args(self):
+        self.assertEqual(_flatten_args(((0, 0), [1, (2, None)], None, {"a": 1})), (0, 0, 1, 2, {"a": 1}))
+
+
+class CanvasTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        try:
+            cls.root = tkinter.Tk()
+        except tkinter.TclError:
+            raise unittest.SkipTest("no display available")
+        cls.root.withdraw()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.root.destroy()
+
+    def setUp(self):
+        self.canvas = CTkCanvas(self.root)
+
+    def tearDown(self):
+        self.canvas.destroy()
+
+    def assertIndexMatchesTcl(self):
+        """ the python-side tag index has to match the tags tcl knows for every item """
+
+        all_ids = tkinter.Canvas.find_all(self.canvas)
+        self.assertEqual(sorted(self.canvas._id_to_tags), sorted(all_ids))
+        for item_id in all_ids:
+            self.assertEqual(self.canvas._id_to_tags[item_id], set(tkinter.Canvas.gettags(self.canvas, item_id)))
+        for tag, tag_ids in self.canvas._tag_to_ids.items():
+            self.assertEqual(sorted(tag_ids), sorted(tkinter.Canvas.find_withtag(self.canvas, tag)))
+
+
+class TestTagIndex(CanvasTestCase):
+    def test_create(self):
+        rect = self.canvas.create_rectangle(0, 0, 10, 10, tags=("border_parts", "border_rectangle_1"))
+        self.canvas.create_polygon((0, 0, 5, 5, 0, 5), tags="inner_parts")
+        self.canvas.create_aa_circle(5, 5, 3, tags="inner_parts")
+
+        self.assertEqual(self.canvas.find_withtag("border_parts"), (rect,))
+        self.assertIndexMatchesTcl()
+
+    def test_delete(self):
+        self.canvas.create_rectangle(0, 0, 10, 10, tags=("border_parts", "shared"))
+        inner = self.canvas.create_rectangle(0, 0, 10, 10, tags=("inner_parts", "shared"))
+        self.canvas.delete("border_parts")
+
+        self.assertNotIn("border_parts", self.canvas._tag_to_ids)
+        self.assertEqual(self.canvas._find_ids("shared"), (inner,))
+        self.assertIndexMatchesTcl()
+
+        self.canvas.delete(inner)
+        self.assertEqual(self.canvas._find_ids("all"), ())
+        self.assertIndexMatchesTcl()
+
+    def test_addtag_and_dtag(self):
+        rect_1 = self.canvas.create_rectangle(0, 0, 10, 10, tags="a")
+        rect_2 = self.canvas.create_rectangle(0, 0, 10, 10, tags="b")
+
+        self.canvas.addtag_withtag("group", "a")
+        self.canvas.addtag_all("everything")
+        self.assertEqual(self.canvas._find_ids("group"), (rect_1,))
+        self.assertEqual(self.canvas._find_ids("everything"), (rect_1, rect_2))
+        self.assertIndexMatchesTcl()
+
+        self.canvas.dtag("everything", "everything")
+        self.canvas.dtag(rect_1, "a")
+        self.assertEqual(self.canvas._find_ids("a"), ())
+        self.assertEqual(self.canvas._find_ids("everything"), ())
+        self.assertIndexMatchesTcl()
+
+    def test_itemconfigure_tags(self):
+        rect_1 = self.canvas.create_rectangle(0, 0, 10, 10, tags="a")
+        rect_2 = self.canvas.create_rectangle(0, 0, 10, 10, tags="a")
+
+        self.canvas.itemconfigure(rect_1, tags=("b", "c"))
+        self.canvas.itemconfig(rect_2, {"tags": "c d"}, fill="red")
+        self.assertEqual(self.canvas._find_ids("a"), ())
+        self.assertEqual(self.canvas._find_ids("c"), (rect_1, rect_2))
+        self.assertIndexMatchesTcl()
+
+    def test_tags_set_by_raw_tkinter_calls(self):
+        rect = self.canvas.create_rectangle(0, 0, 10, 10, tags="a")
+        tkinter.Canvas.itemconfigure(self.canvas, rect, tags=("a", "raw"))  # bypasses the index
+
+        self.canvas.itemconfig("raw", fill="red")
+        self.canvas.coords("raw", 0, 0, 30, 30)
+        self.assertEqual(self.canvas.itemcget(rect, "fill"), "red")
+        self.assertEqual(self.canvas.coords(rect), [0.0, 0.0, 30.0, 30.0])
+        self.assertIndexMatchesTcl()
+
+    def test_complex_tag_expression(self):
+        rect_1 = self.canvas.create_rectangle(0, 0, 10, 10, tags=("a", "b"))
+        self.canvas.create_rectangle(0, 0, 10, 10, tags="a")
+        self.assertEqual(self.canvas._find_ids("a&&b"), (rect_1,))
+
+
+class TestItemCache(CanvasTestCase):
+    def test_unchanged_coords_and_options_are_dropped(self):
+        rect = self.canvas.create_rectangle(0, 0, 10, 10, tags="rect")
+        self.canvas.coords("rect", 0, 0, 20, 20)
+        self.canvas.itemconfig("rect", fill="red")
+        suppressed_calls_count = self.canvas.suppressed_calls_count
+
+        self.canvas.coords("rect", 0, 0, 20, 20)
+        self.canvas.itemconfig("rect", fill="red")
+        self.assertEqual(self.canvas.suppressed_calls_count, suppressed_calls_count + 2)
+        self.assertEqual(self.canvas.coords(rect), [0.0, 0.0, 20.0, 20.0])
+
+    def test_move_and_scale_invalidate_coords(self):
+        rect = self.canvas.create_rectangle(0, 0, 10, 10, tags="rect")
+        self.canvas.coords("rect", 0, 0, 20, 20)
+
+        self.canvas.move("rect", 5, 5)
+        self.canvas.coords("rect", 0, 0, 20, 20)  # must not be dropped, the item was moved
+        self.assertEqual(self.canvas.coords(rect), [0.0, 0.0, 20.0, 20.0])
+
+        self.canvas.scale("rect", 0, 0, 2, 2)
+        self.canvas.coords("rect", 0, 0, 20, 20)
+        self.assertEqual(self.canvas.coords(rect), [0.0, 0.0, 20.0, 20.0])
+
+    def test_direct_itemconfigure_invalidates_options(self):
+        rect = self.canvas.create_rectangle(0, 0, 10, 10, tags="rect")
+        self.canvas.itemconfig("rect", fill="red")
+
+        self.canvas.itemconfigure(rect, fill="blue")
+        self.canvas.itemconfig("rect", fill="red")  # must not be dropped
+        self.assertEqual(self.canvas.itemcget(rect, "fill"), "red")
+
+
+class TestTclBatch(CanvasTestCase):
+    def test_batch(self):
+        with self.canvas.tcl_batch():
+            placeholder = self.canvas.create_rectangle(0, 0, 10, 10, tags=("border_parts", "two words"))
+            self.canvas.coords(placeholder, 0, 0, 30, 30)
+            self.canvas.itemconfig("border_parts", fill="red")
+            self.assertLess(placeholder, 0)
+
+        rect = self.canvas.resolve_item_id(placeholder)
+        self.assertEqual(self.canvas.coords(rect), [0.0, 0.0, 30.0, 30.0])
+        self.assertEqual(self.canvas.itemcget(rect, "fill"), "red")
+        self.assertIndexMatchesTcl()
+
+    def test_placeholder_after_mid_batch_flush(self):
+        with self.canvas.tcl_batch():
+            placeholder_1 = self.canvas.create_rectangle(0, 0, 10, 10, tags="a")
+            self.canvas.find_withtag("current")  # executes the collected commands in the middle of the batch
+            placeholder_2 = self.canvas.create_rectangle(0, 0, 10, 10, tags="b")
+            self.canvas.coords(placeholder_1, 0, 0, 40, 40)
+            self.canvas.itemconfig(placeholder_1, fill="red")
+            self.canvas.tag_raise(placeholder_1, placeholder_2)
+
+        rect_1 = self.canvas.resolve_item_id(placeholder_1)
+        rect_2 = self.canvas.resolve_item_id(placeholder_2)
+        self.assertGreater(rect_1, 0)
+        self.assertGreater(rect_2, 0)
+        self.assertEqual(self.canvas.coords(rect_1), [0.0, 0.0, 40.0, 40.0])
+        self.assertEqual(self.canvas.itemcget(rect_1, "fill"), "red")
+        self.assertEqual(tkinter.Canvas.find_all(self.canvas), (rect_2, rect_1))
+        self.assertIndexMatchesTcl()
+
+    def test_delete_placeholder_after_mid_batch_flush(self):
+        with self.canvas.tcl_batch():
+            placeholder = self.canvas.create_rectangle(0, 0, 10, 10, tags="a")
+            self.canvas.find_withtag("a||b")
+            self.canvas.delete(placeholder)
+
+        self.assertEqual(tkinter.Canvas.find_all(self.canvas), ())
+        self.assertIndexMatchesTcl()
+
+
+if __name__ == "__main__":
+    unittest.main()
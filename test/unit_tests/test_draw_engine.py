@@ -0,0 +1,139 @@
+import unittest
+from contextlib import contextmanager
+
+from customtkinter.draw_engine import DrawEngine
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class RecordingCanvas:
+    """ records the canvas commands of a DrawEngine, needs no tk interpreter """
+
+    def __init__(self):
+        self.calls = []
+        self.tags = set()
+
+    @contextmanager
+    def tcl_batch(self, enabled=True):
+        yield
+
+    def find_withtag(self, tag):
+        return (1,) if tag in self.tags else ()
+
+    def create_polygon(self, *args, tags=(), **kwargs):
+        self.tags.update(tags)
+        self.calls.append("create_polygon")
+
+    def __getattr__(self, name):
+        def record(*args, **kwargs):
+            self.calls.append(name)
+        return record
+
+
+class TestDrawSignature(unittest.TestCase):
+    def setUp(self):
+        self.preferred_drawing_method = DrawEngine.preferred_drawing_method
+        DrawEngine.preferred_drawing_method = "polygon_shapes"
+        self.canvas = RecordingCanvas()
+        self.draw_engine = DrawEngine(self.canvas)
+
+    def tearDown(self):
+        DrawEngine.preferred_drawing_method = self.preferred_drawing_method
+
+    def test_unchanged_draw_is_skipped(self):
+        self.assertTrue(self.draw_engine.draw_rounded_rect_with_border(140, 28, 6, 2))
+        self.assertIn("coords", self.canvas.calls)
+
+        self.canvas.calls.clear()
+        self.assertFalse(self.draw_engine.draw_rounded_rect_with_border(140, 28, 6, 2))
+        self.assertEqual(self.canvas.calls, [])
+
+    def test_values_rounding_to_the_same_geometry_are_skipped(self):
+        self.draw_engine.draw_rounded_rect_with_border(140, 28, 6, 2)
+
+        self.canvas.calls.clear()
+        self.draw_engine.draw_rounded_rect_with_border(141, 28.4, 6.2, 2)  # width and height get floored to even values
+        self.assertEqual(self.canvas.calls, [])
+
+    def test_changed_geometry_is_drawn(self):
+        self.draw_engine.draw_rounded_rect_with_border(140, 28, 6, 2)
+
+        self.canvas.calls.clear()
+        self.draw_engine.draw_rounded_rect_with_border(200, 28, 6, 2)
+        self.assertIn("coords", self.canvas.calls)
+        self.assertNotIn("create_polygon", self.canvas.calls)  # the parts already exist
+
+    def test_changed_drawing_method_is_drawn(self):
+        self.draw_engine.draw_rounded_rect_with_border(140, 28, 6, 2)
+
+        self.canvas.calls.clear()
+        self.draw_engine.draw_rounded_rect_with_border(140, 28, 6, 2, overwrite_preferred_drawing_method="circle_shapes")
+        self.assertNotEqual(self.canvas.calls, [])
+
+    def test_reset_draw_signatures(self):
+        self.draw_engine.draw_rounded_rect_with_border(140, 28, 6, 2)
+        self.draw_engine.reset_draw_signatures()
+
+        self.canvas.calls.clear()
+        self.draw_engine.draw_rounded_rect_with_border(140, 28, 6, 2)
+        self.assertIn("coords", self.canvas.calls)
+
+    def test_signatures_are_per_shape_function(self):
+        self.draw_engine.draw_rounded_rect_with_border(140, 28, 6, 2)
+
+        self.canvas.calls.clear()
+        self.draw_engine.draw_rounded_progress_bar_with_border(140, 28, 6, 2, 0, 0.5, "w")
+        self.assertNotEqual(self.canvas.calls, [])
+
+
+class TestComputeLayouts(unittest.TestCase):
+    specs = [(width, height, corner_radius, border_width, drawing_method)
+             for drawing_method in ("polygon_shapes", "font_shapes", "circle_shapes", "image_shapes")
+             for width, height in ((140, 28), (141.5, 29.2), (30, 30), (8, 100))
+             for corner_radius in (0, 2.5, 6, 6.5, 50)
+             for border_width in (0, 1.4, 2, 8)]
+
+    def setUp(self):
+        self.numpy_min_batch_size = DrawEngine.numpy_min_batch_size
+
+    def tearDown(self):
+        DrawEngine.numpy_min_batch_size = self.numpy_min_batch_size
+
+    def assertLayoutsEqual(self, layouts, expected_layouts):
+        for layout, expected_layout in zip(layouts, expected_layouts):
+            self.assertEqual(layout.keys(), expected_layout.keys())
+            for key in ("drawing_method", "width", "height", "corner_radius", "border_width", "inner_corner_radius"):
+                self.assertEqual(layout[key], expected_layout[key], key)
+            self.assertEqual(layout["part_coords"].keys(), expected_layout["part_coords"].keys())
+            for tag, coords in layout["part_coords"].items():
+                self.assertEqual(len(coords), len(expected_layout["part_coords"][tag]), tag)
+                for coord, expected_coord in zip(coords, expected_layout["part_coords"][tag]):
+                    self.assertAlmostEqual(coord, expected_coord, places=9, msg=tag)
+
+    @unittest.skipIf(numpy is None, "numpy not installed")
+    def test_numpy_and_pure_python_layouts_are_equal(self):
+        DrawEngine.numpy_min_batch_size = 1
+        numpy_layouts = DrawEngine.compute_layouts(self.specs)
+        DrawEngine.numpy_min_batch_size = len(self.specs) + 1
+        python_layouts = DrawEngine.compute_layouts(self.specs)
+
+        self.assertLayoutsEqual(numpy_layouts, python_layouts)
+
+    def test_equal_specs_share_one_layout(self):
+        layouts = DrawEngine.compute_layouts([(140, 28, 6, 2, "polygon_shapes")] * 3 + [(140, 28, 6, 2, "font_shapes")])
+        self.assertIs(layouts[0], layouts[2])
+        self.assertIsNot(layouts[0], layouts[3])
+
+    def test_draw_from_layout_equals_draw(self):
+        canvas, layout_canvas = RecordingCanvas(), RecordingCanvas()
+        DrawEngine(canvas).draw_rounded_rect_with_border(141, 28.4, 6.2, 2, overwrite_preferred_drawing_method="polygon_shapes")
+        DrawEngine(layout_canvas).draw_rounded_rect_with_border_from_layout(DrawEngine.compute_layouts([(141, 28.4, 6.2, 2, "polygon_shapes")])[0])
+
+        self.assertEqual(layout_canvas.calls, canvas.calls)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import os
+import tempfile
+import tkinter
+import unittest
+
+from customtkinter.draw_engine import DrawEngine
+from customtkinter.drawing_method_calibrator import DrawingMethodCalibrator
+
+
+class FakeTk:
+    def call(self, *args):
+        return "8.6.12"
+
+
+class FakeRoot:
+    """ records the scheduled callbacks instead of running a tk mainloop """
+
+    def __init__(self):
+        self.tk = FakeTk()
+        self.scheduled = []
+
+    def winfo_server(self):
+        return "X11R0"
+
+    def after(self, *args):
+        self.scheduled.append(args)
+
+    def after_idle(self, *args):
+        self.scheduled.append(args)
+
+
+class TestDrawingMethodCalibrator(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.saved_state = (DrawingMethodCalibrator.cache_file_path, DrawingMethodCalibrator.calibrated,
+                            DrawEngine.preferred_drawing_method, DrawEngine.shapes_font_available)
+        DrawingMethodCalibrator.cache_file_path = os.path.join(self.temp_dir.name, "drawing_method_cache.json")
+        DrawingMethodCalibrator.calibration_scheduled = False
+        DrawEngine.shapes_font_available = True
+        DrawEngine.preferred_drawing_method = "font_shapes"
+        self.root = FakeRoot()
+
+    def tearDown(self):
+        (DrawingMethodCalibrator.cache_file_path, DrawingMethodCalibrator.calibrated,
+         DrawEngine.preferred_drawing_method, DrawEngine.shapes_font_available) = self.saved_state
+        DrawingMethodCalibrator.calibration_scheduled = False
+        self.temp_dir.cleanup()
+
+    def test_only_selectable_methods_are_timed(self):
+        self.assertEqual(DrawingMethodCalibrator.get_available_methods(), ["font_shapes", "polygon_shapes"])
+        DrawEngine.shapes_font_available = False
+        self.assertEqual(DrawingMethodCalibrator.get_available_methods(), ["polygon_shapes"])
+
+    def test_cache_miss_schedules_calibration_after_first_frame(self):
+        DrawingMethodCalibrator.apply_cached_method(self.root)
+
+        self.assertEqual(len(self.root.scheduled), 1)
+        self.assertEqual(DrawEngine.preferred_drawing_method, "font_shapes")
+
+    def test_cached_method_is_applied(self):
+        cache_key = DrawingMethodCalibrator.get_cache_key(self.root)
+        DrawingMethodCalibrator.save_cache({cache_key: {"method": "polygon_shapes", "timings": {}}})
+        DrawingMethodCalibrator.apply_cached_method(self.root)
+
+        self.assertEqual(self.root.scheduled, [])
+        self.assertEqual(DrawEngine.preferred_drawing_method, "polygon_shapes")
+
+    def test_single_available_method_is_not_timed(self):
+        DrawEngine.shapes_font_available = False
+        DrawingMethodCalibrator.apply_cached_method(self.root)
+        self.assertEqual(self.root.scheduled, [])
+
+
+class TestTimeDrawingMethod(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        try:
+            cls.root = tkinter.Tk()
+        except tkinter.TclError:
+            raise unittest.SkipTest("no display available")
+        cls.root.withdraw()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.root.destroy()
+
+    def test_timing_window_gets_destroyed(self):
+        self.assertGreater(DrawingMethodCalibrator.time_drawing_method(self.root, "polygon_shapes"), 0)
+        self.assertEqual(self.root.winfo_children(), [])
+
+    def test_timing_window_gets_destroyed_after_error(self):
+        calibration_shapes = DrawingMethodCalibrator.calibration_shapes
+        DrawingMethodCalibrator.calibration_shapes = (("invalid", 28, 6, 0),)
+        try:
+            with self.assertRaises(TypeError):
+                DrawingMethodCalibrator.time_drawing_method(self.root, "polygon_shapes")
+        finally:
+            DrawingMethodCalibrator.calibration_shapes = calibration_shapes
+        self.assertEqual(self.root.winfo_children(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
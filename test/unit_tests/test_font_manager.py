@@ -0,0 +1,67 @@
+import tkinter
+import unittest
+
+from customtkinter.font_manager import FontManager
+
+
+class TestFontTupleToOptions(unittest.TestCase):
+    def test_family_and_size(self):
+        self.assertEqual(FontManager.font_tuple_to_options(("Roboto", -13)), {"family": "Roboto", "size": -13})
+        self.assertEqual(FontManager.font_tuple_to_options(("Roboto", 12.5)), {"family": "Roboto", "size": 12.5})
+
+    def test_styles(self):
+        self.assertEqual(FontManager.font_tuple_to_options(("Roboto", -13, "bold italic", "underline")),
+                         {"family": "Roboto", "size": -13, "weight": "bold", "slant": "italic", "underline": True})
+        self.assertEqual(FontManager.font_tuple_to_options(("Roboto", -13, "normal roman overstrike")),
+                         {"family": "Roboto", "size": -13, "weight": "normal", "slant": "roman", "overstrike": True})
+
+    def test_unsupported_tuples(self):
+        for font in (("Roboto",), (-13, "Roboto"), ("Roboto", "13"), ("Roboto", -13, "wide"), ("Roboto", -13, 5)):
+            self.assertIsNone(FontManager.font_tuple_to_options(font), font)
+
+
+class TestNamedFonts(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        try:
+            cls.root = tkinter.Tk()
+        except tkinter.TclError:
+            raise unittest.SkipTest("no display available")
+        cls.root.withdraw()
+
+    @classmethod
+    def tearDownClass(cls):
+        FontManager.remove_named_fonts(cls.root)
+        cls.root.destroy()
+
+    def setUp(self):
+        FontManager.remove_named_fonts(self.root)
+
+    def test_equal_tuples_share_one_named_font(self):
+        font = FontManager.get_named_font(self.root, ("Roboto", -13), 1)
+        self.assertIs(FontManager.get_named_font(self.root, ["Roboto", -13], 1), font)
+        self.assertIsNot(FontManager.get_named_font(self.root, ("Roboto", -13, "bold"), 1), font)
+        self.assertEqual(font.cget("size"), -13)
+
+    def test_scaling_configures_the_shared_font(self):
+        font = FontManager.get_named_font(self.root, ("Roboto", -13), 1)
+        FontManager.update_named_fonts(self.root, 2)
+        self.assertEqual(font.cget("size"), -26)
+        self.assertIs(FontManager.get_named_font(self.root, ("Roboto", -13), 2), font)
+
+    def test_point_sizes_are_not_shared(self):
+        self.assertIsNone(FontManager.get_named_font(self.root, ("Roboto", 13), 1))
+        self.assertIsNone(FontManager.get_named_font(self.root, ("Roboto", -13, "wide"), 1))
+
+    def test_fonts_are_per_window(self):
+        toplevel = tkinter.Toplevel(self.root)
+        try:
+            self.assertIsNot(FontManager.get_named_font(toplevel, ("Roboto", -13), 1),
+                             FontManager.get_named_font(self.root, ("Roboto", -13), 1))
+        finally:
+            FontManager.remove_named_fonts(toplevel)
+            toplevel.destroy()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+import math
+import tkinter
+import unittest
+
+from customtkinter.image_shape_renderer import ImageShapeRenderer
+
+
+def apply_put_commands(commands: list, width: int, height: int) -> list:
+    """ executes the PhotoImage.put() arguments on a python pixel grid """
+
+    grid = [[None] * width for _ in range(height)]
+    for data, to in commands:
+        if len(to) == 4:
+            for pixel_y in range(to[1], to[3]):
+                for pixel_x in range(to[0], to[2]):
+                    grid[pixel_y][pixel_x] = data
+        else:
+            for row_index, row in enumerate(data[1:-1].split("} {")):
+                for column_index, color in enumerate(row.split(" ")):
+                    grid[to[1] + row_index][to[0] + column_index] = color
+    return grid
+
+
+def render_per_pixel(width: int, height: int, background_rgb: tuple, layers: list) -> list:
+    """ reference rendering, every pixel gets supersampled separately """
+
+    grid = []
+    for pixel_y in range(height):
+        row = []
+        for pixel_x in range(width):
+            r, g, b = background_rgb
+            for rect, (layer_r, layer_g, layer_b) in layers:
+                coverage = ImageShapeRenderer.pixel_coverage(pixel_x, pixel_y, rect)
+                r += (layer_r - r) * coverage
+                g += (layer_g - g) * coverage
+                b += (layer_b - b) * coverage
+            row.append((r, g, b))
+        grid.append(row)
+    return grid
+
+
+class TestImageShapeRenderer(unittest.TestCase):
+    layer_colors = ((31, 106, 165), (20, 72, 112), (47, 165, 114), (200, 10, 10))
+    max_channel_difference = 8  # straight edges use the exact overlap instead of 4x4 subsamples
+
+    def assertMatchesReference(self, shape_spec: tuple):
+        width, height = max(1, math.ceil(shape_spec[1])), max(1, math.ceil(shape_spec[2]))
+        layers = [(rect, self.layer_colors[i]) for i, (_, rect) in enumerate(ImageShapeRenderer.get_shape_layers(shape_spec))]
+
+        grid = apply_put_commands(ImageShapeRenderer.get_put_commands(width, height, (255, 255, 255), layers), width, height)
+        reference = render_per_pixel(width, height, (255, 255, 255), layers)
+
+        for pixel_y in range(height):
+            for pixel_x in range(width):
+                color = grid[pixel_y][pixel_x]
+                self.assertIsNotNone(color, f"pixel {pixel_x}, {pixel_y} of {shape_spec} not rendered")
+                rgb = (int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16))
+                for channel, reference_channel in zip(rgb, reference[pixel_y][pixel_x]):
+                    self.assertLessEqual(abs(channel - reference_channel), self.max_channel_difference,
+                                         f"pixel {pixel_x}, {pixel_y} of {shape_spec}")
+
+    def test_rounded_rect(self):
+        self.assertMatchesReference(("rounded_rect", 140, 28, 6, 2, 4))
+        self.assertMatchesReference(("rounded_rect", 60, 40, 10, 0, 10))
+
+    def test_fractional_and_small_shapes(self):
+        self.assertMatchesReference(("rounded_rect", 41, 29, 6.5, 1.5, 5))
+        self.assertMatchesReference(("rounded_rect", 8, 30, 6, 2, 4))
+        self.assertMatchesReference(("rounded_rect", 20, 20, 10, 0, 10))
+
+    def test_progress_bar_slider_and_scrollbar(self):
+        self.assertMatchesReference(("progress_bar", 100, 8, 4, 2, 2, 0, 0.37, "w"))
+        self.assertMatchesReference(("progress_bar", 8, 100, 4, 2, 2, 0.1, 0.77, "s"))
+        self.assertMatchesReference(("slider", 100, 16, 8, 6, 2, 0, 8, 0.4321, "w"))
+        self.assertMatchesReference(("scrollbar", 16, 100, 7, 5, 0.123, 0.6, "vertical"))
+
+    def test_large_shape_needs_few_put_calls(self):
+        layers = [(rect, self.layer_colors[i]) for i, (_, rect) in enumerate(ImageShapeRenderer.get_shape_layers(("rounded_rect", 600, 400, 10, 2, 8)))]
+        commands = ImageShapeRenderer.get_put_commands(600, 400, (255, 255, 255), layers)
+
+        self.assertLessEqual(len(commands), 20)
+        edge_pixel_count = sum(data.count("#") for data, to in commands if len(to) == 2)
+        self.assertLess(edge_pixel_count, 1000)  # only the corners, not the 240000 pixels of the image
+
+
+class TestQuantizeShapeSpec(unittest.TestCase):
+    def test_values_in_same_pixel_step_share_spec(self):
+        # progress range of 100 - 2 * 2 - 2 * 2 = 92 pixels
+        self.assertEqual(ImageShapeRenderer.quantize_shape_spec(("progress_bar", 100, 8, 4, 2, 2, 0, 0.5, "w")),
+                         ImageShapeRenderer.quantize_shape_spec(("progress_bar", 100, 8, 4, 2, 2, 0, 0.503, "w")))
+        self.assertNotEqual(ImageShapeRenderer.quantize_shape_spec(("progress_bar", 100, 8, 4, 2, 2, 0, 0.5, "w")),
+                            ImageShapeRenderer.quantize_shape_spec(("progress_bar", 100, 8, 4, 2, 2, 0, 0.52, "w")))
+
+        self.assertEqual(ImageShapeRenderer.quantize_shape_spec(("slider", 100, 16, 8, 6, 2, 0, 8, 0.4321, "w")),
+                         ImageShapeRenderer.quantize_shape_spec(("slider", 100, 16, 8, 6, 2, 0, 8, 0.4301, "w")))
+        self.assertEqual(ImageShapeRenderer.quantize_shape_spec(("scrollbar", 16, 100, 7, 5, 0.123, 0.6, "vertical")),
+                         ImageShapeRenderer.quantize_shape_spec(("scrollbar", 16, 100, 7, 5, 0.1231, 0.6001, "vertical")))
+
+    def test_quantized_position_within_half_pixel(self):
+        for value in (0, 0.1, 0.37, 0.5049, 0.999, 1):
+            spec = ImageShapeRenderer.quantize_shape_spec(("progress_bar", 8, 100, 4, 2, 2, 0, value, "s"))
+            self.assertLessEqual(abs(spec[7] - value) * 92, 0.5)
+            self.assertEqual(spec[:7] + spec[8:], ("progress_bar", 8, 100, 4, 2, 2, 0, "s"))
+
+    def test_other_shapes_unchanged(self):
+        self.assertEqual(ImageShapeRenderer.quantize_shape_spec(("rounded_rect", 41, 29, 6.5, 1.5, 5)), ("rounded_rect", 41, 29, 6.5, 1.5, 5))
+        self.assertEqual(ImageShapeRenderer.quantize_shape_spec(("progress_bar", 8, 8, 4, 2, 2, 0, 0.3, "w")),
+                         ("progress_bar", 8, 8, 4, 2, 2, 0, 0, "w"))  # no progress range
+
+
+class TestImageCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        try:
+            cls.root = tkinter.Tk()
+        except tkinter.TclError:
+            raise unittest.SkipTest("no display available")
+        cls.root.withdraw()
+        cls.canvas = tkinter.Canvas(cls.root)
+
+    @classmethod
+    def tearDownClass(cls):
+        ImageShapeRenderer.clear_cache()
+        cls.root.destroy()
+
+    def test_values_in_same_pixel_step_return_cached_image(self):
+        colors = {"border_parts": "#000001", "inner_parts": "#000002", "progress_parts": "#000003"}
+        image = ImageShapeRenderer.get_image(self.canvas, ("progress_bar", 100, 8, 4, 2, 2, 0, 0.5, "w"), colors)
+
+        self.assertIs(ImageShapeRenderer.get_image(self.canvas, ("progress_bar", 100, 8, 4, 2, 2, 0, 0.503, "w"), colors), image)
+        self.assertIsNot(ImageShapeRenderer.get_image(self.canvas, ("progress_bar", 100, 8, 4, 2, 2, 0, 0.52, "w"), colors), image)
+
+
+if __name__ == "__main__":
+    unittest.main()
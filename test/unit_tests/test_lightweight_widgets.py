@@ -0,0 +1,248 @@
+import tkinter
+import unittest
+from types import SimpleNamespace
+
+from customtkinter.widgets.ctk_canvas import CTkCanvas
+from customtkinter.widgets.ctk_canvas_item_group import CTkCanvasItemGroup
+from customtkinter.widgets.ctk_lightweight_canvas import CTkLightweightCanvas
+from customtkinter.widgets.ctk_lightweight_button import CTkLightweightButton
+from customtkinter.widgets.ctk_lightweight_checkbox import CTkLightweightCheckBox
+
+
+class TestItemGroupCoords(unittest.TestCase):
+    """ tag prefixing and coordinate shifting without canvas, needs no display """
+
+    def setUp(self):
+        self.group = CTkCanvasItemGroup(None, "group_1")
+        self.group.x, self.group.y = 10, 20
+
+    def test_tag_prefixing(self):
+        self.assertEqual(self.group._tag("inner_parts"), "group_1.inner_parts")
+        self.assertEqual(self.group._tag(42), 42)  # item ids are unique on the canvas and stay unchanged
+
+    def test_shift_coords(self):
+        self.assertEqual(self.group._shift_coords((0, 0, 5, 6)), (10, 20, 15, 26))
+        self.assertEqual(self.group._shift_coords(([1, 2, 3, 4],)), (11, 22, 13, 24))
+
+    def test_shift_coords_odd_count(self):
+        # (x, y, radius) of an aa circle, the radius is not shifted
+        self.assertEqual(self.group._shift_coords((1, 2, 3)), (11, 22, 3))
+
+
+class TkTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        try:
+            cls.root = tkinter.Tk()
+        except tkinter.TclError:
+            raise unittest.SkipTest("no display available")
+        cls.root.withdraw()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.root.destroy()
+
+
+class TestItemGroup(TkTestCase):
+    def setUp(self):
+        self.canvas = CTkCanvas(self.root, width=200, height=200)
+        self.group = CTkCanvasItemGroup(self.canvas, "group_1")
+        self.group.move_to(10, 20)
+
+    def tearDown(self):
+        self.canvas.destroy()
+
+    def test_create_prefixes_tags_and_shifts_coords(self):
+        item_id = self.group.create_rectangle(0, 0, 5, 5, tags=("inner_parts", "create_rectangle"))
+
+        self.assertEqual(self.canvas.gettags(item_id), ("group_1.inner_parts", "group_1.create_rectangle", "group_1"))
+        self.assertEqual(self.canvas.coords(item_id), [10, 20, 15, 25])
+        self.assertEqual(self.group.coords("inner_parts"), [0, 0, 5, 5])
+        self.assertEqual(self.group.find_withtag("inner_parts"), (item_id,))
+        self.assertEqual(self.canvas.find_withtag("inner_parts"), ())
+
+    def test_groups_do_not_interfere(self):
+        other_group = CTkCanvasItemGroup(self.canvas, "group_2")
+        item_id = self.group.create_line(0, 0, 5, 5, tags="checkmark")
+        other_id = other_group.create_line(0, 0, 5, 5, tags="checkmark")
+
+        self.assertEqual(self.group.find_withtag("checkmark"), (item_id,))
+        self.assertEqual(other_group.find_withtag("checkmark"), (other_id,))
+
+        self.group.delete_all()
+        self.assertEqual(self.group.find_withtag("checkmark"), ())
+        self.assertEqual(other_group.find_withtag("checkmark"), (other_id,))
+
+    def test_move_to_moves_existing_items(self):
+        item_id = self.group.create_rectangle(0, 0, 5, 5, tags="inner_parts")
+        self.group.move_to(30, 20)
+
+        self.assertEqual(self.canvas.coords(item_id), [30, 20, 35, 25])
+        self.assertEqual(self.group.coords("inner_parts"), [0, 0, 5, 5])
+
+        # new coords are shifted by the new position
+        self.group.coords("inner_parts", 1, 1, 2, 2)
+        self.assertEqual(self.canvas.coords(item_id), [31, 21, 32, 22])
+
+
+class LightweightTestCase(TkTestCase):
+    def setUp(self):
+        self.lightweight_canvas = CTkLightweightCanvas(self.root, width=400, height=300)
+        self.clicks = []
+
+    def tearDown(self):
+        self.lightweight_canvas.destroy()
+
+    def event_at(self, widget, dx=1, dy=1):
+        """ event with canvas coordinates dx, dy pixels inside of the top left corner of widget """
+        return SimpleNamespace(x=widget.item_group.x + dx, y=widget.item_group.y + dy)
+
+    def create_button(self, x, y, **kwargs):
+        button = CTkLightweightButton(self.lightweight_canvas, width=60, height=20, command=lambda: self.clicks.append(button), **kwargs)
+        button.place(x, y)
+        return button
+
+
+class TestPlaceAndHitTest(LightweightTestCase):
+    def test_place_moves_group(self):
+        button = self.create_button(10, 20)
+        self.assertEqual((button.item_group.x, button.item_group.y),
+                         (button.apply_spacing_scaling(10), button.apply_spacing_scaling(20)))
+        self.assertTrue(button.item_group.find_withtag("text"))
+
+    def test_contains(self):
+        button = self.create_button(10, 20)
+        x, y = button.item_group.x, button.item_group.y
+        width, height = button.apply_widget_scaling(60), button.apply_widget_scaling(20)
+
+        self.assertTrue(button.contains(x, y))
+        self.assertTrue(button.contains(x + width - 1, y + height - 1))
+        self.assertFalse(button.contains(x - 1, y))
+        self.assertFalse(button.contains(x + width, y))
+        self.assertFalse(button.contains(x, y + height))
+
+    def test_place_forget(self):
+        button = self.create_button(10, 20)
+        event = self.event_at(button)
+        button.place_forget()
+
+        self.assertFalse(button.contains(event.x, event.y))
+        self.assertEqual(button.item_group.find_withtag("text"), ())
+        self.assertIsNone(self.lightweight_canvas.lightweight_widget_at(event.x, event.y))
+
+        button.place(10, 20)
+        self.assertIs(self.lightweight_canvas.lightweight_widget_at(event.x, event.y), button)
+
+    def test_checkbox_text_is_clickable(self):
+        checkbox = CTkLightweightCheckBox(self.lightweight_canvas, text="some text")
+        checkbox.place(10, 20)
+
+        self.assertGreater(checkbox.text_width, 0)
+        self.assertTrue(checkbox.contains(checkbox.item_group.x + checkbox.apply_widget_scaling(24 + 6) + 1, checkbox.item_group.y + 1))
+
+    def test_lightweight_widget_at(self):
+        button_1 = self.create_button(10, 20)
+        button_2 = self.create_button(200, 20)
+
+        for button in (button_1, button_2):
+            event = self.event_at(button)
+            self.assertIs(self.lightweight_canvas.lightweight_widget_at(event.x, event.y), button)
+        self.assertIsNone(self.lightweight_canvas.lightweight_widget_at(button_2.item_group.x - 1, button_2.item_group.y))
+
+    def test_topmost_widget_wins(self):
+        button_1 = self.create_button(10, 20)
+        button_2 = self.create_button(20, 20)  # created later, so drawn on top of button_1
+        event = self.event_at(button_2)
+
+        self.assertIs(self.lightweight_canvas.lightweight_widget_at(event.x, event.y), button_2)
+
+
+class TestEventDispatch(LightweightTestCase):
+    def inner_color(self, button):
+        return self.canvas_itemcget(button, "inner_parts", "fill")
+
+    def canvas_itemcget(self, widget, tag, option):
+        return self.lightweight_canvas.canvas.itemcget(widget.item_group.find_withtag(tag)[0], option)
+
+    def test_hover_transitions(self):
+        button_1 = self.create_button(10, 20, fg_color="#000001", hover_color="#000002")
+        button_2 = self.create_button(200, 20, fg_color="#000001", hover_color="#000002")
+
+        self.lightweight_canvas._on_motion(self.event_at(button_1))
+        self.assertTrue(button_1.hovered)
+        self.assertEqual(self.inner_color(button_1), "#000002")
+
+        # moving inside of the widget keeps the hover state
+        self.lightweight_canvas._on_motion(self.event_at(button_1, dx=5))
+        self.assertTrue(button_1.hovered)
+
+        # moving directly to another widget leaves the first one
+        self.lightweight_canvas._on_motion(self.event_at(button_2))
+        self.assertFalse(button_1.hovered)
+        self.assertTrue(button_2.hovered)
+        self.assertEqual(self.inner_color(button_1), "#000001")
+        self.assertEqual(self.inner_color(button_2), "#000002")
+
+        # leaving the canvas leaves the hovered widget
+        self.lightweight_canvas._on_canvas_leave(SimpleNamespace(x=-1, y=-1))
+        self.assertFalse(button_2.hovered)
+        self.assertEqual(self.inner_color(button_2), "#000001")
+
+    def test_no_hover_when_disabled(self):
+        button = self.create_button(10, 20, fg_color="#000001", hover_color="#000002", state=tkinter.DISABLED)
+
+        self.lightweight_canvas._on_motion(self.event_at(button))
+        self.assertEqual(self.inner_color(button), "#000001")
+
+    def test_destroy_hovered_widget(self):
+        button = self.create_button(10, 20)
+        self.lightweight_canvas._on_motion(self.event_at(button))
+        button.destroy()
+
+        self.assertIsNone(self.lightweight_canvas._hovered_widget)
+        self.assertNotIn(button, self.lightweight_canvas.lightweight_widgets)
+
+    def test_click_dispatch(self):
+        button_1 = self.create_button(10, 20)
+        button_2 = self.create_button(200, 20)
+
+        self.lightweight_canvas._on_click(self.event_at(button_2))
+        self.lightweight_canvas._on_click(self.event_at(button_1))
+        self.lightweight_canvas._on_click(SimpleNamespace(x=150, y=250))  # no widget
+        self.assertEqual(self.clicks, [button_2, button_1])
+
+    def test_no_click_when_disabled(self):
+        button = self.create_button(10, 20)
+        button.configure(state=tkinter.DISABLED)
+
+        self.lightweight_canvas._on_click(self.event_at(button))
+        self.assertEqual(self.clicks, [])
+
+        button.configure(state=tkinter.NORMAL)
+        self.lightweight_canvas._on_click(self.event_at(button))
+        self.assertEqual(self.clicks, [button])
+
+    def test_checkbox_click(self):
+        checkbox = CTkLightweightCheckBox(self.lightweight_canvas, command=lambda: self.clicks.append(checkbox))
+        checkbox.place(10, 20)
+
+        self.lightweight_canvas._on_click(self.event_at(checkbox))
+        self.assertEqual(checkbox.get(), 1)
+        self.assertTrue(checkbox.item_group.find_withtag("checkmark"))
+
+        checkbox.configure(state=tkinter.DISABLED)
+        self.lightweight_canvas._on_click(self.event_at(checkbox))
+        self.assertEqual(checkbox.get(), 1)
+        self.assertEqual(self.clicks, [checkbox])
+
+    def test_checkbox_recolors_new_checkmark(self):
+        checkbox = CTkLightweightCheckBox(self.lightweight_canvas, checkmark_color="#000003")
+        checkbox.place(10, 20)
+        checkbox.check_state = True
+        checkbox.draw(no_color_updates=True)  # the new checkmark item requires recoloring anyway
+
+        self.assertEqual(self.canvas_itemcget(checkbox, "checkmark", "fill"), "#000003")
+
+
+if __name__ == "__main__":
+    unittest.main()
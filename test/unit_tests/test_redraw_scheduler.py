@@ -0,0 +1,188 @@
+import unittest
+
+from customtkinter.redraw_scheduler import RedrawScheduler
+from customtkinter.widgets.widget_base_class import CTkBaseClass
+
+
+class FakeRoot:
+    """ collects the scheduled idle calls, run_idle() executes them like the tk mainloop """
+
+    def __init__(self):
+        self.idle_calls = {}
+        self.after_count = 0
+
+    def after_idle(self, function, *args):
+        self.after_count += 1
+        after_id = f"after#{self.after_count}"
+        self.idle_calls[after_id] = (function, args)
+        return after_id
+
+    def after(self, ms, function, *args):
+        return self.after_idle(function, *args)
+
+    def after_cancel(self, after_id):
+        self.idle_calls.pop(after_id, None)
+
+    def run_idle(self):
+        idle_calls, self.idle_calls = self.idle_calls, {}
+        for function, args in idle_calls.values():
+            function(*args)
+
+
+class FakeWidget:
+    """ uses the scheduling methods of CTkBaseClass and records its draws """
+
+    schedule_draw = CTkBaseClass.schedule_draw
+    batch_update = CTkBaseClass.batch_update
+
+    def __init__(self, root: FakeRoot):
+        self._ctk_tk_root = root
+        self._initial_draw_pending = False
+        self._batch_update_depth = 0
+        self.draws = []
+
+    def winfo_exists(self):
+        return True
+
+    def draw(self, no_color_updates=False):
+        self.draws.append(no_color_updates)
+
+
+class RedrawSchedulerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.saved_state = (RedrawScheduler.enabled, RedrawScheduler.max_frame_rate)
+        RedrawScheduler.enabled = True
+        RedrawScheduler.max_frame_rate = None
+        RedrawScheduler.dirty_widgets = {}
+        RedrawScheduler.batch_widgets = {}
+        RedrawScheduler.batch_depth = 0
+        RedrawScheduler.flush_after_id = None
+        self.root = FakeRoot()
+
+    def tearDown(self):
+        RedrawScheduler.enabled, RedrawScheduler.max_frame_rate = self.saved_state
+        RedrawScheduler.dirty_widgets = {}
+        RedrawScheduler.batch_widgets = {}
+        RedrawScheduler.batch_depth = 0
+        RedrawScheduler.flush_after_id = None
+        RedrawScheduler.flush_root = None
+
+
+class TestCoalescing(RedrawSchedulerTestCase):
+    def test_draws_get_merged_until_idle(self):
+        widgets = [FakeWidget(self.root) for _ in range(3)]
+        for _ in range(5):
+            for widget in widgets:
+                widget.schedule_draw(no_color_updates=True)
+
+        self.assertEqual(len(self.root.idle_calls), 1)  # one flush for all widgets
+        self.assertTrue(all(widget.draws == [] for widget in widgets))
+
+        self.root.run_idle()
+        self.assertTrue(all(widget.draws == [True] for widget in widgets))
+        self.assertEqual(self.root.idle_calls, {})
+
+    def test_full_draw_wins_over_draw_without_color_updates(self):
+        widget = FakeWidget(self.root)
+        widget.schedule_draw(no_color_updates=True)
+        widget.schedule_draw(no_color_updates=False)
+        widget.schedule_draw(no_color_updates=True)
+
+        self.root.run_idle()
+        self.assertEqual(widget.draws, [False])
+
+    def test_widget_marked_while_drawing_gets_drawn_in_next_flush(self):
+        class RedrawingWidget(FakeWidget):
+            def draw(self, no_color_updates=False):
+                super().draw(no_color_updates)
+                if len(self.draws) == 1:
+                    self.schedule_draw()
+
+        widget = RedrawingWidget(self.root)
+        widget.schedule_draw()
+
+        self.root.run_idle()
+        self.assertEqual(len(widget.draws), 1)
+        self.root.run_idle()
+        self.assertEqual(len(widget.draws), 2)
+
+    def test_removed_widget_is_not_drawn(self):
+        widget = FakeWidget(self.root)
+        widget.schedule_draw()
+        RedrawScheduler.remove(widget)
+
+        self.root.run_idle()
+        self.assertEqual(widget.draws, [])
+
+    def test_initial_draw_pending_and_disabled(self):
+        widget = FakeWidget(self.root)
+        widget._initial_draw_pending = True
+        widget.schedule_draw()
+        self.assertEqual(RedrawScheduler.dirty_widgets, {})
+
+        widget._initial_draw_pending = False
+        RedrawScheduler.enabled = False
+        widget.schedule_draw(no_color_updates=True)
+        self.assertEqual(widget.draws, [True])  # immediately
+
+
+class TestBatch(RedrawSchedulerTestCase):
+    def test_nested_batches_draw_at_the_end_of_the_outermost(self):
+        widget = FakeWidget(self.root)
+        with RedrawScheduler.batch():
+            widget.schedule_draw(no_color_updates=True)
+            with RedrawScheduler.batch():
+                widget.schedule_draw(no_color_updates=True)
+            self.assertEqual(widget.draws, [])
+
+        self.assertEqual(widget.draws, [True])
+        self.assertEqual(RedrawScheduler.batch_depth, 0)
+
+    def test_batch_update_inside_batch(self):
+        widget = FakeWidget(self.root)
+        with RedrawScheduler.batch():
+            with widget.batch_update():
+                widget.schedule_draw()
+            widget.schedule_draw(no_color_updates=True)
+            self.assertEqual(widget.draws, [])
+
+        self.assertEqual(widget.draws, [False])
+
+    def test_batch_inside_batch_update(self):
+        widget, other_widget = FakeWidget(self.root), FakeWidget(self.root)
+        with widget.batch_update():
+            with RedrawScheduler.batch():
+                widget.schedule_draw()
+                other_widget.schedule_draw()
+            self.assertEqual(widget.draws, [])  # the batch_update() block of the widget is still open
+            self.assertEqual(other_widget.draws, [False])
+
+            with widget.batch_update():
+                widget.schedule_draw()
+            self.assertEqual(widget.draws, [])
+
+        self.assertEqual(widget.draws, [False])
+
+    def test_pending_idle_draw_gets_merged_into_batch(self):
+        widget = FakeWidget(self.root)
+        widget.schedule_draw()
+        with RedrawScheduler.batch():
+            widget.schedule_draw(no_color_updates=True)
+
+        self.assertEqual(widget.draws, [False])  # the full draw of the idle request wins
+        self.root.run_idle()
+        self.assertEqual(widget.draws, [False])
+
+    def test_batch_draws_after_exception(self):
+        widget = FakeWidget(self.root)
+        with self.assertRaises(ZeroDivisionError):
+            with RedrawScheduler.batch():
+                widget.schedule_draw()
+                1 / 0
+
+        self.assertEqual(widget.draws, [False])
+        self.assertEqual(RedrawScheduler.batch_depth, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import gc
+import tkinter
+import unittest
+
+from customtkinter.scaling_tracker import ScalingTracker
+
+
+class FakeWindow:
+    """ window root without tk interpreter, the cached root attribute ends the root lookup """
+
+    def __init__(self):
+        self._ctk_window_root = self
+
+
+class FakeWidget:
+    def __init__(self, window: FakeWindow):
+        self._ctk_window_root = window
+        self.scalings = []
+
+    def set_scaling(self, widget_scaling, spacing_scaling, window_scaling):
+        self.scalings.append((widget_scaling, spacing_scaling, window_scaling))
+
+
+class FakeTk(tkinter.Tk):
+    """ tkinter.Tk instance without tk interpreter, ends the uncached and the cached root lookup """
+
+    def __init__(self):
+        self._w = "."
+        self.master = None
+
+
+class FakeToplevel(tkinter.Toplevel):
+    def __init__(self, master):
+        self._w = f".toplevel{id(self)}"
+        self.master = master
+
+
+class FakeChild:
+    def __init__(self, master):
+        self.master = master
+
+
+def uncached_window_root(widget):
+    while not isinstance(widget, (tkinter.Tk, tkinter.Toplevel)):
+        widget = widget.master
+    return widget
+
+
+class TestWindowRootCache(unittest.TestCase):
+    def test_cached_lookup_matches_uncached_walk(self):
+        root = FakeTk()
+        toplevel = FakeToplevel(root)
+        frame = FakeChild(root)
+        toplevel_frame = FakeChild(toplevel)
+        widgets = [frame, FakeChild(frame), FakeChild(FakeChild(frame)), toplevel_frame,
+                   FakeChild(toplevel_frame), FakeChild(FakeChild(toplevel_frame)), FakeChild(toplevel)]
+
+        # deepest widgets first, so the later lookups hit the cache of their masters, then all again from the cache
+        for widget in list(reversed(widgets)) + widgets:
+            self.assertIs(ScalingTracker.get_window_root_of_widget(widget), uncached_window_root(widget))
+            self.assertIs(widget.__dict__.get("_ctk_window_root"), uncached_window_root(widget))  # cached on the widget
+
+        self.assertIs(ScalingTracker.get_window_root_of_widget(root), root)
+        self.assertIs(ScalingTracker.get_window_root_of_widget(toplevel), toplevel)
+
+
+class TestScalingTrackerRegistry(unittest.TestCase):
+    def setUp(self):
+        self.saved_state = (ScalingTracker.window_widgets_dict, ScalingTracker.window_dpi_scaling_dict,
+                            ScalingTracker.deactivate_automatic_dpi_awareness)
+        ScalingTracker.window_widgets_dict = {}
+        ScalingTracker.window_dpi_scaling_dict = {}
+        ScalingTracker.deactivate_automatic_dpi_awareness = True  # no platform specific DPI detection
+        self.window = FakeWindow()
+
+    def tearDown(self):
+        (ScalingTracker.window_widgets_dict, ScalingTracker.window_dpi_scaling_dict,
+         ScalingTracker.deactivate_automatic_dpi_awareness) = self.saved_state
+
+    def test_add_and_remove_widget(self):
+        widget = FakeWidget(self.window)
+        ScalingTracker.add_widget(widget.set_scaling, widget)
+        self.assertEqual(ScalingTracker.get_widget_counts(), {self.window: 1})
+
+        ScalingTracker.remove_widget(widget.set_scaling, widget)
+        self.assertEqual(ScalingTracker.get_widget_counts(), {self.window: 0})
+
+    def test_registry_does_not_keep_widgets_alive(self):
+        widgets = [FakeWidget(self.window) for _ in range(10)]
+        for widget in widgets:
+            ScalingTracker.add_widget(widget.set_scaling, widget)
+        self.assertEqual(ScalingTracker.get_widget_counts(), {self.window: 10})
+
+        del widget, widgets[:4]
+        gc.collect()
+        self.assertEqual(ScalingTracker.get_widget_counts(), {self.window: 6})
+
+        ScalingTracker.update_scaling_callbacks_for_window(self.window)
+        self.assertTrue(all(len(widget.scalings) == 1 for widget in widgets))
+
+    def test_set_window_dpi_scaling_updates_only_on_change(self):
+        ScalingTracker.deactivate_automatic_dpi_awareness = False
+        widget = FakeWidget(self.window)
+        ScalingTracker.add_widget(widget.set_scaling, widget)
+
+        ScalingTracker.set_window_dpi_scaling(self.window, 1.5)
+        ScalingTracker.set_window_dpi_scaling(self.window, 1.5)
+        self.assertEqual(len(widget.scalings), 1)
+        self.assertEqual(widget.scalings[0][0], 1.5 * ScalingTracker.widget_scaling)
+
+
+if __name__ == "__main__":
+    unittest.main()